@@ -23,13 +23,16 @@ from claude_world.app import GameLoop
 class GameRenderer:
     """Standalone game renderer that listens for Claude events."""
 
-    def __init__(self, width: int = 0, height: int = 0, fps: int = 30):
+    def __init__(self, width: int = 0, height: int = 0, fps: int = 30, render_scale: int = 1,
+                 async_output: bool = False):
         """Initialize the game renderer.
 
         Args:
             width: Renderer width (0 = auto-detect).
             height: Renderer height (0 = auto-detect).
             fps: Target frames per second.
+            render_scale: Draw at 1/render_scale size and let the terminal upscale.
+            async_output: Write frames from a background thread.
         """
         import shutil
         import time
@@ -49,7 +52,9 @@ class GameRenderer:
         # Create game components - let renderer auto-detect size from tmux
         self.state = create_tropical_island()
         self.engine = GameEngine(initial_state=self.state)
-        self.renderer = TerminalGraphicsRenderer(width=width, height=height)
+        self.renderer = TerminalGraphicsRenderer(
+            width=width, height=height, render_scale=render_scale, async_output=async_output
+        )
 
         # Use the renderer's detected size
         self.width = self.renderer.width
@@ -158,8 +163,7 @@ class GameRenderer:
 
                 if b'\x1b[O' in data:  # Focus out
                     self._has_focus = False
-                    sys.stdout.write("\033[2J\033[H")
-                    sys.stdout.flush()
+                    self.renderer.write_terminal("\033[2J\033[H")
                 elif b'\x1b[I' in data:  # Focus in
                     self._has_focus = True
                     self.renderer.force_clear()
@@ -259,6 +263,17 @@ def main():
         default=30,
         help="Target frames per second (default: 30)",
     )
+    parser.add_argument(
+        "--render-scale",
+        type=int,
+        default=1,
+        help="Draw at 1/N of the pane size and let the terminal upscale (default: 1)",
+    )
+    parser.add_argument(
+        "--async-output",
+        action="store_true",
+        help="Write frames to the terminal from a background thread",
+    )
 
     args = parser.parse_args()
 
@@ -266,6 +281,8 @@ def main():
         width=args.width,
         height=args.height,
         fps=args.fps,
+        render_scale=args.render_scale,
+        async_output=args.async_output,
     )
 
     asyncio.run(renderer.run())
@@ -5,8 +5,10 @@ from __future__ import annotations
 import base64
 import io
 import os
+import queue
 import shutil
 import sys
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -44,37 +46,43 @@ def detect_graphics_protocol() -> str:
         return "none"
 
 
-def display_kitty(frame: Image.Image, first_frame: bool) -> bool:
-    """Display using Kitty graphics protocol.
+_CLEAR_AND_HIDE_CURSOR = b"\033[2J\033[H\033[?25l"
+_CURSOR_HOME = b"\033[H"
 
-    Returns: new value for first_frame
-    """
-    if first_frame:
-        sys.stdout.write("\033[2J\033[H\033[?25l")
-    else:
-        sys.stdout.write("\033[H")
 
+def _png_bytes(frame: Image.Image) -> bytes:
+    """Encode a frame as PNG."""
     buf = io.BytesIO()
     try:
         frame.save(buf, format="PNG")
-        raw_data = buf.getvalue()
+        return buf.getvalue()
     finally:
         buf.close()
-        del buf
 
-    data = base64.b64encode(raw_data).decode("ascii")
-    del raw_data
+
+def display_kitty(frame: Image.Image, first_frame: bool) -> bool:
+    """Display using Kitty graphics protocol.
+
+    The base64 payload stays as bytes and the whole frame goes to
+    stdout's binary buffer in one write.
+
+    Returns: new value for first_frame
+    """
+    parts = [_CLEAR_AND_HIDE_CURSOR if first_frame else _CURSOR_HOME]
+
+    data = base64.b64encode(_png_bytes(frame))
 
     chunk_size = 4096
     for i in range(0, len(data), chunk_size):
-        chunk = data[i:i+chunk_size]
-        m = 1 if i + chunk_size < len(data) else 0
-        if i == 0:
-            sys.stdout.write(f"\033_Ga=T,f=100,m={m};{chunk}\033\\")
-        else:
-            sys.stdout.write(f"\033_Gm={m};{chunk}\033\\")
+        m = b"1" if i + chunk_size < len(data) else b"0"
+        parts.append(b"\033_Ga=T,f=100,m=" if i == 0 else b"\033_Gm=")
+        parts.append(m)
+        parts.append(b";")
+        parts.append(data[i:i + chunk_size])
+        parts.append(b"\033\\")
 
     del data
+    sys.stdout.buffer.write(b"".join(parts))
     sys.stdout.flush()
     return False
 
@@ -84,47 +92,41 @@ def display_iterm2(frame: Image.Image, width: int, height: int, first_frame: boo
 
     Returns: new value for first_frame
     """
-    if first_frame:
-        sys.stdout.write("\033[2J\033[H\033[?25l")
-    else:
-        sys.stdout.write("\033[H")
-
-    buf = io.BytesIO()
-    try:
-        frame.save(buf, format="PNG")
-        raw_data = buf.getvalue()
-    finally:
-        buf.close()
-        del buf
+    parts = [_CLEAR_AND_HIDE_CURSOR if first_frame else _CURSOR_HOME]
 
-    data = base64.b64encode(raw_data).decode("ascii")
-    del raw_data
+    data = base64.b64encode(_png_bytes(frame))
 
     if is_inside_tmux():
-        _display_iterm2_multipart(data, width, height)
+        _display_iterm2_multipart(parts, data, width, height)
     else:
-        img_seq = f"\033]1337;File=inline=1;width={width}px;height={height}px;preserveAspectRatio=0:{data}\007"
-        sys.stdout.write(img_seq)
-        del img_seq
+        parts.append(
+            f"\033]1337;File=inline=1;width={width}px;height={height}px;preserveAspectRatio=0:"
+            .encode("ascii")
+        )
+        parts.append(data)
+        parts.append(b"\007")
 
     del data
+    sys.stdout.buffer.write(b"".join(parts))
     sys.stdout.flush()
     return False
 
 
-def _display_iterm2_multipart(data: str, width: int, height: int) -> None:
-    """Display image using iTerm2 multipart protocol for tmux."""
+def _display_iterm2_multipart(parts: list[bytes], data: bytes, width: int, height: int) -> None:
+    """Append an image in the iTerm2 multipart protocol for tmux."""
     chunk_size = 65536
     start_seq = f"\033]1337;MultipartFile=inline=1;width={width}px;height={height}px;preserveAspectRatio=0\007"
-    sys.stdout.write(tmux_wrap(start_seq))
+    parts.append(tmux_wrap(start_seq).encode("ascii"))
 
+    # Base64 never contains ESC, so only the wrapper around each chunk needs escaping
+    part_prefix, part_suffix = tmux_wrap("\033]1337;FilePart=\0\007").encode("ascii").split(b"\0")
     for i in range(0, len(data), chunk_size):
-        chunk = data[i:i + chunk_size]
-        part_seq = f"\033]1337;FilePart={chunk}\007"
-        sys.stdout.write(tmux_wrap(part_seq))
+        parts.append(part_prefix)
+        parts.append(data[i:i + chunk_size])
+        parts.append(part_suffix)
 
     end_seq = "\033]1337;FileEnd\007"
-    sys.stdout.write(tmux_wrap(end_seq))
+    parts.append(tmux_wrap(end_seq).encode("ascii"))
 
 
 def display_sixel(frame: Image.Image, first_frame: bool) -> bool:
@@ -163,6 +165,125 @@ def display_sixel(frame: Image.Image, first_frame: bool) -> bool:
     return False
 
 
+class FrameBuffer:
+    """File-like sink that collects one frame's terminal output as bytes.
+
+    Supports both ``write(str)`` and ``buffer.write(bytes)`` so display code
+    can target it exactly like ``sys.stdout``.
+    """
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+
+    def write(self, data: str | bytes) -> int:
+        self._parts.append(data.encode("utf-8") if isinstance(data, str) else bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    @property
+    def buffer(self) -> FrameBuffer:
+        return self
+
+    def getvalue(self) -> bytes:
+        return b"".join(self._parts)
+
+
+class FrameWriter:
+    """Writes encoded frames to a file descriptor from a background thread.
+
+    The queue is bounded; when the terminal can't keep up, the oldest pending
+    frame is dropped so output never falls behind the renderer. Callers that
+    send frames as edits of the previous one must check ``take_dropped()`` and
+    resend in full after a drop. While the writer runs it owns the file
+    descriptor: other terminal output must go through ``write()``.
+    """
+
+    def __init__(self, fd: int | None = None, maxsize: int = 2):
+        self._fd = sys.stdout.fileno() if fd is None else fd
+        # (data, is_control) pairs; None stops the thread
+        self._queue: queue.Queue[tuple[bytes, bool] | None] = queue.Queue(maxsize=maxsize)
+        self._dropped = False
+        self._thread = threading.Thread(target=self._run, name="frame-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, data: bytes) -> None:
+        """Queue a frame for output, dropping the oldest one if full."""
+        self._put(data, False)
+
+    def write(self, data: bytes) -> None:
+        """Queue control output (escape sequences, text) in order with frames.
+
+        Unlike frames, control output is never dropped.
+        """
+        self._put(data, True)
+
+    def _put(self, data: bytes, control: bool) -> None:
+        while True:
+            try:
+                self._queue.put_nowait((data, control))
+                return
+            except queue.Full:
+                try:
+                    old_data, old_control = self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                if not old_control:
+                    self._dropped = True
+                    continue
+                # Keep the control output, and any queued behind it, by sending
+                # it ahead of this item; the frames in between are dropped
+                pending = [old_data]
+                while True:
+                    try:
+                        queued_data, queued_control = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if queued_control:
+                        pending.append(queued_data)
+                    else:
+                        self._dropped = True
+                data = b"".join(pending) + data
+                control = True
+
+    def take_dropped(self) -> bool:
+        """Return whether a frame was dropped or failed to write since the last call."""
+        dropped = self._dropped
+        self._dropped = False
+        return dropped
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Flush pending output and stop the writer thread."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            # The terminal is not draining output; give up on pending output
+            # rather than block exit
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            view = memoryview(item[0])
+            try:
+                while view:
+                    written = os.write(self._fd, view)
+                    view = view[written:]
+            except OSError:
+                # The rest of this output is lost and the terminal may hold a
+                # partial escape sequence; report it so the next frame is
+                # sent in full
+                self._dropped = True
+
+
 def clear_tmux_scrollback() -> None:
     """Clear tmux pane scrollback buffer to free terminal memory."""
     import subprocess
@@ -0,0 +1,160 @@
+"""Numeric kernels for per-frame animation math.
+
+Kernels are written against the NumPy subset that Numba understands. When
+Numba is installed they are compiled with ``cache=True`` so the machine code
+is written next to the module and reused on later runs (no JIT warm-up after
+the first launch). Without Numba they run as plain NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def wave_offsets(
+    start_y: int, end_y: int, step: int, phase: float, freq: float, amplitude: int
+) -> np.ndarray:
+    """Horizontal offsets of animated water rows.
+
+    Computes ``int(sin(phase + y * freq) * amplitude)`` for every row
+    ``y`` in ``range(start_y, end_y, step)``, truncating toward zero.
+    """
+    ys = np.arange(start_y, end_y, step)
+    return (np.sin(phase + ys * freq) * amplitude).astype(np.int64)
+
+
+@njit(cache=True)
+def thinking_sparkles(frame: int, x: int, y: int, px: int):
+    """Positions of the six sparkles orbiting the active thinking spot.
+
+    Returns:
+        (xs, ys, sizes, visible) arrays, one entry per sparkle.
+    """
+    i = np.arange(6)
+    angle = frame * 0.08 + i * np.pi / 3
+    dist = px * 6 + (np.sin(frame * 0.15 + i * 0.7) * px * 2).astype(np.int64)
+    xs = x + (np.cos(angle) * dist).astype(np.int64)
+    ys = y - px * 4 + (np.sin(angle) * dist * 0.4).astype(np.int64)
+    sizes = px + (np.abs(np.sin(frame * 0.1 + i)) * px).astype(np.int64)
+    visible = (frame + i * 5) % 20 < 15
+    return xs, ys, sizes, visible
+
+
+@njit(cache=True)
+def mailbox_sparkles(frame: int, x: int, y: int, px: int):
+    """Positions of the four sparkles circling the active mailbox.
+
+    Returns:
+        (xs, ys, visible) arrays, one entry per sparkle.
+    """
+    i = np.arange(4)
+    angle = frame * 0.1 + i * 1.5
+    xs = x + (np.cos(angle) * px * 6).astype(np.int64)
+    ys = y + (np.sin(angle) * px * 4).astype(np.int64)
+    visible = (frame + i * 6) % 15 < 10
+    return xs, ys, visible
+
+
+@njit(cache=True)
+def gear_spokes(rotation: float, cx: int, cy: int, inner: int, outer: int):
+    """Endpoints of the six spokes of the building gear.
+
+    Returns:
+        (x1, y1, x2, y2) arrays, one entry per spoke.
+    """
+    angle = rotation + np.arange(6) * np.pi / 3
+    cos_a = np.cos(angle)
+    sin_a = np.sin(angle)
+    x1 = cx + (cos_a * inner).astype(np.int64)
+    y1 = cy + (sin_a * inner).astype(np.int64)
+    x2 = cx + (cos_a * outer).astype(np.int64)
+    y2 = cy + (sin_a * outer).astype(np.int64)
+    return x1, y1, x2, y2
+
+
+@njit(cache=True)
+def pool_sparkles(frame: int, x: int, y: int, px: int):
+    """Positions of the four sparkles circling on the tide pool surface.
+
+    Returns:
+        (xs, ys, visible) arrays, one entry per sparkle.
+    """
+    i = np.arange(4)
+    angle = (frame * 0.1 + i * 1.5) % (np.pi * 2) + i
+    xs = x + (np.cos(angle) * px * 3).astype(np.int64)
+    ys = y + (np.sin(angle) * px * 1.5).astype(np.int64)
+    visible = (frame + i * 7) % 20 < 12
+    return xs, ys, visible
+
+
+@njit(cache=True)
+def pool_data(frame: int, x: int, y: int, px: int):
+    """Positions of the five data blocks rising from the active tide pool.
+
+    Returns:
+        (xs, ys, visible) arrays, one entry per block.
+    """
+    i = np.arange(5)
+    phase = (frame * 0.5 + i * 8) % 25
+    xs = x + (np.sin(frame * 0.15 + i * 1.2) * px * 4).astype(np.int64)
+    ys = y - px * 2 - (phase * px * 0.6).astype(np.int64)
+    visible = phase < 20
+    return xs, ys, visible
+
+
+@njit(cache=True)
+def bush_leaves(frame: int, x: int, y: int, px: int):
+    """Positions of the five leaves flung out of the active bush.
+
+    Returns:
+        (xs, ys, visible) arrays, one entry per leaf.
+    """
+    i = np.arange(5)
+    phase = (frame * 0.3 + i * 7) % 25
+    xs = x + (np.cos(frame * 0.2 + i * 1.3) * (px * 4 + phase * px * 0.6)).astype(np.int64)
+    ys = y - px * 3 - (phase * px * 0.5).astype(np.int64)
+    visible = phase < 18
+    return xs, ys, visible
+
+
+@njit(cache=True)
+def dash_segments(x1: int, y1: int, nx: float, ny: float, distance: float,
+                  dash_offset: float, dash_len: int, gap_len: int):
+    """Endpoints of the dashes along an animated connection line.
+
+    Dashes start every ``dash_len + gap_len`` pixels from ``dash_offset``
+    (accumulated the same way as a running ``pos += segment_len``) and are
+    clipped to ``[0, distance]``; dashes clipped to nothing are dropped.
+
+    Returns:
+        (sx, sy, ex, ey) arrays, one entry per dash.
+    """
+    segment_len = dash_len + gap_len
+    count = max(1, int((distance - dash_offset) // segment_len) + 2)
+    pos = np.full(count, float(segment_len))
+    pos[0] = dash_offset
+    pos = np.cumsum(pos)
+    pos = pos[pos < distance]
+    start = np.maximum(0.0, pos)
+    end = np.minimum(distance, pos + dash_len)
+    keep = end > start
+    start = start[keep]
+    end = end[keep]
+    sx = (x1 + nx * start).astype(np.int64)
+    sy = (y1 + ny * start).astype(np.int64)
+    ex = (x1 + nx * end).astype(np.int64)
+    ey = (y1 + ny * end).astype(np.int64)
+    return sx, sy, ex, ey
@@ -5,15 +5,28 @@ from __future__ import annotations
 import base64
 import io
 import math
+import random
+import re
 import shutil
+import subprocess
 import sys
-from typing import TYPE_CHECKING, Tuple
+import time
+import traceback
+import zlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TextIO, Tuple
+
+import numpy as np
 
 try:
+    import PIL
     from PIL import Image, ImageDraw
     HAS_PIL = True
+    # Pillow-SIMD versions carry a ".postN" suffix (e.g. "9.5.0.post1")
+    HAS_PILLOW_SIMD = ".post" in PIL.__version__
 except ImportError:
     HAS_PIL = False
+    HAS_PILLOW_SIMD = False
 
 if TYPE_CHECKING:
     from claude_world.types import GameState
@@ -33,11 +46,47 @@ from claude_world.renderer.display import (
     detect_graphics_protocol,
     tmux_wrap,
     clear_tmux_scrollback,
+    FrameBuffer,
+    FrameWriter,
+)
+from claude_world.renderer.kernels import (
+    bush_leaves,
+    dash_segments,
+    gear_spokes,
+    mailbox_sparkles,
+    pool_data,
+    pool_sparkles,
+    thinking_sparkles,
+    wave_offsets,
 )
-from claude_world.renderer.world_objects import WorldObjectsMixin
-
 
-class TerminalGraphicsRenderer(WorldObjectsMixin):
+# Claude Code status line patterns: optional spinner + verb + "..." or "for Xs"
+_VERB_ELLIPSIS_RE = re.compile(r'[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏\s]*(\w+)(?:\.{3}|…)')
+_VERB_FOR_RE = re.compile(r'[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏\s]*(\w+)\s+for\s+\d+')
+
+
+def _idle_look_dir(frame: int) -> int:
+    """Direction Claude looks while idle at a given frame of the 400-frame cycle."""
+    look_cycle = (frame % 400) / 400.0
+    if look_cycle < 0.08:
+        return -1  # Look left
+    elif look_cycle < 0.15:
+        return -1  # Hold left
+    elif look_cycle < 0.25:
+        return 0   # Center
+    elif look_cycle < 0.55:
+        return 0   # Hold center (longest)
+    elif look_cycle < 0.63:
+        return 1   # Look right
+    elif look_cycle < 0.70:
+        return 1   # Hold right
+    elif look_cycle < 0.80:
+        return 0   # Back to center
+    else:
+        return 0   # Hold center
+
+
+class TerminalGraphicsRenderer:
     """Renders game state as idle game graphics in the terminal.
 
     Design: Centered Claude character with clean stats display.
@@ -87,6 +136,74 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         "outline": (40, 30, 20),
     }
 
+    # Reading palm fronds: angle offsets, length multipliers and segment positions
+    _FROND_ANGLES = np.array([-1.2, -0.6, 0.0, 0.6, 1.2]) + math.pi / 2
+    _FROND_LEN_MULT = np.array([0.8, 0.9, 1.0, 0.9, 0.8])
+    _FROND_SEG_TS = np.arange(3) / 3.0
+
+    # Rock pile palette (base, highlight, shadow) plus brightened active variants
+    _ROCK_BASE = ((130, 125, 120), (115, 110, 105), (145, 140, 135), (100, 95, 90))
+    _ROCK_HIGHLIGHT = ((170, 165, 160), (155, 150, 145), (180, 175, 170), (140, 135, 130))
+    _ROCK_SHADOW = ((90, 85, 80), (75, 70, 65), (100, 95, 90), (60, 55, 50))
+    _ROCK_BASE_ACTIVE = tuple(tuple(min(255, c + 25) for c in rc) for rc in _ROCK_BASE)
+    _ROCK_HIGHLIGHT_ACTIVE = tuple(tuple(min(255, c + 25) for c in rc) for rc in _ROCK_HIGHLIGHT)
+    # Prop layouts in px units, scaled at draw time
+    # Rock pile: (x_offset, y_offset, width, height, color_idx), back to front
+    _ROCK_LAYOUT = (
+        (-4, -3, 5, 4, 0),   # Back left
+        (3, -2, 4, 3, 1),    # Back right
+        (-2, 1, 6, 4, 2),    # Front left (large)
+        (4, 2, 5, 3, 3),     # Front right
+        (1, -4, 4, 3, 0),    # Top center
+    )
+    _PEBBLE_OFFSETS = ((-7, 3), (7, 4), (-5, 4), (6, 3))
+    # Bush blobs: (x_off, y_off, width, height, shade) - shade 0 dark, 1 mid, 2 base, 3 light
+    _BUSH_BLOBS = (
+        (-4, 1, 4, 3, 0),   # Back left
+        (3, -1, 4, 3, 0),   # Back right
+        (-1, -2, 5, 4, 1),  # Back center
+        (-3, 2, 5, 3, 2),   # Front left
+        (2, 2, 5, 3, 2),    # Front right
+        (0, 1, 4, 3, 3),    # Front center highlight
+    )
+    _BERRY_OFFSETS = ((-3, 0), (2, 1), (-1, -2), (4, -1), (-5, 2))
+
+    # Loop invariants for orbiting/radial effects
+    _THOUGHT_SPARKLE_COLORS = ((255, 255, 180), (255, 220, 150), (200, 255, 200))
+    _CODE_SYMBOLS = ("{ }", "< >", "[ ]", "( )", "=>")
+    _WAVE_ARC_RADIANS = tuple(math.radians(angle) for angle in range(-30, 31, 10))
+
+    # Animation rates whose sin(frame * rate) is shared across draw calls each frame
+    _PHASE_RATES = (0.02, 0.04, 0.05, 0.06, 0.08, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5)
+
+    # Per-element jiggle offsets for idle world objects
+    _NO_JIGGLE = (0,) * 8
+
+    # Claude Code status-line poll interval bounds, in frames
+    _VERB_POLL_MIN = 10
+    _VERB_POLL_MAX = 60
+    _PANE_LIST_TTL = 300
+
+    # Kitty image id reused for every frame, so each transmit replaces the
+    # previous image and partial updates can address it
+    _KITTY_IMAGE_ID = 1
+    # Height in rows of the bands changed regions are tracked in
+    _DIRTY_BAND = 32
+
+    # Idle look-around direction and blink state, indexed by frame % period
+    _LOOK_DIR_TABLE = tuple(_idle_look_dir(i) for i in range(400))
+    _BLINK_TABLE = tuple(i < 5 for i in range(150))
+    # Activity banner pulse state, indexed by frame % 30
+    _BANNER_PULSE_TABLE = tuple(i < 15 for i in range(30))
+    # Grep/Glob magnifying glass sweep: (cos, sin) of the 6-degree steps of one 60-frame turn
+    _SWEEP_TABLE = tuple(
+        (math.cos(math.radians(i * 6)), math.sin(math.radians(i * 6))) for i in range(60)
+    )
+    # Sideways lean of each reading palm trunk segment, in pixels per px
+    _PALM_TRUNK_LEAN = tuple(math.sin(i * 0.3) for i in range(4))
+    # Farthest any world-object prop draws from its anchor (the rising letters/bubbles), in px
+    _PROP_REACH = 30
+
     # Tool name to activity verb mapping (matches Claude Code's display)
     TOOL_VERBS = {
         "Read": "Reading...",
@@ -121,6 +238,18 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         "Transmuting...", "Vibing...", "Working...",
     ]
 
+    # Activity to banner text when there is no tool or thinking verb to show
+    ACTIVITY_VERBS = MappingProxyType({
+        "reading": "Reading...",
+        "writing": "Writing...",
+        "searching": "Searching...",
+        "building": "Building...",
+        "exploring": "Exploring...",
+        "communicating": "Connecting...",
+        "resting": "Resting...",
+        "celebrating": "Celebrating!",
+    })
+
     # Known Claude Code verbs to look for in terminal output (without "...")
     CLAUDE_CODE_VERBS = {
         "Accomplishing", "Actioning", "Actualizing", "Baking", "Brewing",
@@ -138,17 +267,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
     }
 
     @staticmethod
-    def _get_claude_code_verb() -> str | None:
-        """Read the current verb from the Claude Code tmux pane.
-
-        Returns:
-            The verb (e.g., "Unravelling") or None if not found.
-        """
-        import subprocess
-        import re
-
+    def _get_other_tmux_panes() -> list[str]:
+        """List the tmux panes in this window other than the game's own pane."""
         if not is_inside_tmux():
-            return None
+            return []
 
         try:
             # List all panes and find the one running claude (not our game pane)
@@ -159,7 +281,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             )
             if result.returncode != 0:
                 del result  # Explicitly free subprocess buffers
-                return None
+                return []
 
             pane_ids = result.stdout.strip().split("\n")
             del result  # Free memory immediately
@@ -171,12 +293,31 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             )
             current_pane = result2.stdout.strip()
             del result2  # Free memory immediately
+        except (OSError, subprocess.SubprocessError):
+            return []
+
+        return [pane_id for pane_id in pane_ids if pane_id != current_pane]
+
+    @staticmethod
+    def _get_claude_code_verb(pane_ids: list[str] | None = None) -> str | None:
+        """Read the current verb from the Claude Code tmux pane.
+
+        Args:
+            pane_ids: Panes to search, as from _get_other_tmux_panes.
+                Listed afresh when not given.
+
+        Returns:
+            The verb (e.g., "Unravelling") or None if not found.
+        """
+        if not is_inside_tmux():
+            return None
+
+        if pane_ids is None:
+            pane_ids = TerminalGraphicsRenderer._get_other_tmux_panes()
 
+        try:
             # Check other panes for Claude Code verb
             for pane_id in pane_ids:
-                if pane_id == current_pane:
-                    continue  # Skip our own pane
-
                 # Capture the last few lines of the other pane
                 capture = subprocess.run(
                     ["tmux", "capture-pane", "-t", pane_id, "-p", "-S", "-5"],
@@ -193,15 +334,19 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 # Look for verb patterns like "Unravelling..." or "⠋ Pondering"
                 # Match: optional spinner + word + "..." or "(esc to interrupt)"
                 for line in content.split("\n"):
+                    # Cheap substring check skips lines neither pattern can match
+                    if "..." not in line and "…" not in line and "for" not in line:
+                        continue
+
                     # Look for lines with verbs followed by ... or timing info
-                    match = re.search(r'[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏\s]*(\w+)(?:\.{3}|…)', line)
+                    match = _VERB_ELLIPSIS_RE.search(line)
                     if match:
                         word = match.group(1)
                         if word in TerminalGraphicsRenderer.CLAUDE_CODE_VERBS:
                             return word
 
                     # Also check for "Verb for Xs" pattern
-                    match = re.search(r'[⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏\s]*(\w+)\s+for\s+\d+', line)
+                    match = _VERB_FOR_RE.search(line)
                     if match:
                         word = match.group(1)
                         if word in TerminalGraphicsRenderer.CLAUDE_CODE_VERBS:
@@ -230,14 +375,21 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
     def _get_pane_pixel_size(self) -> tuple[int, int]:
         """Get current tmux pane size in pixels."""
-        return get_pane_pixel_size(self._cell_width, self._cell_height, self.width, self.height)
+        return get_pane_pixel_size(
+            self._cell_width, self._cell_height, self.display_width, self.display_height
+        )
 
-    def __init__(self, width: int = 0, height: int = 0):
+    def __init__(self, width: int = 0, height: int = 0, render_scale: int = 1,
+                 async_output: bool = False):
         """Initialize the renderer.
 
         Args:
             width: Width in pixels. 0 = auto-detect from terminal.
             height: Height in pixels. 0 = auto-detect from terminal.
+            render_scale: Integer downsample factor. The scene is drawn at
+                1/render_scale of the output size and the terminal upscales it.
+            async_output: Write frames to the terminal from a background thread
+                so rendering the next frame doesn't wait on the TTY.
         """
         if not HAS_PIL:
             raise RuntimeError("PIL/Pillow is required for graphics rendering")
@@ -254,8 +406,16 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         if height <= 0:
             height = pixel_height
 
-        self.width = width
-        self.height = height
+        # Output size on the terminal vs. size of the canvas we draw on
+        render_scale = max(1, int(render_scale))
+        self.display_width = width
+        self.display_height = height
+        self.scale = render_scale
+        self.width = max(1, width // render_scale)
+        self.height = max(1, height // render_scale)
+        # Pixel-art block size and UI scale factor, fixed for the canvas size
+        self._px = max(2, self.height // 120)
+        self._ui_scale = max(0.5, min(self.width / 800, self.height / 400, 2.0))
         self.pane_cols = pane_cols
         self.pane_rows = pane_rows
         self.protocol = detect_graphics_protocol()
@@ -263,7 +423,6 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Disable scrollback for this pane to prevent sixel data accumulation
         # This is critical for memory management - sixel data is huge
         if is_inside_tmux():
-            import subprocess
             try:
                 subprocess.run(
                     ["tmux", "set-option", "-p", "history-limit", "0"],
@@ -276,8 +435,8 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Store cell size for pane size calculations
         self._cell_width, self._cell_height = self._get_cell_size()
 
-        # Create frame buffer
-        self.frame = Image.new("RGBA", (width, height), (0, 0, 0, 255))
+        # Create frame buffer (reused for every frame)
+        self.frame = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 255))
         self.draw = ImageDraw.Draw(self.frame)
 
         # Animation state
@@ -285,6 +444,14 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         self._first_frame = True
         self._focus_reporting_enabled = False
 
+        # Raw bytes of the last frame sent to the terminal (skip identical frames)
+        self._last_frame_bytes: bytes | None = None
+
+        # Optional background writer for terminal output, started with the
+        # first displayed frame (see _display_frame)
+        self._async_output = async_output
+        self._writer: FrameWriter | None = None
+
         # Stats
         self.last_render_time = 0.0
         self.rendered_entities: dict[str, dict] = {}
@@ -293,10 +460,49 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Claude Code verb tracking
         self._cached_verb: str | None = None
         self._verb_cache_frame = 0
+        # Frames until the next poll; doubles on each miss (see _VERB_POLL_*)
+        self._verb_poll_interval = self._VERB_POLL_MIN
+        # Other tmux panes to search for the verb, relisted every _PANE_LIST_TTL frames
+        self._pane_ids: list[str] | None = None
+        self._pane_ids_frame = 0
 
         # Memory management - clear terminal scrollback periodically
         self._last_scrollback_clear = 0
 
+        # Pre-rendered opaque sprites keyed by (name, px), built on first use
+        self._stamp_cache: dict[tuple, Image.Image] = {}
+
+        # Rasterized default-font text masks keyed by string (see _draw_text_cached)
+        self._text_mask_cache: dict[str, Image.Image] = {}
+        # RGBA scratch canvas for flat fills done with numpy slices instead of ImageDraw;
+        # the uint32 view lets a whole pixel be written with one store
+        self._canvas = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+        self._canvas32 = self._canvas.view(np.uint32)[..., 0]
+        # Resolved img2sixel path, looked up on the first sixel frame
+        self._img2sixel_path: str | None = None
+        self._img2sixel_checked = False
+        # Image encode buffer reused across frames (see _encode_frame)
+        self._encode_buf = io.BytesIO()
+
+        # sin(frame * rate) keyed by rate, for the frame in _phase_frame (see _phase_sines)
+        self._phase_frame: int | None = None
+        self._phase_sin: dict[float, float] = {}
+
+        # Grass, beach and water ground layer (fixed layout, generated once)
+        self._init_ground_layer()
+
+        # Night sky star positions (fixed layout, generated once)
+        self._init_stars()
+
+        # Ambient particle state (parallel arrays, advanced per frame with numpy)
+        self._init_ambient_particles()
+
+        # Cloud start positions (fixed layout, generated once)
+        self._init_clouds()
+
+        # Level-up confetti layout as (seed, [(x, y, size), ...]); reseeded every other frame
+        self._confetti = (None, [])
+
     @staticmethod
     def _get_cell_size() -> tuple[int, int]:
         """Get terminal cell size in pixels."""
@@ -304,53 +510,30 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
     def _resize_tmux_pane(self) -> None:
         """Resize the current tmux pane to fit the rendered frame."""
-        resize_tmux_pane(self.height, self._cell_height)
+        resize_tmux_pane(self.display_height, self._cell_height)
 
-    def _safe_ellipse(self, coords: list, **kwargs) -> None:
-        """Draw an ellipse only if coordinates are valid (x2 > x1 and y2 > y1)."""
-        x1, y1, x2, y2 = coords[0], coords[1], coords[2], coords[3]
-        if x2 > x1 and y2 > y1:
-            self.draw.ellipse(coords, **kwargs)
+    def _visible(self, x1: int, y1: int, x2: int, y2: int) -> bool:
+        """Check whether an inclusive bounding box overlaps the frame at all."""
+        return x2 >= 0 and y2 >= 0 and x1 < self.width and y1 < self.height
 
     def render_frame(self, state: GameState) -> None:
         """Render a complete frame."""
-        import time
-        import traceback
         start = time.perf_counter()
 
         self._frame_count += 1
 
         # Size is fixed at startup - no dynamic resizing to prevent flickering
 
-        # Close previous frame and draw to free memory
-        if hasattr(self, 'draw') and self.draw is not None:
-            del self.draw
-            self.draw = None
-        if hasattr(self, 'frame') and self.frame is not None:
-            self.frame.close()
-            del self.frame
-            self.frame = None
-
-        # Aggressive garbage collection - every 10 frames (~0.3 second at 30fps)
-        # Critical for preventing PIL image memory buildup
-        if self._frame_count % 10 == 0:
-            import gc
-            gc.collect(0)  # Generation 0 only - fast
-        # Full GC every 90 frames (~3 seconds)
-        if self._frame_count % 90 == 0:
-            import gc
-            gc.collect()
-
-        # Create fresh frame
-        self.frame = Image.new("RGBA", (self.width, self.height), (0, 0, 0, 255))
-        self.draw = ImageDraw.Draw(self.frame)
+        # The frame buffer is allocated once and reused; the background pass
+        # repaints every pixel, so no clearing or reallocation is needed here.
 
         try:
             # Render layers (idle game style)
             self._render_background(state)
             self._render_scene(state)
-            self._render_subagent_connections(state)
-            self._render_subagents(state)
+            subagents = self._subagent_screen_positions(state)
+            self._render_subagent_connections(state, subagents)
+            self._render_subagents(subagents)
             self._render_claude_character(state)
             self._render_tool_spinner(state)
             self._render_particles(state)
@@ -387,117 +570,190 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         else:  # night
             sky_color = (30, 40, 70)
 
-        # Flat fill - pixel art style (no gradient)
-        self.draw.rectangle([0, 0, self.width, self.height], fill=sky_color)
+        # Flat fill - pixel art style (no gradient). The sky goes on the numpy
+        # canvas above the ground rows, which _render_scene fills from the
+        # pre-rendered ground layer before pasting the canvas whole
+        canvas = self._canvas32
+        canvas[:int(self.height * 0.25)] = self._pack_color(sky_color)
 
         # Stars at night - bigger, blockier pixels
         if phase == "night":
-            import random
-            random.seed(42)
             pixel_size = max(2, self.height // 150)
-            for _ in range(40):
-                x = random.randint(0, self.width)
-                y = random.randint(0, int(self.height * 0.4))
-                # Twinkle by toggling visibility
-                twinkle = (self._frame_count + x) % 60 < 50
-                if twinkle:
-                    self.draw.rectangle(
-                        [x, y, x + pixel_size, y + pixel_size],
-                        fill=(255, 255, 220)
-                    )
+            # Twinkle by toggling visibility
+            twinkle = (self._frame_count + self._star_x) % 60 < 50
+            # Every pixel of every visible star block in one fancy-indexed store,
+            # dropping the parts of blocks that hang off the right/bottom edge
+            offsets = np.arange(pixel_size + 1)
+            ys, xs = np.broadcast_arrays(
+                self._star_y[twinkle, None, None] + offsets[None, :, None],
+                self._star_x[twinkle, None, None] + offsets[None, None, :],
+            )
+            inside = (ys < self.height) & (xs < self.width)
+            canvas[ys[inside], xs[inside]] = self._pack_color((255, 255, 220))
 
-    def _render_scene(self, state: GameState) -> None:
-        """Render top-down pixel art scene with grass, trees, and water."""
-        center_x = self.width // 2
-        frame = self._frame_count
+    def _phase_sines(self, frame: int) -> dict[float, float]:
+        """Get sin(frame * rate) for the shared animation rates, keyed by rate.
 
-        # Pixel size for chunky pixel art look
-        px = max(2, self.height // 120)
+        The table for the last frame asked for is kept, so the many draw calls
+        of one render evaluate it once.
+        """
+        if frame != self._phase_frame:
+            self._phase_frame = frame
+            self._phase_sin = {rate: math.sin(frame * rate) for rate in self._PHASE_RATES}
+        return self._phase_sin
+
+    def _init_ground_layer(self) -> None:
+        """Pre-render the static ground (grass, beach, water and path) for the canvas.
+
+        None of it moves, so _render_scene copies these rows into the canvas
+        with one store instead of refilling every layer each frame.
+        """
+        px = self._px
+        fill_rect = self._fill_rect
+        pack = self._pack_color
+        ground = np.empty((self.height, self.width), dtype=np.uint32)
 
         # Draw grass background (fills most of the screen)
         grass_start_y = int(self.height * 0.25)
-        self.draw.rectangle(
-            [0, grass_start_y, self.width, self.height],
-            fill=self.COLORS["grass"]
-        )
-
-        # Add grass texture - darker patches in a grid pattern
-        for gy in range(grass_start_y, self.height, px * 8):
-            for gx in range(0, self.width, px * 8):
-                # Checkerboard-ish pattern with some randomness
-                if ((gx // (px * 8)) + (gy // (px * 8))) % 2 == 0:
-                    self.draw.rectangle(
-                        [gx, gy, gx + px * 4, gy + px * 4],
-                        fill=self.COLORS["grass_light"]
-                    )
+        fill_rect(ground, 0, grass_start_y, self.width, self.height, pack(self.COLORS["grass"]))
+
+        # Add grass texture - darker patches in a checkerboard grid. Each
+        # step-sized cell gets a (4px + 1)-square patch in its top-left corner
+        step = px * 8
+        ys = np.arange(grass_start_y, self.height)
+        xs = np.arange(self.width)
+        cell_ys = grass_start_y + (ys - grass_start_y) // step * step
+        cell_xs = xs // step * step
+        in_patch = ((ys - cell_ys) <= px * 4)[:, None] & ((xs - cell_xs) <= px * 4)[None, :]
+        checker = ((cell_ys // step)[:, None] + (cell_xs // step)[None, :]) % 2 == 0
+        ground[grass_start_y:][in_patch & checker] = pack(self.COLORS["grass_light"])
 
         # Water on the edges (like ocean surrounding the island)
         water_width = int(self.width * 0.10)
         beach_width = int(self.width * 0.06)
 
         # Left water
-        self.draw.rectangle([0, grass_start_y, water_width, self.height], fill=self.COLORS["water"])
+        water = pack(self.COLORS["water"])
+        fill_rect(ground, 0, grass_start_y, water_width, self.height, water)
         # Right water
-        self.draw.rectangle([self.width - water_width, grass_start_y, self.width, self.height], fill=self.COLORS["water"])
+        fill_rect(ground, self.width - water_width, grass_start_y, self.width, self.height, water)
 
         # Beach sand between water and grass (left side)
-        self.draw.rectangle([water_width, grass_start_y, water_width + beach_width, self.height],
-                          fill=self.COLORS["sand"])
+        sand = pack(self.COLORS["sand"])
+        fill_rect(ground, water_width, grass_start_y, water_width + beach_width, self.height, sand)
         # Beach sand (right side)
-        self.draw.rectangle([self.width - water_width - beach_width, grass_start_y,
-                           self.width - water_width, self.height], fill=self.COLORS["sand"])
+        fill_rect(ground, self.width - water_width - beach_width, grass_start_y,
+                  self.width - water_width, self.height, sand)
 
         # Sandy shore details - darker wet sand near water
-        wet_sand = (210, 185, 130)
-        self.draw.rectangle([water_width, grass_start_y, water_width + px * 3, self.height], fill=wet_sand)
-        self.draw.rectangle([self.width - water_width - px * 3, grass_start_y,
-                           self.width - water_width, self.height], fill=wet_sand)
-
-        # Scattered shells and pebbles on beach
-        import random
-        random.seed(555)
+        wet_sand = pack((210, 185, 130))
+        fill_rect(ground, water_width, grass_start_y, water_width + px * 3, self.height, wet_sand)
+        fill_rect(ground, self.width - water_width - px * 3, grass_start_y,
+                  self.width - water_width, self.height, wet_sand)
+
+        # Scattered shells and pebbles on beach. A private seeded RNG keeps the
+        # original random.seed(555) layout without touching the global state
+        rng = random.Random(555)
+        shells = Image.fromarray(ground.view(np.uint8).reshape(self.height, self.width, 4))
+        shell_draw = ImageDraw.Draw(shells)
         shell_colors = [(240, 235, 220), (220, 200, 170), (200, 180, 150)]
         for _ in range(12):
             # Left beach shells
-            sx = random.randint(water_width + px * 2, water_width + beach_width - px * 2)
-            sy = random.randint(grass_start_y + px * 4, self.height - px * 4)
-            shell_size = random.randint(1, 2) * px
-            self._safe_ellipse([sx - shell_size, sy - shell_size//2,
-                             sx + shell_size, sy + shell_size//2],
-                            fill=random.choice(shell_colors))
+            sx = rng.randint(water_width + px * 2, water_width + beach_width - px * 2)
+            sy = rng.randint(grass_start_y + px * 4, self.height - px * 4)
+            shell_size = rng.randint(1, 2) * px
+            left_shell = [sx - shell_size, sy - shell_size // 2, sx + shell_size, sy + shell_size // 2]
+            left_color = rng.choice(shell_colors)
             # Right beach shells
-            sx = random.randint(self.width - water_width - beach_width + px * 2,
-                               self.width - water_width - px * 2)
-            sy = random.randint(grass_start_y + px * 4, self.height - px * 4)
-            self._safe_ellipse([sx - shell_size, sy - shell_size//2,
-                             sx + shell_size, sy + shell_size//2],
-                            fill=random.choice(shell_colors))
-
-        # Water wave animation - horizontal lines
-        for wy in range(grass_start_y, self.height, px * 6):
-            wave_offset = int(math.sin(frame * 0.1 + wy * 0.05) * px * 2)
+            sx = rng.randint(self.width - water_width - beach_width + px * 2,
+                             self.width - water_width - px * 2)
+            sy = rng.randint(grass_start_y + px * 4, self.height - px * 4)
+            right_shell = [sx - shell_size, sy - shell_size // 2, sx + shell_size, sy + shell_size // 2]
+            right_color = rng.choice(shell_colors)
+            for (x1, y1, x2, y2), color in ((left_shell, left_color), (right_shell, right_color)):
+                if x2 > x1 and y2 > y1:
+                    shell_draw.ellipse([x1, y1, x2, y2], fill=color)
+        ground = np.asarray(shells).view(np.uint32)[..., 0].copy()
+
+        # Small path/clearing in center where Claude stands. The waves drawn
+        # over the ground each frame stay near the water, clear of the path
+        center_x = self.width // 2
+        path_y = int(self.height * 0.55)
+        path_w = int(self.width * 0.25)
+        fill_rect(ground, center_x - path_w // 2, path_y - px * 4,
+                  center_x + path_w // 2, path_y + px * 8, pack(self.COLORS["grass_light"]))
+
+        self._ground_layer = ground[grass_start_y:]
+
+    def _init_stars(self, count: int = 40) -> None:
+        """Place the night sky stars once.
+
+        A private seeded RNG reproduces the original ``random.seed(42)``
+        layout without touching the global ``random`` state every frame.
+        """
+        rng = random.Random(42)
+        coords = [
+            (rng.randint(0, self.width), rng.randint(0, int(self.height * 0.4)))
+            for _ in range(count)
+        ]
+        self._star_x = np.array([x for x, _ in coords], dtype=np.int64)
+        self._star_y = np.array([y for _, y in coords], dtype=np.int64)
+
+    @staticmethod
+    def _pack_color(color: tuple) -> np.uint32:
+        """Pack an opaque RGB color into one pixel of the uint32 canvas view."""
+        return np.array((*color, 255), dtype=np.uint8).view(np.uint32)[0]
+
+    @staticmethod
+    def _fill_rect(canvas: np.ndarray, x1: int, y1: int, x2: int, y2: int, color: np.uint32) -> None:
+        """Fill an inclusive box on a numpy canvas, clipped like ImageDraw.rectangle."""
+        canvas[max(y1, 0):max(y2 + 1, 0), max(x1, 0):max(x2 + 1, 0)] = color
+
+    def _render_scene(self, state: GameState) -> None:
+        """Render top-down pixel art scene with grass, trees, and water."""
+        center_x = self.width // 2
+        frame = self._frame_count
+
+        # Pixel size for chunky pixel art look
+        px = self._px
+
+        # Grass, beach, water, shells and the path are pre-rendered (see _init_ground_layer);
+        # copy them under the sky on the canvas
+        canvas = self._canvas32
+        grass_start_y = int(self.height * 0.25)
+        canvas[grass_start_y:] = self._ground_layer
+
+        # Water on the edges (like ocean surrounding the island)
+        water_width = int(self.width * 0.10)
+
+        # Water wave animation - horizontal lines, stored straight into the canvas
+        fill_rect = self._fill_rect
+        water_light = self._pack_color(self.COLORS["water_light"])
+        wave_rows = range(grass_start_y, self.height, px * 6)
+        wave_shifts = wave_offsets(grass_start_y, self.height, px * 6, frame * 0.1, 0.05, px * 2)
+        for wy, wave_offset in zip(wave_rows, wave_shifts.tolist()):
             # Left side waves
-            self.draw.rectangle(
-                [water_width - px * 3 + wave_offset, wy, water_width + wave_offset, wy + px * 2],
-                fill=self.COLORS["water_light"]
-            )
+            fill_rect(canvas, water_width - px * 3 + wave_offset, wy,
+                      water_width + wave_offset, wy + px * 2, water_light)
             # Right side waves
-            self.draw.rectangle(
-                [self.width - water_width - wave_offset, wy, self.width - water_width + px * 3 - wave_offset, wy + px * 2],
-                fill=self.COLORS["water_light"]
-            )
+            fill_rect(canvas, self.width - water_width - wave_offset, wy,
+                      self.width - water_width + px * 3 - wave_offset, wy + px * 2, water_light)
+
+        self.frame.paste(Image.fromarray(self._canvas))
 
         # Foam at waterline (animated)
-        for wy in range(grass_start_y, self.height, px * 8):
-            foam_offset = int(math.sin(frame * 0.08 + wy * 0.03) * px)
+        ellipse = self.draw.ellipse
+        foam_rows = range(grass_start_y, self.height, px * 8)
+        foam_shifts = wave_offsets(grass_start_y, self.height, px * 8, frame * 0.08, 0.03, px)
+        for wy, foam_offset in zip(foam_rows, foam_shifts.tolist()):
             # Left foam
-            self.draw.ellipse([water_width + foam_offset - px * 2, wy,
-                             water_width + foam_offset + px * 2, wy + px * 3],
-                            fill=(255, 255, 255))
+            ellipse([water_width + foam_offset - px * 2, wy,
+                     water_width + foam_offset + px * 2, wy + px * 3],
+                    fill=(255, 255, 255))
             # Right foam
-            self.draw.ellipse([self.width - water_width - foam_offset - px * 2, wy,
-                             self.width - water_width - foam_offset + px * 2, wy + px * 3],
-                            fill=(255, 255, 255))
+            ellipse([self.width - water_width - foam_offset - px * 2, wy,
+                     self.width - water_width - foam_offset + px * 2, wy + px * 3],
+                    fill=(255, 255, 255))
 
         # Draw pixel art trees scattered around (but not in center where Claude is)
         tree_positions = [
@@ -517,20 +773,18 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Sort by Y position for proper layering
         tree_positions.sort(key=lambda p: p[1])
 
-        for tx, ty in tree_positions:
-            tree_x = int(self.width * tx)
+        tree_xs = [int(self.width * tx) for tx, _ in tree_positions]
+        # Trees further back are smaller
+        tree_scales = [0.6 + ty * 0.5 for _, ty in tree_positions]
+
+        # Sway for every tree in one vectorized sin - each tree sways at a different rate
+        sways = (np.sin(frame * 0.03 + np.array(tree_xs) * 0.02) * px * 2
+                 * np.array(tree_scales)).astype(np.int64).tolist()
+
+        for (_, ty), tree_x, tree_scale, sway in zip(tree_positions, tree_xs, tree_scales, sways):
             tree_y = int(self.height * ty)
-            # Trees further back are smaller
-            tree_scale = 0.6 + ty * 0.5
-            self._draw_pixel_tree(tree_x, tree_y, tree_scale, px, frame)
+            self._draw_pixel_tree(tree_x, tree_y, tree_scale, px, frame, sway)
 
-        # Small path/clearing in center where Claude stands
-        path_y = int(self.height * 0.55)
-        path_w = int(self.width * 0.25)
-        self.draw.rectangle(
-            [center_x - path_w // 2, path_y - px * 4, center_x + path_w // 2, path_y + px * 8],
-            fill=self.COLORS["grass_light"]
-        )
 
         # Draw interactive world objects at each location
         self._draw_world_objects(center_x, int(self.height * 0.58), px, frame, state)
@@ -581,8 +835,15 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         hilltop_y = center_y + int(-80 * scale / px)
         self._draw_thinking_spot(hilltop_x, hilltop_y, px, frame, active=(current_loc == "hilltop"))
 
+    def _prop_offscreen(self, x: int, y: int, px: int) -> bool:
+        """Whether a world-object prop anchored at (x, y) lies entirely outside the frame."""
+        reach = px * self._PROP_REACH
+        return x + reach < 0 or x - reach > self.width or y + reach < 0 or y - reach > self.height
+
     def _draw_reading_palm(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
         """Draw a palm tree with reading spot beneath it."""
+        if self._prop_offscreen(x, y, px):
+            return
         trunk_color = (120, 80, 50)
         trunk_dark = (90, 60, 40)
         frond_color = (60, 140, 60)
@@ -590,48 +851,23 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         outline = self.COLORS["outline"]
 
         # Sway animation
-        sway = int(math.sin(frame * 0.04) * px * 2)
+        sway = int(self._phase_sines(frame)[0.04] * px * 2)
 
         # Shadow on ground
         self.draw.ellipse([x - px*6, y + px*4, x + px*6, y + px*6], fill=(60, 120, 50))
 
-        # Trunk - curved palm trunk
-        for i in range(4):
-            trunk_x = x + int(math.sin(i * 0.3) * px)
+        # Trunk - curved palm trunk, one pre-striped segment pasted per step
+        trunk_stamp = self._get_palm_trunk_stamp(px, trunk_color, trunk_dark, outline)
+        for i, lean in enumerate(self._PALM_TRUNK_LEAN):
+            trunk_x = x + int(lean * px)
             trunk_y = y - i * px * 3
-            self.draw.rectangle([trunk_x - px*2 - px, trunk_y - px*2,
-                               trunk_x + px*2 + px, trunk_y + px*2], fill=outline)
-            self.draw.rectangle([trunk_x - px*2, trunk_y - px*2,
-                               trunk_x + px*2, trunk_y + px*2], fill=trunk_color)
-            self.draw.rectangle([trunk_x - px, trunk_y - px*2,
-                               trunk_x, trunk_y + px*2], fill=trunk_dark)
-
-        # Coconuts
-        coconut_y = y - px * 10
-        for i, ox in enumerate([-px*2, px*2]):
-            self.draw.ellipse([x + ox + sway - px*2, coconut_y - px*2,
-                             x + ox + sway + px*2, coconut_y + px*2], fill=(100, 70, 40))
+            self.frame.paste(trunk_stamp, (trunk_x - px*3, trunk_y - px*2))
 
-        # Palm fronds
-        frond_base_y = y - px * 12
-        fronds = [(-1.2, 0.8), (-0.6, 0.9), (0, 1.0), (0.6, 0.9), (1.2, 0.8)]
-        for angle_offset, length_mult in fronds:
-            angle = math.pi / 2 + angle_offset + sway * 0.02
-            frond_len = px * 8 * length_mult
-            x + sway + int(math.cos(angle) * frond_len)
-            frond_base_y + int(math.sin(angle) * frond_len * 0.3)
-
-            # Draw frond as elongated shape
-            x + sway + int(math.cos(angle) * frond_len * 0.5)
-            frond_base_y + int(math.sin(angle) * frond_len * 0.15)
-
-            # Frond segments
-            for j in range(3):
-                seg_t = j / 3.0
-                seg_x = x + sway + int(math.cos(angle) * frond_len * seg_t)
-                seg_y = frond_base_y + int(math.sin(angle) * frond_len * 0.3 * seg_t) - j * px
-                seg_color = frond_light if j == 0 else frond_color
-                self.draw.ellipse([seg_x - px*2, seg_y - px, seg_x + px*2, seg_y + px], fill=seg_color)
+        # Coconuts and fronds only vary with the sway - paste the cached crown
+        crown, (crown_ax, crown_ay) = self._get_palm_crown_sprite(
+            px, sway, frond_color, frond_light
+        )
+        self.frame.paste(crown, (x + sway - crown_ax, y - crown_ay), crown)
 
         # When active (reading), show book/scroll and reading effects
         if active:
@@ -643,9 +879,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
             # Book outline and fill
             self.draw.rectangle([book_x - px, book_y - px, book_x + book_w + px, book_y + book_h + px],
-                              fill=outline)
-            self.draw.rectangle([book_x, book_y, book_x + book_w, book_y + book_h],
-                              fill=(240, 230, 210))
+                              fill=(240, 230, 210), outline=outline, width=px)
             # Book spine
             self.draw.rectangle([book_x + book_w//2 - px//2, book_y, book_x + book_w//2 + px//2, book_y + book_h],
                               fill=(180, 140, 100))
@@ -662,93 +896,236 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     (book_x + book_w//2, book_y + book_h)
                 ], fill=(255, 250, 240))
 
+            draw = self.draw
+            sin = math.sin
+            cos = math.cos
+
             # Reading sparkles/highlights
             for i in range(3):
                 sparkle_phase = (frame * 0.1 + i * 2.5) % (math.pi * 2)
-                sparkle_x = book_x + book_w//2 + int(math.cos(sparkle_phase) * px * 4)
-                sparkle_y = book_y - px * 2 + int(math.sin(sparkle_phase) * px * 2)
+                sparkle_x = book_x + book_w//2 + int(cos(sparkle_phase) * px * 4)
+                sparkle_y = book_y - px * 2 + int(sin(sparkle_phase) * px * 2)
                 if (frame + i * 11) % 20 < 14:
-                    self.draw.rectangle([sparkle_x - px//2, sparkle_y - px//2,
-                                       sparkle_x + px//2, sparkle_y + px//2], fill=(255, 255, 200))
+                    draw.rectangle([sparkle_x - px//2, sparkle_y - px//2,
+                                  sparkle_x + px//2, sparkle_y + px//2], fill=(255, 255, 200))
+
+    @staticmethod
+    def _trim_sprite(sprite: Image.Image, anchor_x: int, anchor_y: int) -> tuple:
+        """Crop a transparent sprite to its drawn pixels, shifting the anchor to match."""
+        left, top, right, bottom = sprite.getbbox()
+        return sprite.crop((left, top, right, bottom)), (anchor_x - left, anchor_y - top)
+
+    def _get_palm_crown_sprite(self, px: int, sway: int, frond_color: tuple,
+                               frond_light: tuple) -> tuple:
+        """Get the cached coconuts and fronds of the reading palm for one sway offset.
+
+        Returns:
+            (sprite, (anchor_x, anchor_y)) where the anchor is the swayed trunk base.
+        """
+        key = ("palm_crown", px, sway)
+        cached = self._stamp_cache.get(key)
+        if cached is not None:
+            return cached
+
+        x = y = px * 20
+        sprite = Image.new("RGBA", (px * 40 + 1, px * 40 + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sprite)
+
+        # Coconuts
+        coconut_y = y - px * 10
+        for ox in (-px*2, px*2):
+            draw.ellipse([x + ox - px*2, coconut_y - px*2,
+                          x + ox + px*2, coconut_y + px*2], fill=(100, 70, 40))
+
+        # Palm fronds
+        frond_base_y = y - px * 12
+        angles = self._FROND_ANGLES + sway * 0.02
+        frond_lens = (px * 8 * self._FROND_LEN_MULT)[:, None]
+        seg_ts = self._FROND_SEG_TS[None, :]
+        # (frond, segment) grids of segment centres, truncated like int()
+        seg_xs = (np.cos(angles)[:, None] * frond_lens * seg_ts).astype(np.int64) + x
+        seg_ys = ((np.sin(angles)[:, None] * frond_lens * 0.3 * seg_ts).astype(np.int64)
+                  + frond_base_y - np.arange(3) * px)
+
+        # Frond segments
+        for frond_xs, frond_ys in zip(seg_xs.tolist(), seg_ys.tolist()):
+            for j, (seg_x, seg_y) in enumerate(zip(frond_xs, frond_ys)):
+                seg_color = frond_light if j == 0 else frond_color
+                draw.ellipse([seg_x - px*2, seg_y - px, seg_x + px*2, seg_y + px], fill=seg_color)
+
+        cached = self._trim_sprite(sprite, x, y)
+        self._stamp_cache[key] = cached
+        return cached
+
+    def _get_palm_trunk_stamp(self, px: int, trunk_color: tuple, trunk_dark: tuple,
+                              outline: tuple) -> Image.Image:
+        """Get the reading palm trunk segment: outline, fill and shaded stripe."""
+        key = ("palm_trunk", px)
+        stamp = self._stamp_cache.get(key)
+        if stamp is None:
+            stamp = Image.new("RGBA", (px*6 + 1, px*4 + 1), outline + (255,))
+            stamp_draw = ImageDraw.Draw(stamp)
+            stamp_draw.rectangle([px, 0, px*5, px*4], fill=trunk_color)
+            stamp_draw.rectangle([px*2, 0, px*3, px*4], fill=trunk_dark)
+            self._stamp_cache[key] = stamp
+        return stamp
 
     def _draw_rock_pile(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
         """Draw a pile of rocks with better depth and detail."""
-        # Rock color palette with proper highlights and shadows
-        rock_base = [(130, 125, 120), (115, 110, 105), (145, 140, 135), (100, 95, 90)]
-        rock_highlight = [(170, 165, 160), (155, 150, 145), (180, 175, 170), (140, 135, 130)]
-        rock_shadow = [(90, 85, 80), (75, 70, 65), (100, 95, 90), (60, 55, 50)]
-        outline = self.COLORS["outline"]
+        if self._prop_offscreen(x, y, px):
+            return
+        # Rock color palette with proper highlights and shadows (brighter when active)
+        if active:
+            rock_base = self._ROCK_BASE_ACTIVE
+            rock_highlight = self._ROCK_HIGHLIGHT_ACTIVE
+        else:
+            rock_base = self._ROCK_BASE
+            rock_highlight = self._ROCK_HIGHLIGHT
+
+        # Idle rocks never move - paste the whole pile from one cached sprite
+        if not active:
+            self._paste_prop(("rock_pile", px), x, y, px, lambda draw, ax, ay: self._draw_rock_pile_body(
+                draw, ax, ay, px, 0, self._NO_JIGGLE, rock_base, rock_highlight, (60, 100, 50)))
+            return
+
+        # When active, rocks shake (individually as well as together)
+        shake = int(self._phase_sines(frame)[0.4] * px)
+        rock_shakes = [int(math.sin(frame * 0.5 + i * 1.5) * px) for i in range(5)]
+        self._draw_rock_pile_body(self.draw, x, y, px, shake, rock_shakes,
+                                  rock_base, rock_highlight, (80, 120, 70))
+
+        draw = self.draw
+        sin = math.sin
+        cos = math.cos
 
-        # When active, rocks shake
-        shake = int(math.sin(frame * 0.4) * px) if active else 0
+        # When active, show sparks and dust particles
+        # Sparks flying upward
+        for i in range(5):
+            spark_x = x + int(sin(frame * 0.25 + i * 1.2) * px * 6)
+            spark_y = y - px * 5 - int((frame * 2 + i * 7) % (px * 10))
+            spark_size = px if (frame + i) % 3 == 0 else px // 2
+            spark_color = (255, 220, 100) if i % 2 == 0 else (255, 180, 80)
+            draw.rectangle([spark_x - spark_size, spark_y - spark_size,
+                          spark_x + spark_size, spark_y + spark_size], fill=spark_color)
+
+        # Dust puffs
+        for i in range(3):
+            dust_x = x + int(cos(frame * 0.12 + i * 2.5) * px * 7)
+            dust_y = y + px * 3 + int(sin(frame * 0.08 + i) * px)
+            dust_size = px * 2 + int(abs(sin(frame * 0.1 + i)) * px * 1.5)
+            dust_color = (180, 170, 160) if i % 2 == 0 else (160, 150, 140)
+            draw.ellipse([dust_x - dust_size, dust_y - dust_size,
+                        dust_x + dust_size, dust_y + dust_size], fill=dust_color)
+
+    def _paste_prop(self, key: tuple, x: int, y: int, px: int, draw_body) -> None:
+        """Paste a world object part that does not move, drawn once into a cached sprite.
+
+        ``draw_body(draw, x, y)`` draws the part around its anchor (x, y); the
+        part must fit within ``px * 20`` of the anchor.
+        """
+        cached = self._stamp_cache.get(key)
+        if cached is None:
+            anchor = px * 20
+            sprite = Image.new("RGBA", (px * 40 + 1, px * 40 + 1), (0, 0, 0, 0))
+            draw_body(ImageDraw.Draw(sprite), anchor, anchor)
+            cached = self._trim_sprite(sprite, anchor, anchor)
+            self._stamp_cache[key] = cached
+        sprite, (anchor_x, anchor_y) = cached
+        self.frame.paste(sprite, (x - anchor_x, y - anchor_y), sprite)
+
+    def _draw_rock_pile_body(self, draw: ImageDraw.ImageDraw, x: int, y: int, px: int,
+                             shake: int, rock_shakes, rock_base: tuple, rock_highlight: tuple,
+                             shadow_color: tuple) -> None:
+        """Draw the rock pile's ground shadow, rocks and pebbles around (x, y)."""
+        rock_shadow = self._ROCK_SHADOW
+        outline = self.COLORS["outline"]
 
         # Ground shadow under pile
-        shadow_color = (60, 100, 50) if not active else (80, 120, 70)
-        self.draw.ellipse([x - px*8, y + px*2, x + px*8, y + px*5], fill=shadow_color)
+        draw.ellipse([x - px*8, y + px*2, x + px*8, y + px*5], fill=shadow_color)
 
         # Draw 5 rocks in a pile (back to front for proper layering)
-        rocks = [
-            # (x_offset, y_offset, width, height, color_idx)
-            (-px*4, -px*3, px*5, px*4, 0),   # Back left
-            (px*3, -px*2, px*4, px*3, 1),    # Back right
-            (-px*2, px*1, px*6, px*4, 2),    # Front left (large)
-            (px*4, px*2, px*5, px*3, 3),     # Front right
-            (px*1, -px*4, px*4, px*3, 0),    # Top center
-        ]
-
-        for i, (ox, oy, w, h, ci) in enumerate(rocks):
-            # Add individual rock shake when active
-            rock_shake = int(math.sin(frame * 0.5 + i * 1.5) * px) if active else 0
-            rx, ry = x + ox + shake, y + oy + rock_shake
+        for (ox, oy, w, h, ci), rock_shake in zip(self._ROCK_LAYOUT, rock_shakes):
+            rx, ry = x + ox * px + shake, y + oy * px + rock_shake
+            w *= px
+            h *= px
 
             base = rock_base[ci]
             highlight = rock_highlight[ci]
             shadow = rock_shadow[ci]
 
-            if active:
-                # Brighten when active
-                base = tuple(min(255, c + 25) for c in base)
-                highlight = tuple(min(255, c + 25) for c in highlight)
-
-            # Outline
-            self.draw.ellipse([rx - w - px, ry - h - px, rx + w + px, ry + h + px], fill=outline)
-            # Main rock body
-            self.draw.ellipse([rx - w, ry - h, rx + w, ry + h], fill=base)
+            # Main rock body with outline
+            draw.ellipse([rx - w - px, ry - h - px, rx + w + px, ry + h + px],
+                         fill=base, outline=outline, width=px)
             # Highlight on top-left
-            self.draw.ellipse([rx - w + px, ry - h + px, rx - px, ry - px], fill=highlight)
+            draw.ellipse([rx - w + px, ry - h + px, rx - px, ry - px], fill=highlight)
             # Shadow on bottom-right
-            self.draw.ellipse([rx + px, ry + px, rx + w - px, ry + h - px], fill=shadow)
+            draw.ellipse([rx + px, ry + px, rx + w - px, ry + h - px], fill=shadow)
 
         # Small pebbles around the base
-        pebble_positions = [(-px*7, px*3), (px*7, px*4), (-px*5, px*4), (px*6, px*3)]
-        for i, (px_off, py_off) in enumerate(pebble_positions):
-            peb_x, peb_y = x + px_off + shake, y + py_off
+        for i, (px_off, py_off) in enumerate(self._PEBBLE_OFFSETS):
+            peb_x, peb_y = x + px_off * px + shake, y + py_off * px
             peb_size = px + (i % 2)
-            self._safe_ellipse([peb_x - peb_size, peb_y - peb_size//2,
-                             peb_x + peb_size, peb_y + peb_size//2], fill=rock_base[i % 4])
-
-        # When active, show sparks and dust particles
-        if active:
-            # Sparks flying upward
-            for i in range(5):
-                spark_x = x + int(math.sin(frame * 0.25 + i * 1.2) * px * 6)
-                spark_y = y - px * 5 - int((frame * 2 + i * 7) % (px * 10))
-                spark_size = px if (frame + i) % 3 == 0 else px // 2
-                spark_color = (255, 220, 100) if i % 2 == 0 else (255, 180, 80)
-                self.draw.rectangle([spark_x - spark_size, spark_y - spark_size,
-                                   spark_x + spark_size, spark_y + spark_size], fill=spark_color)
-
-            # Dust puffs
-            for i in range(3):
-                dust_x = x + int(math.cos(frame * 0.12 + i * 2.5) * px * 7)
-                dust_y = y + px * 3 + int(math.sin(frame * 0.08 + i) * px)
-                dust_size = px * 2 + int(abs(math.sin(frame * 0.1 + i)) * px * 1.5)
-                dust_color = (180, 170, 160) if i % 2 == 0 else (160, 150, 140)
-                self.draw.ellipse([dust_x - dust_size, dust_y - dust_size,
-                                 dust_x + dust_size, dust_y + dust_size], fill=dust_color)
+            # Skip degenerate (zero-height) pebbles
+            if peb_size // 2 > 0:
+                draw.ellipse([peb_x - peb_size, peb_y - peb_size//2,
+                              peb_x + peb_size, peb_y + peb_size//2], fill=self._ROCK_BASE[i % 4])
 
     def _draw_sand_patch(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
         """Draw a sandy dig spot with shovel and writing/building area."""
+        if self._prop_offscreen(x, y, px):
+            return
+        sand_color = (230, 210, 170)
+        sand_light = (245, 230, 195)
+
+        # Idle, the shovel stays put and the whole spot is one cached sprite
+        if not active:
+            self._paste_prop(("sand_patch", px), x, y, px,
+                             lambda draw, ax, ay: self._draw_sand_patch_body(draw, ax, ay, px, 0))
+            return
+
+        phase_sin = self._phase_sines(frame)
+        self._draw_sand_patch_body(self.draw, x, y, px, int(phase_sin[0.1] * px * 0.5))
+
+        # Active: glowing area with writing/digging animation
+        glow_size = px * 6 + int(phase_sin[0.1] * px)
+        self.draw.ellipse([x - glow_size, y - glow_size//2 - px,
+                           x + glow_size, y + glow_size//2], fill=sand_light)
+
+        draw = self.draw
+        sin = math.sin
+
+        # Animated writing marks in the sand
+        write_cycle = frame % 120
+        num_marks = min((write_cycle // 15) + 1, 8)
+
+        for i in range(num_marks):
+            mx = x - px*3 + (i % 4) * px * 2
+            my = y - px * 2 + (i // 4) * px * 2
+
+            if i == num_marks - 1:
+                progress = (write_cycle % 15) / 15.0
+                stroke_len = int(px * 2 * progress)
+            else:
+                stroke_len = px * 2
+
+            stroke_color = (160, 140, 100)
+            if i % 3 == 0:
+                draw.line([(mx, my), (mx + stroke_len, my)], fill=stroke_color, width=max(1, px//2))
+            elif i % 3 == 1:
+                draw.line([(mx, my), (mx + stroke_len, my + stroke_len//2)], fill=stroke_color, width=max(1, px//2))
+            else:
+                draw.arc([mx, my - px, mx + stroke_len + px, my + px], 0, 180, fill=stroke_color, width=max(1, px//2))
+
+        # Sand flying up from digging
+        for i in range(4):
+            grain_x = x + int(sin(frame * 0.3 + i * 1.5) * px * 4)
+            grain_y = y - px * 3 - int((frame * 1.5 + i * 6) % 12) * px // 2
+            grain_size = px if i % 2 == 0 else px // 2
+            draw.rectangle([grain_x, grain_y, grain_x + grain_size, grain_y + grain_size], fill=sand_color)
+
+    def _draw_sand_patch_body(self, draw: ImageDraw.ImageDraw, x: int, y: int, px: int,
+                              shovel_bob: int) -> None:
+        """Draw the sand patch's shadow, sand, mound, shovel and stick around (x, y)."""
         sand_color = (230, 210, 170)
         sand_dark = (200, 180, 140)
         sand_light = (245, 230, 195)
@@ -757,33 +1134,31 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         metal_color = (180, 180, 190)
 
         # Ground shadow
-        self.draw.ellipse([x - px*10, y + px*3, x + px*10, y + px*5], fill=(60, 100, 50))
+        draw.ellipse([x - px*10, y + px*3, x + px*10, y + px*5], fill=(60, 100, 50))
 
         # Sandy area - larger base
-        self.draw.ellipse([x - px*8 - px, y - px*4 - px, x + px*8 + px, y + px*4 + px], fill=outline)
-        self.draw.ellipse([x - px*8, y - px*4, x + px*8, y + px*4], fill=sand_color)
-        self.draw.ellipse([x - px*5, y - px*2, x + px*5, y + px*2], fill=sand_light)
+        draw.ellipse([x - px*8 - px, y - px*4 - px, x + px*8 + px, y + px*4 + px], fill=sand_color, outline=outline, width=px)
+        draw.ellipse([x - px*5, y - px*2, x + px*5, y + px*2], fill=sand_light)
 
         # Small sand mound (dug up pile)
-        self.draw.ellipse([x + px*4, y - px*3, x + px*7, y - px], fill=sand_dark)
-        self.draw.ellipse([x + px*5, y - px*3, x + px*6, y - px*2], fill=sand_color)
+        draw.ellipse([x + px*4, y - px*3, x + px*7, y - px], fill=sand_dark)
+        draw.ellipse([x + px*5, y - px*3, x + px*6, y - px*2], fill=sand_color)
 
         # Shovel stuck in sand (shows this is for digging/building)
         shovel_x = x - px * 5
-        shovel_bob = int(math.sin(frame * 0.1) * px * 0.5) if active else 0
 
         # Shovel handle
-        self.draw.rectangle([shovel_x - px, y - px*10 + shovel_bob, shovel_x + px, y - px*2 + shovel_bob], fill=outline)
-        self.draw.rectangle([shovel_x - px//2, y - px*10 + shovel_bob, shovel_x + px//2, y - px*2 + shovel_bob], fill=wood_color)
+        draw.rectangle([shovel_x - px, y - px*10 + shovel_bob, shovel_x + px, y - px*2 + shovel_bob], fill=outline)
+        draw.rectangle([shovel_x - px//2, y - px*10 + shovel_bob, shovel_x + px//2, y - px*2 + shovel_bob], fill=wood_color)
 
         # Shovel blade
-        self.draw.polygon([
+        draw.polygon([
             (shovel_x - px*2, y - px*2 + shovel_bob),
             (shovel_x + px*2, y - px*2 + shovel_bob),
             (shovel_x + px, y + px + shovel_bob),
             (shovel_x - px, y + px + shovel_bob)
         ], fill=outline)
-        self.draw.polygon([
+        draw.polygon([
             (shovel_x - px*1.5, y - px*1.5 + shovel_bob),
             (shovel_x + px*1.5, y - px*1.5 + shovel_bob),
             (shovel_x + px*0.5, y + shovel_bob),
@@ -792,111 +1167,62 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         # Writing stick/twig next to dig area
         stick_x = x + px * 2
-        self.draw.line([(stick_x, y - px*2), (stick_x + px*3, y + px)], fill=wood_color, width=max(1, px))
-
-        # When active, show writing/digging animation
-        if active:
-            # Glowing active area
-            glow_size = px * 6 + int(math.sin(frame * 0.1) * px)
-            self._safe_ellipse([x - glow_size, y - glow_size//2 - px,
-                             x + glow_size, y + glow_size//2], fill=sand_light)
-
-            # Animated writing marks in the sand
-            write_cycle = frame % 120
-            num_marks = min((write_cycle // 15) + 1, 8)
-
-            for i in range(num_marks):
-                mx = x - px*3 + (i % 4) * px * 2
-                my = y - px * 2 + (i // 4) * px * 2
-
-                if i == num_marks - 1:
-                    progress = (write_cycle % 15) / 15.0
-                    stroke_len = int(px * 2 * progress)
-                else:
-                    stroke_len = px * 2
-
-                stroke_color = (160, 140, 100)
-                if i % 3 == 0:
-                    self.draw.line([(mx, my), (mx + stroke_len, my)], fill=stroke_color, width=max(1, px//2))
-                elif i % 3 == 1:
-                    self.draw.line([(mx, my), (mx + stroke_len, my + stroke_len//2)], fill=stroke_color, width=max(1, px//2))
-                else:
-                    self.draw.arc([mx, my - px, mx + stroke_len + px, my + px], 0, 180, fill=stroke_color, width=max(1, px//2))
-
-            # Sand flying up from digging
-            for i in range(4):
-                grain_x = x + int(math.sin(frame * 0.3 + i * 1.5) * px * 4)
-                grain_y = y - px * 3 - int((frame * 1.5 + i * 6) % 12) * px // 2
-                grain_size = px if i % 2 == 0 else px // 2
-                self.draw.rectangle([grain_x, grain_y, grain_x + grain_size, grain_y + grain_size], fill=sand_color)
-
+        draw.line([(stick_x, y - px*2), (stick_x + px*3, y + px)], fill=wood_color, width=max(1, px))
     def _draw_tide_pool(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
         """Draw a magical scrying pool for web fetching/searching."""
-        water_color = (80, 140, 200)
+        if self._prop_offscreen(x, y, px):
+            return
         water_light = (120, 180, 230)
-        water_deep = (50, 100, 160)
         outline = self.COLORS["outline"]
-        stone_color = (140, 135, 130)
-        stone_light = (170, 165, 160)
         magic_glow = (180, 220, 255)
 
-        # Ground shadow
-        self.draw.ellipse([x - px*8, y + px*3, x + px*8, y + px*5], fill=(60, 100, 50))
-
-        # Stone rim around pool (makes it look intentional, not just a puddle)
-        self.draw.ellipse([x - px*7 - px, y - px*4 - px, x + px*7 + px, y + px*4 + px], fill=outline)
-        self.draw.ellipse([x - px*7, y - px*4, x + px*7, y + px*4], fill=stone_color)
-        self.draw.ellipse([x - px*6, y - px*3, x + px*4, y + px*3], fill=stone_light)
+        # Shadow, stone rim and water never change - one cached sprite
+        self._paste_prop(("tide_pool", px), x, y, px,
+                         lambda draw, ax, ay: self._draw_tide_pool_base(draw, ax, ay, px))
 
-        # Pool water inside stone rim
-        self.draw.ellipse([x - px*5, y - px*3, x + px*5, y + px*3], fill=water_deep)
-        self.draw.ellipse([x - px*4, y - px*2, x + px*4, y + px*2], fill=water_color)
+        draw = self.draw
+        phase_sin = self._phase_sines(frame)
 
         # Magical sparkles on surface (shows it's for searching/fetching)
-        for i in range(4):
-            sparkle_phase = (frame * 0.1 + i * 1.5) % (math.pi * 2)
-            sparkle_x = x + int(math.cos(sparkle_phase + i) * px * 3)
-            sparkle_y = y + int(math.sin(sparkle_phase + i) * px * 1.5)
-            if (frame + i * 7) % 20 < 12:
-                self.draw.rectangle([sparkle_x - px//2, sparkle_y - px//2,
-                                   sparkle_x + px//2, sparkle_y + px//2], fill=magic_glow)
+        xs, ys, visible = pool_sparkles(frame, x, y, px)
+        for sparkle_x, sparkle_y, shown in zip(xs.tolist(), ys.tolist(), visible.tolist()):
+            if shown:
+                draw.rectangle([sparkle_x - px//2, sparkle_y - px//2,
+                              sparkle_x + px//2, sparkle_y + px//2], fill=magic_glow)
 
         # Magnifying glass icon floating above (shows it's for searching)
-        glass_bob = int(math.sin(frame * 0.06) * px)
+        glass_bob = int(phase_sin[0.06] * px)
         glass_x = x + px * 3
         glass_y = y - px * 6 + glass_bob
         # Glass lens (circle)
-        self.draw.ellipse([glass_x - px*2 - px, glass_y - px*2 - px,
-                         glass_x + px*2 + px, glass_y + px*2 + px], fill=outline)
-        self.draw.ellipse([glass_x - px*2, glass_y - px*2,
-                         glass_x + px*2, glass_y + px*2], fill=water_light)
+        draw.ellipse([glass_x - px*2 - px, glass_y - px*2 - px,
+                    glass_x + px*2 + px, glass_y + px*2 + px],
+                    fill=water_light, outline=outline, width=px)
         # Glass handle
         handle_start_x = glass_x + px * 2
         handle_start_y = glass_y + px * 2
-        self.draw.line([(handle_start_x, handle_start_y),
-                       (handle_start_x + px * 2, handle_start_y + px * 2)],
-                      fill=outline, width=max(2, px))
+        draw.line([(handle_start_x, handle_start_y),
+                  (handle_start_x + px * 2, handle_start_y + px * 2)],
+                 fill=outline, width=max(2, px))
 
         # When active, show fetching/searching animation
         if active:
             # Glowing center - something being retrieved
-            glow_pulse = abs(math.sin(frame * 0.15))
+            glow_pulse = abs(phase_sin[0.15])
             glow_color = (int(140 + 80 * glow_pulse), int(200 + 50 * glow_pulse), int(255))
             glow_size = int(px * 3 + glow_pulse * px * 2)
-            self._safe_ellipse([x - glow_size, y - glow_size//2,
-                             x + glow_size, y + glow_size//2], fill=glow_color)
+            self.draw.ellipse([x - glow_size, y - glow_size//2,
+                               x + glow_size, y + glow_size//2], fill=glow_color)
 
             # Data/information rising from pool
-            for i in range(5):
-                data_phase = (frame * 0.5 + i * 8) % 25
-                dx = x + int(math.sin(frame * 0.15 + i * 1.2) * px * 4)
-                dy = y - px * 2 - int(data_phase * px * 0.6)
-                if data_phase < 20:
+            xs, ys, visible = pool_data(frame, x, y, px)
+            for i, (dx, dy, shown) in enumerate(zip(xs.tolist(), ys.tolist(), visible.tolist())):
+                if shown:
                     # Small rectangles representing data
                     data_w = px * (2 if i % 2 == 0 else 1)
                     data_h = px
-                    self.draw.rectangle([dx - data_w//2, dy - data_h//2,
-                                       dx + data_w//2, dy + data_h//2], fill=magic_glow)
+                    draw.rectangle([dx - data_w//2, dy - data_h//2,
+                                  dx + data_w//2, dy + data_h//2], fill=magic_glow)
 
             # Ripple rings expanding outward
             for i in range(3):
@@ -904,298 +1230,395 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 ring_size = int(px * 2 + ring_phase * px * 2)
                 ring_alpha = 1.0 - (ring_phase / 3.0)
                 if ring_alpha > 0.2:
-                    self._safe_ellipse([x - ring_size, y - ring_size//2,
-                                     x + ring_size, y + ring_size//2],
-                                    outline=magic_glow, width=max(1, int(px * ring_alpha * 1.5)))
+                    self.draw.ellipse([x - ring_size, y - ring_size//2,
+                                       x + ring_size, y + ring_size//2],
+                                      outline=magic_glow, width=max(1, int(px * ring_alpha * 1.5)))
+
+    def _draw_tide_pool_base(self, draw: ImageDraw.ImageDraw, x: int, y: int, px: int) -> None:
+        """Draw the tide pool's shadow, stone rim and water around (x, y)."""
+        water_color = (80, 140, 200)
+        water_deep = (50, 100, 160)
+        outline = self.COLORS["outline"]
+        stone_color = (140, 135, 130)
+        stone_light = (170, 165, 160)
+
+        # Ground shadow
+        draw.ellipse([x - px*8, y + px*3, x + px*8, y + px*5], fill=(60, 100, 50))
+
+        # Stone rim around pool (makes it look intentional, not just a puddle)
+        draw.ellipse([x - px*7 - px, y - px*4 - px, x + px*7 + px, y + px*4 + px], fill=stone_color, outline=outline, width=px)
+        draw.ellipse([x - px*6, y - px*3, x + px*4, y + px*3], fill=stone_light)
+
+        # Pool water inside stone rim
+        draw.ellipse([x - px*5, y - px*3, x + px*5, y + px*3], fill=water_deep)
+        draw.ellipse([x - px*4, y - px*2, x + px*4, y + px*2], fill=water_color)
 
     def _draw_bush(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
         """Draw bushes for searching with berries and depth."""
+        if self._prop_offscreen(x, y, px):
+            return
+        bush_color = (75, 135, 65)
+        bush_light = (95, 165, 85)
+        bush_dark = (55, 105, 45)
+
+        # Idle bushes hold still - paste shadow, blobs and berries as one cached sprite
+        if not active:
+            self._paste_prop(("bush", px), x, y, px, lambda draw, ax, ay: self._draw_bush_body(
+                draw, ax, ay, px, (60, 100, 50), 0, self._NO_JIGGLE, self._NO_JIGGLE))
+            return
+
+        # When active, bushes shake more dramatically, blobs and berries individually
+        phase_sin = self._phase_sines(frame)
+        base_rustle = int(phase_sin[0.5] * px * 2)
+        blob_rustles = [int(math.sin(frame * 0.6 + i * 1.2) * px) for i in range(6)]
+        berry_rustles = [int(math.sin(frame * 0.6 + i * 0.8) * px * 0.5) for i in range(5)]
+        self._draw_bush_body(self.draw, x, y, px, (80, 120, 70), base_rustle, blob_rustles, berry_rustles)
+
+        draw = self.draw
+        sin = math.sin
+
+        # Leaves flying out from searching
+        half_px = px // 2
+        if half_px:
+            xs, ys, visible = bush_leaves(frame, x, y, px)
+            for i, (leaf_x, leaf_y, shown) in enumerate(zip(xs.tolist(), ys.tolist(), visible.tolist())):
+                leaf_color = bush_light if i % 2 == 0 else bush_color
+                if shown:
+                    draw.ellipse([leaf_x - px, leaf_y - half_px, leaf_x + px, leaf_y + half_px], fill=leaf_color)
+
+        # Parting effect - darker gap in center showing Claude is looking inside
+        gap_x = x + int(phase_sin[0.1] * px)
+        draw.ellipse([gap_x - px*2, y - px*2, gap_x + px*2, y + px], fill=bush_dark)
+
+        # Sparkle/search particles rising up
+        for i in range(3):
+            search_x = x + int(sin(frame * 0.15 + i * 2.5) * px * 5)
+            search_y = y - px * 5 - int((frame * 0.8 + i * 6) % (px * 8))
+            search_size = px if (frame + i * 3) % 5 < 3 else px // 2
+            draw.rectangle([search_x - search_size, search_y - search_size,
+                          search_x + search_size, search_y + search_size], fill=(255, 255, 200))
+
+    def _draw_bush_body(self, draw: ImageDraw.ImageDraw, x: int, y: int, px: int, shadow_color: tuple,
+                        base_rustle: int, blob_rustles, berry_rustles) -> None:
+        """Draw the bush's ground shadow, blobs and berries around (x, y)."""
         bush_color = (75, 135, 65)
         bush_light = (95, 165, 85)
         bush_mid = (85, 150, 75)
         bush_dark = (55, 105, 45)
         outline = self.COLORS["outline"]
         berry_red = (200, 60, 70)
+        ellipse = draw.ellipse
 
         # Ground shadow
-        shadow_color = (60, 100, 50) if not active else (80, 120, 70)
-        self.draw.ellipse([x - px*8, y + px*3, x + px*8, y + px*5], fill=shadow_color)
-
-        # When active, bushes shake more dramatically
-        base_rustle = int(math.sin(frame * 0.5) * px * 2) if active else 0
+        ellipse([x - px*8, y + px*3, x + px*8, y + px*5], fill=shadow_color)
 
         # Multiple bush blobs arranged for depth
-        blobs = [
-            # (x_off, y_off, width, height, color)
-            (-px*4, px*1, px*4, px*3, bush_dark),   # Back left
-            (px*3, -px*1, px*4, px*3, bush_dark),   # Back right
-            (-px*1, -px*2, px*5, px*4, bush_mid),   # Back center
-            (-px*3, px*2, px*5, px*3, bush_color),  # Front left
-            (px*2, px*2, px*5, px*3, bush_color),   # Front right
-            (0, px*1, px*4, px*3, bush_light),      # Front center highlight
-        ]
-
-        for i, (ox, oy, w, h, color) in enumerate(blobs):
-            # Individual rustle for each blob
-            blob_rustle = int(math.sin(frame * 0.6 + i * 1.2) * px) if active else 0
-            bx, by = x + ox + base_rustle + blob_rustle, y + oy
-            # Outline
-            self.draw.ellipse([bx - w - px, by - h - px, bx + w + px, by + h + px], fill=outline)
-            # Bush body
-            self.draw.ellipse([bx - w, by - h, bx + w, by + h], fill=color)
-            # Small highlight blob
-            if i >= 3:  # Only on front bushes
-                self._safe_ellipse([bx - w//2, by - h + px, bx, by - px], fill=bush_light)
+        shades = (bush_dark, bush_mid, bush_color, bush_light)
+        for i, (ox, oy, w, h, shade) in enumerate(self._BUSH_BLOBS):
+            bx, by = x + ox * px + base_rustle + blob_rustles[i], y + oy * px
+            w *= px
+            h *= px
+            color = shades[shade]
+            ellipse([bx - w - px, by - h - px, bx + w + px, by + h + px], fill=color, outline=outline, width=px)
+            if i >= 3:  # Highlight only on front bushes
+                ellipse([bx - w//2, by - h + px, bx, by - px], fill=bush_light)
 
         # Add berries scattered on the bush
-        berry_positions = [(-px*3, 0), (px*2, px), (-px, -px*2), (px*4, -px), (-px*5, px*2)]
-        for i, (bx_off, by_off) in enumerate(berry_positions):
-            # Berry sway with bush
-            berry_rustle = int(math.sin(frame * 0.6 + i * 0.8) * px * 0.5) if active else 0
-            bx, by = x + bx_off + base_rustle + berry_rustle, y + by_off
+        # The berry highlight is empty at the smallest pixel size
+        half_px = px // 2
+        for (bx_off, by_off), berry_rustle in zip(self._BERRY_OFFSETS, berry_rustles):
+            bx, by = x + bx_off * px + base_rustle + berry_rustle, y + by_off * px
             # Berry with highlight
-            self.draw.ellipse([bx - px, by - px, bx + px, by + px], fill=berry_red)
-            self._safe_ellipse([bx - px//2, by - px//2, bx, by], fill=(255, 100, 110))
+            ellipse([bx - px, by - px, bx + px, by + px], fill=berry_red)
+            if half_px:
+                ellipse([bx - half_px, by - half_px, bx, by], fill=(255, 100, 110))
+
+    def _draw_message_bottle(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
+        """Draw a beach mailbox/message station for asking questions."""
+        if self._prop_offscreen(x, y, px):
+            return
+        outline = self.COLORS["outline"]
+        paper_color = (255, 250, 230)
+        mailbox_y = y - px * 10
+        phase_sin = self._phase_sines(frame)
 
-        # When active, show leaves flying out and a peek effect
+        # Shadow, post and mailbox; idle (flag down) it is one cached sprite
         if active:
-            # Leaves flying out from searching
-            for i in range(5):
-                leaf_phase = (frame * 0.3 + i * 7) % 25
-                leaf_x = x + int(math.cos(frame * 0.2 + i * 1.3) * (px * 4 + leaf_phase * px * 0.6))
-                leaf_y = y - px * 3 - int(leaf_phase * px * 0.5)
-                leaf_color = bush_light if i % 2 == 0 else bush_color
-                if leaf_phase < 18:
-                    self._safe_ellipse([leaf_x - px, leaf_y - px//2, leaf_x + px, leaf_y + px//2], fill=leaf_color)
+            # Glow behind the mailbox
+            self.draw.ellipse([x - px*5, mailbox_y - px*3, x + px*5, mailbox_y + px*3], fill=(255, 255, 200))
+            self._draw_message_bottle_body(self.draw, x, y, px, int(phase_sin[0.2] * px * 0.5))
+        else:
+            self._paste_prop(("mailbox", px), x, y, px,
+                             lambda draw, ax, ay: self._draw_message_bottle_body(draw, ax, ay, px, None))
 
-            # Parting effect - darker gap in center showing Claude is looking inside
-            gap_x = x + int(math.sin(frame * 0.1) * px)
-            self.draw.ellipse([gap_x - px*2, y - px*2, gap_x + px*2, y + px], fill=bush_dark)
+        # Question mark icon floating nearby
+        qmark_bob = int(phase_sin[0.06] * px)
+        qmark_x = x - px * 5
+        qmark_y = y - px * 12 + qmark_bob
+        # Question mark bubble
+        self.draw.ellipse([qmark_x - px*2 - px, qmark_y - px*2 - px, qmark_x + px*2 + px, qmark_y + px*2 + px], fill=(255, 255, 255), outline=outline, width=px)
+        # "?" character (simplified)
+        self.draw.arc([qmark_x - px, qmark_y - px*1.5, qmark_x + px, qmark_y + px*0.5], 180, 0, fill=(80, 80, 80), width=max(1, px))
+        half_px = px // 2
+        if half_px:
+            self.draw.ellipse([qmark_x - half_px, qmark_y + half_px, qmark_x + half_px, qmark_y + px], fill=(80, 80, 80))
 
-            # Sparkle/search particles rising up
+        # When active, show message being sent
+        if active:
+            draw = self.draw
+            sin = math.sin
+            px2 = px * 2
+
+            # Letters/envelopes floating out
+            letter_base = frame * 0.3
+            drift_phase = frame * 0.1
+            letter_top = mailbox_y - px2
             for i in range(3):
-                search_x = x + int(math.sin(frame * 0.15 + i * 2.5) * px * 5)
-                search_y = y - px * 5 - int((frame * 0.8 + i * 6) % (px * 8))
-                search_size = px if (frame + i * 3) % 5 < 3 else px // 2
-                self.draw.rectangle([search_x - search_size, search_y - search_size,
-                                   search_x + search_size, search_y + search_size], fill=(255, 255, 200))
+                letter_phase = (letter_base + i * 10) % 30
+                if letter_phase < 25:
+                    lx = x + int(sin(drift_phase + i * 2) * px * 4)
+                    ly = letter_top - int(letter_phase * px * 0.5)
+                    # Envelope
+                    draw.rectangle([lx - px2, ly - px, lx + px2, ly + px], fill=paper_color)
+                    # Envelope flap
+                    draw.polygon([(lx - px2, ly - px), (lx, ly), (lx + px2, ly - px)], fill=(230, 220, 200))
 
-    def _draw_message_bottle(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
-        """Draw a beach mailbox/message station for asking questions."""
+            # Sparkles
+            xs, ys, visible = mailbox_sparkles(frame, x, mailbox_y, px)
+            for sparkle_x, sparkle_y, shown in zip(xs.tolist(), ys.tolist(), visible.tolist()):
+                if shown:
+                    draw.rectangle([sparkle_x - half_px, sparkle_y - half_px,
+                                    sparkle_x + half_px, sparkle_y + half_px], fill=(255, 255, 150))
+
+    def _draw_message_bottle_body(self, draw: ImageDraw.ImageDraw, x: int, y: int, px: int,
+                                  flag_bob: int | None) -> None:
+        """Draw the mailbox's shadow, sand, post, box and flag around (x, y).
+
+        ``flag_bob`` raises the flag at that bob offset; None leaves it down.
+        """
         outline = self.COLORS["outline"]
         wood_color = (140, 100, 60)
         wood_dark = (100, 70, 40)
         wood_light = (180, 140, 100)
-        paper_color = (255, 250, 230)
         sand_color = self.COLORS["sand"]
 
         # Ground shadow
-        self.draw.ellipse([x - px*6, y + px*3, x + px*6, y + px*5], fill=(60, 100, 50))
+        draw.ellipse([x - px*6, y + px*3, x + px*6, y + px*5], fill=(60, 100, 50))
 
         # Sandy base patch (this is on the beach)
-        self.draw.ellipse([x - px*5, y + px, x + px*5, y + px*4], fill=sand_color)
+        draw.ellipse([x - px*5, y + px, x + px*5, y + px*4], fill=sand_color)
 
         # Wooden post holding mailbox
-        self.draw.rectangle([x - px - px, y - px*8, x + px + px, y + px*2], fill=outline)
-        self.draw.rectangle([x - px, y - px*8, x + px, y + px*2], fill=wood_color)
-        self.draw.rectangle([x - px//2, y - px*8, x, y + px*2], fill=wood_dark)
+        draw.rectangle([x - px - px, y - px*8, x + px + px, y + px*2], fill=outline)
+        draw.rectangle([x - px, y - px*8, x + px, y + px*2], fill=wood_color)
+        draw.rectangle([x - px//2, y - px*8, x, y + px*2], fill=wood_dark)
 
         # Mailbox body on top of post
         mailbox_y = y - px * 10
         # Mailbox back
-        self.draw.rectangle([x - px*4 - px, mailbox_y - px*2 - px, x + px*4 + px, mailbox_y + px*2 + px], fill=outline)
-        self.draw.rectangle([x - px*4, mailbox_y - px*2, x + px*4, mailbox_y + px*2], fill=wood_color)
-        self.draw.rectangle([x - px*4, mailbox_y - px*2, x - px*2, mailbox_y + px*2], fill=wood_light)
+        draw.rectangle([x - px*4 - px, mailbox_y - px*2 - px, x + px*4 + px, mailbox_y + px*2 + px], fill=wood_color, outline=outline, width=px)
+        draw.rectangle([x - px*4, mailbox_y - px*2, x - px*2, mailbox_y + px*2], fill=wood_light)
         # Mailbox opening
-        self.draw.rectangle([x - px*2, mailbox_y - px, x + px*2, mailbox_y + px], fill=wood_dark)
+        draw.rectangle([x - px*2, mailbox_y - px, x + px*2, mailbox_y + px], fill=wood_dark)
 
         # Flag on mailbox (up when active = asking question)
-        flag_color = (200, 50, 50) if active else (150, 40, 40)
         flag_x = x + px * 4
         flag_y = mailbox_y - px * 2
         # Flag pole
-        self.draw.rectangle([flag_x, flag_y, flag_x + px, mailbox_y + px*2], fill=outline)
+        draw.rectangle([flag_x, flag_y, flag_x + px, mailbox_y + px*2], fill=outline)
         # Flag (raised when active)
-        if active:
-            flag_bob = int(math.sin(frame * 0.2) * px * 0.5)
-            self.draw.rectangle([flag_x + px, flag_y - px*2 + flag_bob, flag_x + px*4, flag_y + px + flag_bob], fill=flag_color)
+        if flag_bob is not None:
+            draw.rectangle([flag_x + px, flag_y - px*2 + flag_bob, flag_x + px*4, flag_y + px + flag_bob], fill=(200, 50, 50))
         else:
-            self.draw.rectangle([flag_x + px, mailbox_y, flag_x + px*4, mailbox_y + px*3], fill=flag_color)
-
-        # Question mark icon floating nearby
-        qmark_bob = int(math.sin(frame * 0.06) * px)
-        qmark_x = x - px * 5
-        qmark_y = y - px * 12 + qmark_bob
-        # Question mark bubble
-        self.draw.ellipse([qmark_x - px*2 - px, qmark_y - px*2 - px, qmark_x + px*2 + px, qmark_y + px*2 + px], fill=outline)
-        self.draw.ellipse([qmark_x - px*2, qmark_y - px*2, qmark_x + px*2, qmark_y + px*2], fill=(255, 255, 255))
-        # "?" character (simplified)
-        self.draw.arc([qmark_x - px, qmark_y - px*1.5, qmark_x + px, qmark_y + px*0.5], 180, 0, fill=(80, 80, 80), width=max(1, px))
-        self._safe_ellipse([qmark_x - px//2, qmark_y + px//2, qmark_x + px//2, qmark_y + px], fill=(80, 80, 80))
-
-        # When active, show message being sent
-        if active:
-            # Glowing mailbox
-            abs(math.sin(frame * 0.12))
-            glow_color = (255, 255, 200)
-            self.draw.ellipse([x - px*5, mailbox_y - px*3, x + px*5, mailbox_y + px*3], fill=glow_color)
-            # Redraw mailbox on glow
-            self.draw.rectangle([x - px*4, mailbox_y - px*2, x + px*4, mailbox_y + px*2], fill=wood_color)
-
-            # Letters/envelopes floating out
-            for i in range(3):
-                letter_phase = (frame * 0.3 + i * 10) % 30
-                lx = x + int(math.sin(frame * 0.1 + i * 2) * px * 4)
-                ly = mailbox_y - px * 2 - int(letter_phase * px * 0.5)
-                if letter_phase < 25:
-                    # Envelope
-                    self.draw.rectangle([lx - px*2, ly - px, lx + px*2, ly + px], fill=paper_color)
-                    # Envelope flap
-                    self.draw.polygon([(lx - px*2, ly - px), (lx, ly), (lx + px*2, ly - px)], fill=(230, 220, 200))
-
-            # Sparkles
-            for i in range(4):
-                sparkle_angle = frame * 0.1 + i * 1.5
-                sparkle_x = x + int(math.cos(sparkle_angle) * px * 6)
-                sparkle_y = mailbox_y + int(math.sin(sparkle_angle) * px * 4)
-                if (frame + i * 6) % 15 < 10:
-                    self.draw.rectangle([sparkle_x - px//2, sparkle_y - px//2,
-                                       sparkle_x + px//2, sparkle_y + px//2], fill=(255, 255, 150))
+            draw.rectangle([flag_x + px, mailbox_y, flag_x + px*4, mailbox_y + px*3], fill=(150, 40, 40))
 
     def _draw_thinking_spot(self, x: int, y: int, px: int, frame: int, active: bool = False) -> None:
         """Draw a meditation stone/thinking pedestal on the hilltop."""
+        if self._prop_offscreen(x, y, px):
+            return
         outline = self.COLORS["outline"]
-        stone_base = (160, 155, 150)
-        stone_light = (190, 185, 180)
+        phase_sin = self._phase_sines(frame)
 
-        # Ground shadow
-        self.draw.ellipse([x - px*6, y + px*2, x + px*6, y + px*4], fill=(60, 100, 50))
+        # Glowing aura behind the pedestal when active
+        if active:
+            aura_pulse = int(abs(phase_sin[0.08]) * px * 2)
+            self.draw.ellipse([x - px*6 - aura_pulse, y - px*4 - aura_pulse,
+                               x + px*6 + aura_pulse, y + px*3 + aura_pulse], fill=(255, 255, 220))
 
-        # Stone pedestal base (wide flat stone)
-        self.draw.ellipse([x - px*5 - px, y - px, x + px*5 + px, y + px*3 + px], fill=outline)
-        self.draw.ellipse([x - px*5, y - px, x + px*5, y + px*3], fill=stone_base)
-        self.draw.ellipse([x - px*3, y - px, x + px*2, y + px*2], fill=stone_light)
-
-        # Meditation cushion on top (inviting spot to sit and think)
-        cushion_color = (180, 100, 120) if not active else (220, 120, 140)
-        cushion_light = (210, 140, 160)
-        self.draw.ellipse([x - px*3 - px, y - px*3 - px, x + px*3 + px, y + px], fill=outline)
-        self.draw.ellipse([x - px*3, y - px*3, x + px*3, y], fill=cushion_color)
-        self.draw.ellipse([x - px*2, y - px*3, x + px, y - px], fill=cushion_light)
+        # Shadow, stone pedestal and cushion don't move - one cached sprite per cushion colour
+        self._paste_prop(("thinking_spot", px, active), x, y, px,
+                         lambda draw, ax, ay: self._draw_thinking_spot_base(draw, ax, ay, px, active))
 
         # Floating thought bubble icon above (shows purpose)
-        bubble_bob = int(math.sin(frame * 0.05) * px)
+        bubble_bob = int(phase_sin[0.05] * px)
         bubble_y = y - px * 8 + bubble_bob
         # Bubble outline and fill
-        self.draw.ellipse([x - px*3 - px, bubble_y - px*2 - px, x + px*3 + px, bubble_y + px*2 + px], fill=outline)
-        self.draw.ellipse([x - px*3, bubble_y - px*2, x + px*3, bubble_y + px*2], fill=(255, 255, 255))
+        self.draw.ellipse([x - px*3 - px, bubble_y - px*2 - px, x + px*3 + px, bubble_y + px*2 + px], fill=(255, 255, 255), outline=outline, width=px)
         # Small connecting dots
         self.draw.ellipse([x - px, y - px*5 + bubble_bob, x + px, y - px*4 + bubble_bob], fill=(255, 255, 255))
-        self._safe_ellipse([x - px//2, y - px*6 + bubble_bob, x + px//2, y - px*5 + bubble_bob], fill=(255, 255, 255))
-        # "..." dots inside bubble (thinking indicator)
-        dot_y = bubble_y
-        for i in range(3):
-            dot_x = x - px*2 + i * px * 2
-            self._safe_ellipse([dot_x - px//2, dot_y - px//2, dot_x + px//2, dot_y + px//2], fill=(100, 100, 100))
+        half_px = px // 2
+        if half_px:
+            ellipse = self.draw.ellipse
+            ellipse([x - half_px, y - px*6 + bubble_bob, x + half_px, y - px*5 + bubble_bob], fill=(255, 255, 255))
+            # "..." dots inside bubble (thinking indicator)
+            dot_y = bubble_y
+            for i in range(3):
+                dot_x = x - px*2 + i * px * 2
+                ellipse([dot_x - half_px, dot_y - half_px, dot_x + half_px, dot_y + half_px], fill=(100, 100, 100))
 
         # When active, show elaborate thinking effects
         if active:
-            # Glowing aura around pedestal
-            aura_pulse = int(abs(math.sin(frame * 0.08)) * px * 2)
-            self.draw.ellipse([x - px*6 - aura_pulse, y - px*4 - aura_pulse,
-                             x + px*6 + aura_pulse, y + px*3 + aura_pulse], fill=(255, 255, 220))
-
-            # Redraw cushion on top of aura
-            self.draw.ellipse([x - px*3 - px, y - px*3 - px, x + px*3 + px, y + px], fill=outline)
-            self.draw.ellipse([x - px*3, y - px*3, x + px*3, y], fill=(220, 120, 140))
+            draw = self.draw
+            sin = math.sin
 
             # Orbiting thought sparkles
-            for i in range(6):
-                angle = frame * 0.08 + i * math.pi / 3
-                dist = px * 6 + int(math.sin(frame * 0.15 + i * 0.7) * px * 2)
-                sx = x + int(math.cos(angle) * dist)
-                sy = y - px * 4 + int(math.sin(angle) * dist * 0.4)
-                sparkle_size = px + int(abs(math.sin(frame * 0.1 + i)) * px)
-                sparkle_color = [(255, 255, 180), (255, 220, 150), (200, 255, 200)][i % 3]
-                if (frame + i * 5) % 20 < 15:
-                    self.draw.rectangle([sx - sparkle_size, sy - sparkle_size,
-                                       sx + sparkle_size, sy + sparkle_size], fill=sparkle_color)
+            sparkle_colors = self._THOUGHT_SPARKLE_COLORS
+            xs, ys, sizes, visible = thinking_sparkles(frame, x, y, px)
+            for i, (sx, sy, sparkle_size, shown) in enumerate(
+                    zip(xs.tolist(), ys.tolist(), sizes.tolist(), visible.tolist())):
+                if shown:
+                    draw.rectangle([sx - sparkle_size, sy - sparkle_size,
+                                    sx + sparkle_size, sy + sparkle_size], fill=sparkle_colors[i % 3])
 
             # Rising thought bubbles
+            rise_phase = frame * 0.2
+            drift_phase = frame * 0.05
+            rise_base_y = y - px * 6
             for i in range(3):
-                bubble_phase = (frame * 0.2 + i * 12) % 30
-                bx = x + int(math.sin(frame * 0.05 + i * 2) * px * 4)
-                by = y - px * 6 - int(bubble_phase * px * 0.7)
-                bsize = px * (3 - i) // 2 + px
+                bubble_phase = (rise_phase + i * 12) % 30
                 if bubble_phase < 25:
-                    self.draw.ellipse([bx - bsize - px, by - bsize - px,
-                                     bx + bsize + px, by + bsize + px], fill=outline)
-                    self.draw.ellipse([bx - bsize, by - bsize, bx + bsize, by + bsize], fill=(255, 255, 255))
+                    bx = x + int(sin(drift_phase + i * 2) * px * 4)
+                    by = rise_base_y - int(bubble_phase * px * 0.7)
+                    bsize = px * (3 - i) // 2 + px
+                    draw.ellipse([bx - bsize - px, by - bsize - px,
+                                  bx + bsize + px, by + bsize + px],
+                                 fill=(255, 255, 255), outline=outline, width=px)
+
+    def _draw_thinking_spot_base(self, draw: ImageDraw.ImageDraw, x: int, y: int, px: int,
+                                 active: bool) -> None:
+        """Draw the thinking spot's shadow, stone pedestal and cushion around (x, y)."""
+        outline = self.COLORS["outline"]
+        stone_base = (160, 155, 150)
+        stone_light = (190, 185, 180)
+
+        # Ground shadow
+        draw.ellipse([x - px*6, y + px*2, x + px*6, y + px*4], fill=(60, 100, 50))
+
+        # Stone pedestal base (wide flat stone)
+        draw.ellipse([x - px*5 - px, y - px, x + px*5 + px, y + px*3 + px], fill=outline)
+        draw.ellipse([x - px*5, y - px, x + px*5, y + px*3], fill=stone_base)
+        draw.ellipse([x - px*3, y - px, x + px*2, y + px*2], fill=stone_light)
+
+        # Meditation cushion on top (inviting spot to sit and think)
+        cushion_color = (180, 100, 120) if not active else (220, 120, 140)
+        cushion_light = (210, 140, 160)
+        draw.ellipse([x - px*3 - px, y - px*3 - px, x + px*3 + px, y + px], fill=cushion_color, outline=outline, width=px)
+        draw.ellipse([x - px*2, y - px*3, x + px, y - px], fill=cushion_light)
+
+    def _init_ambient_particles(self, count: int = 12) -> None:
+        """Precompute ambient particle constants as parallel numpy arrays.
+
+        Each particle keeps its own seeded RNG so the layout matches the
+        original per-frame ``random.seed(i * 777)`` placement exactly.
+        """
+        self._amb_x = np.empty(count, dtype=np.float64)
+        self._amb_y = np.empty(count, dtype=np.float64)
+        self._amb_speed = np.empty(count, dtype=np.float64)
+        self._amb_phase = np.empty(count, dtype=np.float64)
+        self._amb_index = np.arange(count, dtype=np.float64)
+
+        for i in range(count):
+            rng = random.Random(i * 777)
+            self._amb_x[i] = rng.randint(0, self.width)
+            self._amb_y[i] = rng.randint(int(self.height * 0.25), int(self.height * 0.85))
+            self._amb_speed[i] = rng.uniform(0.3, 0.8)
+            rng.uniform(0.1, 0.3)  # Vertical speed (unused) - keeps the sequence stable
+            self._amb_phase[i] = rng.uniform(0, math.pi * 2)
 
     def _draw_ambient_particles(self, frame: int, phase: str, px: int) -> None:
         """Draw floating ambient particles for a living world feel."""
-        import random
-
-        # Use frame-based seed for consistent but animated particles
-        num_particles = 12
-
-        for i in range(num_particles):
-            # Each particle has its own movement pattern
-            random.seed(i * 777)
-            base_x = random.randint(0, self.width)
-            base_y = random.randint(int(self.height * 0.25), int(self.height * 0.85))
-            speed_x = random.uniform(0.3, 0.8)
-            random.uniform(0.1, 0.3)
-            phase_offset = random.uniform(0, math.pi * 2)
-
-            # Animate position
-            x = int((base_x + frame * speed_x) % self.width)
-            y = int(base_y + math.sin(frame * 0.05 + phase_offset) * px * 4)
-
-            if phase == "night":
-                # Fireflies - glowing yellow dots that pulse
-                glow = abs(math.sin(frame * 0.1 + i))
-                if glow > 0.5:
-                    brightness = int(150 + glow * 105)
-                    # Glow effect
-                    self.draw.ellipse(
-                        [x - px * 2, y - px * 2, x + px * 2, y + px * 2],
-                        fill=(brightness // 2, brightness // 2, 0)
-                    )
-                    # Core
-                    self.draw.rectangle(
-                        [x - px // 2, y - px // 2, x + px // 2, y + px // 2],
-                        fill=(brightness, brightness, 50)
-                    )
-            else:
-                # Floating leaves/petals during day
-                leaf_color = [(180, 220, 140), (140, 200, 120), (200, 180, 160)][i % 3]
-                # Leaf rotates as it floats
-                angle = frame * 0.08 + i
-                leaf_w = int(px * 1.5)
-                leaf_h = int(px * 0.8)
-                # Simple rotating leaf (just offset the rectangle slightly)
-                offset = int(math.sin(angle) * px)
-                self.draw.rectangle(
+        # Advance every particle in one vector op
+        xs = ((self._amb_x + frame * self._amb_speed) % self.width).astype(np.int32)
+        ys = (self._amb_y + np.sin(frame * 0.05 + self._amb_phase) * px * 4).astype(np.int32)
+
+        if phase == "night":
+            # Fireflies - glowing yellow dots that pulse
+            glow = np.abs(np.sin(frame * 0.1 + self._amb_index))
+            visible = glow > 0.5
+            brightness = (150 + glow * 105).astype(np.int32)
+            ellipse = self.draw.ellipse
+            rectangle = self.draw.rectangle
+            for x, y, b in zip(xs[visible].tolist(), ys[visible].tolist(),
+                               brightness[visible].tolist()):
+                # Glow effect
+                ellipse([x - px * 2, y - px * 2, x + px * 2, y + px * 2], fill=(b // 2, b // 2, 0))
+                # Core
+                rectangle(
+                    [x - px // 2, y - px // 2, x + px // 2, y + px // 2],
+                    fill=(b, b, 50)
+                )
+        else:
+            # Floating leaves/petals during day
+            leaf_colors = [(180, 220, 140), (140, 200, 120), (200, 180, 160)]
+            leaf_w = int(px * 1.5)
+            leaf_h = int(px * 0.8)
+            # Leaf rotates as it floats (just offset the rectangle slightly)
+            offsets = (np.sin(frame * 0.08 + self._amb_index) * px).astype(np.int32)
+            rectangle = self.draw.rectangle
+            for i, (x, y, offset) in enumerate(zip(xs.tolist(), ys.tolist(), offsets.tolist())):
+                rectangle(
                     [x - leaf_w + offset, y - leaf_h,
                      x + leaf_w + offset, y + leaf_h],
-                    fill=leaf_color
+                    fill=leaf_colors[i % 3]
                 )
 
-    def _draw_pixel_tree(self, x: int, y: int, scale: float, px: int, frame: int) -> None:
+    def _draw_pixel_tree(self, x: int, y: int, scale: float, px: int, frame: int,
+                         sway: int | None = None) -> None:
         """Draw a pixel art tree like in the reference image - round canopy with trunk."""
-        # Tree dimensions - taller trunk for proper tree look
-        trunk_w = int(px * 3 * scale)
-        trunk_h = int(px * 12 * scale)  # Doubled trunk height
         canopy_r = int(px * 8 * scale)
 
         # More noticeable sway animation - each tree sways at different rate
-        sway = int(math.sin(frame * 0.03 + x * 0.02) * px * 2 * scale)
+        if sway is None:
+            sway = int(math.sin(frame * 0.03 + x * 0.02) * px * 2 * scale)
 
-        # Shadow on ground (ellipse)
+        # Static trunk/shadow and canopy sprites; only the canopy moves with sway
+        trunk, (trunk_ax, trunk_ay), canopy, canopy_a = self._get_tree_sprites(scale, px)
+        self.frame.paste(trunk, (x - trunk_ax, y - trunk_ay), trunk)
+
+        canopy_x = x + sway
+        canopy_y = y - canopy_r // 2
+        self.frame.paste(canopy, (canopy_x - canopy_a, canopy_y - canopy_a), canopy)
+
+    def _get_tree_sprites(self, scale: float, px: int) -> tuple:
+        """Get cached transparent sprites for a tree of the given scale.
+
+        Returns:
+            (trunk_sprite, (anchor_x, anchor_y), canopy_sprite, canopy_anchor) where
+            the anchors are the sprite pixels corresponding to the tree base and
+            the canopy centre.
+        """
+        key = ("tree", scale, px)
+        sprites = self._stamp_cache.get(key)
+        if sprites is not None:
+            return sprites
+
+        trunk_w = int(px * 3 * scale)
+        trunk_h = int(px * 12 * scale)
+        canopy_r = int(px * 8 * scale)
         shadow_w = int(canopy_r * 1.2)
         shadow_h = int(canopy_r * 0.4)
-        self.draw.ellipse(
+
+        # Trunk and ground shadow, drawn around anchor (x, y)
+        left = max(shadow_w, trunk_w // 2 + px)
+        right = max(shadow_w, trunk_w - trunk_w // 2 + px)
+        top = max(0, shadow_h // 2 - trunk_h)
+        bottom = max(trunk_h + shadow_h // 2, trunk_h + px)
+        trunk = Image.new("RGBA", (left + right + 1, top + bottom + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(trunk)
+        x, y = left, top
+
+        # Shadow on ground (ellipse)
+        draw.ellipse(
             [x - shadow_w, y + trunk_h - shadow_h // 2,
              x + shadow_w, y + trunk_h + shadow_h // 2],
             fill=(60, 120, 50)
@@ -1205,41 +1628,43 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         trunk_left = x - trunk_w // 2
         trunk_top = y
         # Outline
-        self.draw.rectangle(
+        draw.rectangle(
             [trunk_left - px, trunk_top, trunk_left + trunk_w + px, y + trunk_h + px],
             fill=self.COLORS["outline"]
         )
         # Main trunk
-        self.draw.rectangle(
+        draw.rectangle(
             [trunk_left, trunk_top, trunk_left + trunk_w, y + trunk_h],
             fill=self.COLORS["tree_trunk"]
         )
         # Trunk highlight
-        self.draw.rectangle(
+        draw.rectangle(
             [trunk_left, trunk_top, trunk_left + trunk_w // 3, y + trunk_h],
             fill=self.COLORS["tree_trunk_dark"]
         )
 
-        # Canopy - large round/oval shape with outline
-        canopy_x = x + sway
-        canopy_y = y - canopy_r // 2
+        # Canopy - large round/oval shape with outline, drawn around its centre
+        reach = canopy_r + px * 2
+        canopy = Image.new("RGBA", (reach * 2 + 1, reach * 2 + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(canopy)
+        canopy_x = canopy_y = reach
 
         # Dark outline
-        self.draw.ellipse(
+        draw.ellipse(
             [canopy_x - canopy_r - px * 2, canopy_y - canopy_r - px * 2,
              canopy_x + canopy_r + px * 2, canopy_y + canopy_r + px * 2],
             fill=self.COLORS["outline"]
         )
 
         # Main canopy (darker base)
-        self.draw.ellipse(
+        draw.ellipse(
             [canopy_x - canopy_r, canopy_y - canopy_r,
              canopy_x + canopy_r, canopy_y + canopy_r],
             fill=self.COLORS["tree_leaves_dark"]
         )
 
         # Lighter top portion for 3D effect
-        self.draw.ellipse(
+        draw.ellipse(
             [canopy_x - canopy_r + px * 2, canopy_y - canopy_r,
              canopy_x + canopy_r - px * 2, canopy_y + px * 2],
             fill=self.COLORS["tree_leaves"]
@@ -1249,15 +1674,27 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         highlight_x = canopy_x - canopy_r // 3
         highlight_y = canopy_y - canopy_r // 3
         highlight_r = canopy_r // 3
-        self.draw.ellipse(
+        draw.ellipse(
             [highlight_x - highlight_r, highlight_y - highlight_r,
              highlight_x + highlight_r, highlight_y + highlight_r],
             fill=self.COLORS["tree_leaves_light"]
         )
 
+        sprites = (trunk, (left, top), canopy, reach)
+        self._stamp_cache[key] = sprites
+        return sprites
+
+    def _init_clouds(self, count: int = 3) -> None:
+        """Roll cloud start positions once with the original ``random.seed(789)`` layout."""
+        rng = random.Random(789)
+        self._cloud_params = [
+            (rng.randint(0, self.width), rng.randint(int(self.height * 0.05), int(self.height * 0.18)))
+            for _ in range(count)
+        ]
+
     def _draw_pixel_clouds(self, frame: int, phase: str) -> None:
         """Draw pixel art style clouds."""
-        px = max(2, self.height // 120)
+        px = self._px
 
         # Cloud color based on time
         if phase == "night":
@@ -1265,12 +1702,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         else:
             cloud_color = (255, 255, 255)
 
-        import random
-        random.seed(789)
-
-        for i in range(3):
-            base_x = random.randint(0, self.width)
-            y = random.randint(int(self.height * 0.05), int(self.height * 0.18))
+        for i, (base_x, y) in enumerate(self._cloud_params):
             speed = 0.2 + i * 0.1
 
             # Drift across screen
@@ -1279,29 +1711,41 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             # Draw blocky cloud shape
             cloud_w = px * (8 + i * 2)
             cloud_h = px * 4
+            if not self._visible(x - cloud_w - px * 2, y - px * 2, x + cloud_w + px * 2, y + cloud_h):
+                continue
 
+            stamp = self._get_cloud_stamp(px, cloud_w, cloud_h, cloud_color)
+            self.frame.paste(stamp, (x - cloud_w - px * 2, y - px * 2), stamp)
+
+    def _get_cloud_stamp(self, px: int, cloud_w: int, cloud_h: int, cloud_color: tuple) -> Image.Image:
+        """Get a blocky cloud: main body with left, right and top bumps."""
+        key = ("cloud", px, cloud_w, cloud_color)
+        stamp = self._stamp_cache.get(key)
+        if stamp is None:
+            stamp = Image.new("RGBA", (cloud_w * 2 + px * 4 + 1, cloud_h + px * 2 + 1), (0, 0, 0, 0))
+            stamp_draw = ImageDraw.Draw(stamp)
+            cx = cloud_w + px * 2
             # Main body
-            self.draw.rectangle([x - cloud_w, y, x + cloud_w, y + cloud_h], fill=cloud_color)
+            stamp_draw.rectangle([px * 2, px * 2, cx + cloud_w, px * 2 + cloud_h], fill=cloud_color)
             # Left bump
-            self.draw.rectangle([x - cloud_w - px * 2, y + px, x - cloud_w, y + cloud_h - px], fill=cloud_color)
+            stamp_draw.rectangle([0, px * 3, px * 2, px + cloud_h], fill=cloud_color)
             # Right bump
-            self.draw.rectangle([x + cloud_w, y + px, x + cloud_w + px * 2, y + cloud_h - px], fill=cloud_color)
+            stamp_draw.rectangle([cx + cloud_w, px * 3, cx + cloud_w + px * 2, px + cloud_h], fill=cloud_color)
             # Top bump
-            self.draw.rectangle([x - px * 3, y - px * 2, x + px * 3, y], fill=cloud_color)
+            stamp_draw.rectangle([cx - px * 3, 0, cx + px * 3, px * 2], fill=cloud_color)
+            self._stamp_cache[key] = stamp
+        return stamp
 
     def _render_claude_character(self, state: GameState) -> None:
         """Render Claude as a pixel art character with bold outlines like reference."""
         activity = state.main_agent.activity.value
         frame = self._frame_count
+        phase_sin = self._phase_sines(frame)
 
         # Pixel size for consistent chunky look
-        px = max(2, self.height // 120)
+        px = self._px
         scale = self.height / 350
 
-        # Character dimensions
-        int(px * 14)
-        int(px * 18)
-
         # Base position from game state - offset from screen center
         screen_center_x = self.width // 2
         screen_center_y = int(self.height * 0.58)
@@ -1315,53 +1759,27 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         facing = state.main_agent.facing_direction
 
         # Breathing animation - subtle scale pulse
-        breath = 1.0 + math.sin(frame * 0.04) * 0.02
+        breath = 1.0 + phase_sin[0.04] * 0.02
 
         # Walking animation - leg movement and bob
         if is_walking:
             # Faster bob while walking
-            bob = int(math.sin(frame * 0.3) * px * 1.5)
+            bob = int(phase_sin[0.3] * px * 1.5)
             # Look in direction of movement
             look_dir = facing
         else:
             # Idle bob - gentle floating motion
-            bob = int(math.sin(frame * 0.08) * px * breath)
+            bob = int(phase_sin[0.08] * px * breath)
 
             # Look-around animation - more natural pattern
-            look_cycle = (frame % 400) / 400.0
-            if look_cycle < 0.08:
-                look_dir = -1  # Look left
-            elif look_cycle < 0.15:
-                look_dir = -1  # Hold left
-            elif look_cycle < 0.25:
-                look_dir = 0   # Center
-            elif look_cycle < 0.55:
-                look_dir = 0   # Hold center (longest)
-            elif look_cycle < 0.63:
-                look_dir = 1   # Look right
-            elif look_cycle < 0.70:
-                look_dir = 1   # Hold right
-            elif look_cycle < 0.80:
-                look_dir = 0   # Back to center
-            else:
-                look_dir = 0   # Hold center
-
-        # Occasional head tilt during thinking
-        if activity == "thinking" and not is_walking:
-            int(math.sin(frame * 0.03) * px)
+            look_dir = self._LOOK_DIR_TABLE[frame % 400]
 
         # Activity-specific movement only when not walking
         if not is_walking:
             if activity == "thinking":
-                center_x += int(math.sin(frame * 0.02) * px * 3)
+                center_x += int(phase_sin[0.02] * px * 3)
             elif activity == "searching":
-                center_x += int(math.sin(frame * 0.05) * px * 5)
-
-        # Colors
-        body_color = self.COLORS["claude_body"]
-        dark_color = self.COLORS["claude_dark"]
-        light_color = self.COLORS["claude_light"]
-        outline = self.COLORS["outline"]
+                center_x += int(phase_sin[0.05] * px * 5)
 
         # Calculate positions
         feet_y = ground_y + bob
@@ -1377,64 +1795,94 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             fill=(60, 120, 50)
         )
 
-        # === FEET (two small blocks with walking animation) ===
-        foot_w = int(px * 3)
-        foot_h = int(px * 3)
-        foot_spacing = int(px * 2)
-
-        # Walking animation - alternating foot positions
+        # Walking animation - alternating foot positions and arm swing
         if is_walking:
-            walk_cycle = math.sin(frame * 0.4)
+            walk_cycle = phase_sin[0.4]
             left_foot_offset = int(walk_cycle * px * 3)
             right_foot_offset = int(-walk_cycle * px * 3)
+            arm_swing = int(walk_cycle * px * 2)
         else:
             left_foot_offset = 0
             right_foot_offset = 0
+            # Gentle idle arm movement
+            arm_swing = int(phase_sin[0.06] * px)
+
+        blink = self._BLINK_TABLE[frame % 150]
+
+        # Feet, body, arms, head and eyes come from a cached sprite per pose
+        sprite, (anchor_x, anchor_y) = self._get_claude_sprite(
+            px, left_foot_offset, right_foot_offset, arm_swing, look_dir, blink
+        )
+        sprite_x, sprite_y = center_x - anchor_x, feet_y - anchor_y
+        if self._visible(sprite_x, sprite_y, sprite_x + sprite.width, sprite_y + sprite.height):
+            self.frame.paste(sprite, (sprite_x, sprite_y), sprite)
+
+        # Activity accessories
+        self._render_activity_accessory(center_x, head_y, body_y + bob, scale, activity, frame)
+
+    def _get_claude_sprite(self, px: int, left_foot_offset: int, right_foot_offset: int,
+                           arm_swing: int, look_dir: int, blink: bool) -> tuple:
+        """Get the cached Claude body sprite for one pose.
+
+        Returns:
+            (sprite, (anchor_x, anchor_y)) where the anchor is the sprite pixel
+            at the character's centre line and feet.
+        """
+        key = ("claude", px, left_foot_offset, right_foot_offset, arm_swing, look_dir, blink)
+        cached = self._stamp_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Body spans about -9px..9px horizontally and -18px..7px vertically
+        anchor_x, anchor_y = px * 10, px * 20
+        sprite = Image.new("RGBA", (px * 20 + 1, px * 28 + 1), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sprite)
+
+        # Colors
+        body_color = self.COLORS["claude_body"]
+        dark_color = self.COLORS["claude_dark"]
+        light_color = self.COLORS["claude_light"]
+        outline = self.COLORS["outline"]
+
+        # Calculate positions
+        center_x = anchor_x
+        feet_y = anchor_y
+        body_y = feet_y - int(px * 8)
+        head_y = body_y - int(px * 8)
+
+        # === FEET (two small blocks with walking animation) ===
+        foot_w = int(px * 3)
+        foot_h = int(px * 3)
+        foot_spacing = int(px * 2)
 
         # Left foot outline + fill
         left_foot_y = feet_y - left_foot_offset
-        self.draw.rectangle(
+        draw.rectangle(
             [center_x - foot_spacing - foot_w - px, left_foot_y - px,
              center_x - foot_spacing + px, left_foot_y + foot_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [center_x - foot_spacing - foot_w, left_foot_y,
-             center_x - foot_spacing, left_foot_y + foot_h],
-            fill=dark_color
+            fill=dark_color, outline=outline, width=px
         )
 
         # Right foot outline + fill
         right_foot_y = feet_y - right_foot_offset
-        self.draw.rectangle(
+        draw.rectangle(
             [center_x + foot_spacing - px, right_foot_y - px,
              center_x + foot_spacing + foot_w + px, right_foot_y + foot_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [center_x + foot_spacing, right_foot_y,
-             center_x + foot_spacing + foot_w, right_foot_y + foot_h],
-            fill=dark_color
+            fill=dark_color, outline=outline, width=px
         )
 
         # === BODY (wider rectangle) ===
         body_w = int(px * 10)
         body_h = int(px * 8)
 
-        # Body outline
-        self.draw.rectangle(
+        # Body outline + fill
+        draw.rectangle(
             [center_x - body_w // 2 - px * 2, body_y - px * 2,
              center_x + body_w // 2 + px * 2, body_y + body_h + px * 2],
-            fill=outline
-        )
-        # Body fill
-        self.draw.rectangle(
-            [center_x - body_w // 2, body_y,
-             center_x + body_w // 2, body_y + body_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px * 2
         )
         # Body shading (left side darker)
-        self.draw.rectangle(
+        draw.rectangle(
             [center_x - body_w // 2, body_y,
              center_x - body_w // 2 + px * 2, body_y + body_h],
             fill=dark_color
@@ -1445,57 +1893,34 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         arm_h = int(px * 5)
         arm_y = body_y + int(px * 2)  # Arms attach near top of body
 
-        # Arm swing animation when walking
-        if is_walking:
-            arm_swing = int(math.sin(frame * 0.4) * px * 2)
-        else:
-            # Gentle idle arm movement
-            arm_swing = int(math.sin(frame * 0.06) * px)
-
         # Left arm - outline then fill
         left_arm_x = center_x - body_w // 2 - arm_w
-        self.draw.rectangle(
+        draw.rectangle(
             [left_arm_x - px, arm_y - arm_swing - px,
              left_arm_x + arm_w + px, arm_y - arm_swing + arm_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [left_arm_x, arm_y - arm_swing,
-             left_arm_x + arm_w, arm_y - arm_swing + arm_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px
         )
 
         # Right arm - outline then fill
         right_arm_x = center_x + body_w // 2
-        self.draw.rectangle(
+        draw.rectangle(
             [right_arm_x - px, arm_y + arm_swing - px,
              right_arm_x + arm_w + px, arm_y + arm_swing + arm_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [right_arm_x, arm_y + arm_swing,
-             right_arm_x + arm_w, arm_y + arm_swing + arm_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px
         )
 
         # === HEAD (slightly narrower than body) ===
         head_w = int(px * 8)
         head_h = int(px * 8)
 
-        # Head outline
-        self.draw.rectangle(
+        # Head outline + fill
+        draw.rectangle(
             [center_x - head_w // 2 - px * 2, head_y - px * 2,
              center_x + head_w // 2 + px * 2, head_y + head_h + px * 2],
-            fill=outline
-        )
-        # Head fill
-        self.draw.rectangle(
-            [center_x - head_w // 2, head_y,
-             center_x + head_w // 2, head_y + head_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px * 2
         )
         # Head highlight (top-left)
-        self.draw.rectangle(
+        draw.rectangle(
             [center_x - head_w // 2 + px, head_y + px,
              center_x - head_w // 2 + px * 3, head_y + px * 3],
             fill=light_color
@@ -1508,42 +1933,60 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         eye_y = head_y + int(px * 2)
         eye_offset = look_dir * px
 
-        blink = (frame % 150) < 5
-
         if not blink:
             # Left eye
-            self.draw.rectangle(
+            draw.rectangle(
                 [center_x - eye_spacing - eye_w + eye_offset, eye_y,
                  center_x - eye_spacing + eye_offset, eye_y + eye_h],
                 fill=self.COLORS["claude_eyes"]
             )
             # Right eye
-            self.draw.rectangle(
+            draw.rectangle(
                 [center_x + eye_spacing + eye_offset, eye_y,
                  center_x + eye_spacing + eye_w + eye_offset, eye_y + eye_h],
                 fill=self.COLORS["claude_eyes"]
             )
         else:
             # Closed eyes (horizontal lines)
-            self.draw.rectangle(
+            draw.rectangle(
                 [center_x - eye_spacing - eye_w, eye_y + eye_h // 2,
                  center_x - eye_spacing, eye_y + eye_h // 2 + px],
                 fill=self.COLORS["claude_eyes"]
             )
-            self.draw.rectangle(
+            draw.rectangle(
                 [center_x + eye_spacing, eye_y + eye_h // 2,
                  center_x + eye_spacing + eye_w, eye_y + eye_h // 2 + px],
                 fill=self.COLORS["claude_eyes"]
             )
 
-        # Activity accessories
-        self._render_activity_accessory(center_x, head_y, body_y + bob, scale, activity, frame)
+        cached = (sprite, (anchor_x, anchor_y))
+        self._stamp_cache[key] = cached
+        return cached
 
-    def _render_subagent_connections(self, state: GameState) -> None:
-        """Render connection lines from main Claude to subagents."""
+    def _subagent_screen_positions(self, state: GameState) -> list[tuple]:
+        """Collect the subagents and their screen positions once per frame.
+
+        Returns:
+            A list of (agent, screen_x, screen_y) tuples, shared by the
+            connection and subagent passes.
+        """
         from claude_world.types import EntityType
 
-        px = max(2, self.height // 120)
+        # Screen center for position offset
+        screen_center_x = self.width // 2
+        screen_center_y = int(self.height * 0.58)
+
+        return [
+            (e, screen_center_x + int(e.position.x), screen_center_y + int(e.position.y))
+            for e in state.entities.values() if e.type == EntityType.SUB_AGENT
+        ]
+
+    def _render_subagent_connections(self, state: GameState, subagents: list[tuple]) -> None:
+        """Render connection lines from main Claude to subagents."""
+        if not subagents:
+            return
+
+        px = self._px
         frame = self._frame_count
 
         # Screen center and Claude's position
@@ -1552,13 +1995,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         claude_x = screen_center_x + int(state.main_agent.position.x)
         claude_y = screen_center_y + int(state.main_agent.position.y)
 
-        # Get all subagents
-        subagents = [e for e in state.entities.values() if e.type == EntityType.SUB_AGENT]
-
-        for agent in subagents:
-            agent_screen_x = screen_center_x + int(agent.position.x)
-            agent_screen_y = screen_center_y + int(agent.position.y)
-
+        for agent, agent_screen_x, agent_screen_y in subagents:
             # Get agent type for color coding
             agent_type = getattr(agent, 'agent_type', 'general-purpose')
             status = getattr(agent, 'status', None)
@@ -1595,7 +2032,6 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Draw dashed line with glow effect
         dash_len = px * 4
         gap_len = px * 2
-        segment_len = dash_len + gap_len
 
         # Color based on agent type
         type_colors = {
@@ -1606,7 +2042,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         base_rgb = type_colors.get(agent_type, (100, 180, 220))
 
         # Pulse effect
-        pulse = abs(math.sin(frame * 0.1))
+        pulse = abs(self._phase_sines(frame)[0.1])
         base_color = tuple(min(255, int(c + 30 * pulse)) for c in base_rgb)
 
         # Line thickness based on status
@@ -1619,21 +2055,11 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             base_color = (100, 255, 150)  # Green for complete
 
         # Draw each dash segment
-        pos = dash_offset
-        while pos < distance:
-            start_pos = max(0, pos)
-            end_pos = min(distance, pos + dash_len)
-
-            if end_pos > start_pos:
-                sx = int(x1 + nx * start_pos)
-                sy = int(y1 + ny * start_pos)
-                ex = int(x1 + nx * end_pos)
-                ey = int(y1 + ny * end_pos)
-
-                # Draw line segment
-                self.draw.line([(sx, sy), (ex, ey)], fill=base_color, width=line_width)
-
-            pos += segment_len
+        line = self.draw.line
+        dash_x1, dash_y1, dash_x2, dash_y2 = dash_segments(
+            x1, y1, nx, ny, distance, dash_offset, dash_len, gap_len)
+        for sx, sy, ex, ey in zip(dash_x1.tolist(), dash_y1.tolist(), dash_x2.tolist(), dash_y2.tolist()):
+            line([(sx, sy), (ex, ey)], fill=base_color, width=line_width)
 
         # Draw direction arrows along the line
         if distance > 60:
@@ -1682,25 +2108,43 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     fill=particle_color
                 )
 
-    def _render_subagents(self, state: GameState) -> None:
-        """Render all active subagents."""
-        from claude_world.types import EntityType
-
-        px = max(2, self.height // 120)
+    def _render_subagents(self, subagents: list[tuple]) -> None:
+        """Render all active subagents at their precomputed screen positions."""
+        px = self._px
         frame = self._frame_count
 
-        # Screen center for position offset
-        screen_center_x = self.width // 2
-        screen_center_y = int(self.height * 0.58)
-
-        # Get all subagents
-        subagents = [e for e in state.entities.values() if e.type == EntityType.SUB_AGENT]
-
-        for agent in subagents:
-            agent_x = screen_center_x + int(agent.position.x)
-            agent_y = screen_center_y + int(agent.position.y)
+        for agent, agent_x, agent_y in subagents:
             self._draw_subagent(agent_x, agent_y, agent, px, frame)
 
+    def _get_subagent_body_stamp(self, px: int, body_w: int, body_h: int, body_color: tuple,
+                                 dark_color: tuple, outline: tuple) -> Image.Image:
+        """Get an opaque subagent body: outline, fill and the darker left strip."""
+        key = ("subagent_body", px, body_color)
+        stamp = self._stamp_cache.get(key)
+        if stamp is None:
+            stamp = Image.new("RGBA", (body_w // 2 * 2 + px * 2 + 1, body_h + px * 2 + 1), outline + (255,))
+            stamp_draw = ImageDraw.Draw(stamp)
+            stamp_draw.rectangle([px, px, body_w // 2 * 2 + px, body_h + px], fill=body_color)
+            stamp_draw.rectangle([px, px, px * 3, body_h + px], fill=dark_color)
+            self._stamp_cache[key] = stamp
+        return stamp
+
+    def _get_subagent_head_stamp(self, px: int, head_w: int, head_h: int, body_color: tuple,
+                                 outline: tuple) -> Image.Image:
+        """Get an opaque subagent head: outline, fill and both eyes."""
+        key = ("subagent_head", px, body_color)
+        stamp = self._stamp_cache.get(key)
+        if stamp is None:
+            half_w, half_h = head_w // 2, head_h // 2
+            stamp = Image.new("RGBA", (half_w * 2 + px * 2 + 1, half_h * 2 + px * 2 + 1), outline + (255,))
+            stamp_draw = ImageDraw.Draw(stamp)
+            stamp_draw.rectangle([px, px, half_w * 2 + px, half_h * 2 + px], fill=body_color)
+            eye_color = self.COLORS["claude_eyes"]
+            stamp_draw.rectangle([half_w - px, half_h, half_w, half_h + px * 2], fill=eye_color)
+            stamp_draw.rectangle([half_w + px * 2, half_h, half_w + px * 3, half_h + px * 2], fill=eye_color)
+            self._stamp_cache[key] = stamp
+        return stamp
+
     def _draw_subagent(self, x: int, y: int, agent, px: int, frame: int) -> None:
         """Draw a single subagent character with arms and feet."""
         # Subagent colors based on type
@@ -1713,9 +2157,15 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             agent.agent_type, ((150, 180, 220), (110, 140, 180))
         )
         outline = self.COLORS["outline"]
+        draw = self.draw
+        phase_sin = self._phase_sines(frame)
+
+        # Per-agent animation offsets - hash once, reused by every animated part below
+        agent_hash = hash(agent.id)
+        hash_offset = agent_hash % 100
 
         # Bobbing animation
-        bob = int(math.sin(frame * 0.1 + hash(agent.id) % 100) * px)
+        bob = int(math.sin(frame * 0.1 + hash_offset) * px)
 
         # Check if walking
         is_walking = getattr(agent, 'is_walking', False)
@@ -1727,7 +2177,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         head_h = int(px * 5)
 
         # Shadow
-        self.draw.ellipse(
+        draw.ellipse(
             [x - px * 4, y + px, x + px * 4, y + px * 3],
             fill=(60, 120, 50)
         )
@@ -1739,53 +2189,32 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         # Walking animation for feet
         if is_walking:
-            left_foot_offset = int(math.sin(frame * 0.4 + hash(agent.id)) * px * 2)
-            right_foot_offset = int(math.sin(frame * 0.4 + hash(agent.id) + math.pi) * px * 2)
+            left_foot_offset = int(math.sin(frame * 0.4 + agent_hash) * px * 2)
+            right_foot_offset = int(math.sin(frame * 0.4 + agent_hash + math.pi) * px * 2)
         else:
             left_foot_offset = 0
             right_foot_offset = 0
 
         # Left foot - outline then fill
         left_foot_x = x - body_w // 2 + px
-        self.draw.rectangle(
+        draw.rectangle(
             [left_foot_x - px, foot_y - left_foot_offset - px,
              left_foot_x + foot_w + px, foot_y - left_foot_offset + foot_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [left_foot_x, foot_y - left_foot_offset,
-             left_foot_x + foot_w, foot_y - left_foot_offset + foot_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px
         )
 
         # Right foot - outline then fill
         right_foot_x = x + body_w // 2 - foot_w - px
-        self.draw.rectangle(
+        draw.rectangle(
             [right_foot_x - px, foot_y - right_foot_offset - px,
              right_foot_x + foot_w + px, foot_y - right_foot_offset + foot_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [right_foot_x, foot_y - right_foot_offset,
-             right_foot_x + foot_w, foot_y - right_foot_offset + foot_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px
         )
 
-        # Body outline + fill
-        self.draw.rectangle(
-            [x - body_w // 2 - px, y - body_h + bob - px,
-             x + body_w // 2 + px, y + bob + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [x - body_w // 2, y - body_h + bob,
-             x + body_w // 2, y + bob],
-            fill=body_color
-        )
-        self.draw.rectangle(
-            [x - body_w // 2, y - body_h + bob,
-             x - body_w // 2 + px * 2, y + bob],
-            fill=dark_color
+        # Body outline, fill and shading
+        self.frame.paste(
+            self._get_subagent_body_stamp(px, body_w, body_h, body_color, dark_color, outline),
+            (x - body_w // 2 - px, y - body_h + bob - px)
         )
 
         # === ARMS ===
@@ -1795,58 +2224,32 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         # Arm swing animation
         if is_walking:
-            arm_swing = int(math.sin(frame * 0.4 + hash(agent.id)) * px * 2)
+            # Same stride phase as the left foot
+            arm_swing = left_foot_offset
         else:
-            arm_swing = int(math.sin(frame * 0.06 + hash(agent.id)) * px)
+            arm_swing = int(math.sin(frame * 0.06 + agent_hash) * px)
 
         # Left arm - outline then fill
         left_arm_x = x - body_w // 2 - arm_w
-        self.draw.rectangle(
+        draw.rectangle(
             [left_arm_x - px, arm_y - arm_swing - px,
              left_arm_x + arm_w + px, arm_y - arm_swing + arm_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [left_arm_x, arm_y - arm_swing,
-             left_arm_x + arm_w, arm_y - arm_swing + arm_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px
         )
 
         # Right arm - outline then fill
         right_arm_x = x + body_w // 2
-        self.draw.rectangle(
+        draw.rectangle(
             [right_arm_x - px, arm_y + arm_swing - px,
              right_arm_x + arm_w + px, arm_y + arm_swing + arm_h + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [right_arm_x, arm_y + arm_swing,
-             right_arm_x + arm_w, arm_y + arm_swing + arm_h],
-            fill=body_color
+            fill=body_color, outline=outline, width=px
         )
 
-        # Head outline + fill
+        # Head outline, fill and eyes
         head_y = y - body_h - head_h // 2 + bob
-        self.draw.rectangle(
-            [x - head_w // 2 - px, head_y - head_h // 2 - px,
-             x + head_w // 2 + px, head_y + head_h // 2 + px],
-            fill=outline
-        )
-        self.draw.rectangle(
-            [x - head_w // 2, head_y - head_h // 2,
-             x + head_w // 2, head_y + head_h // 2],
-            fill=body_color
-        )
-
-        # Eyes
-        eye_y = head_y - px
-        self.draw.rectangle(
-            [x - px * 2, eye_y, x - px, eye_y + px * 2],
-            fill=self.COLORS["claude_eyes"]
-        )
-        self.draw.rectangle(
-            [x + px, eye_y, x + px * 2, eye_y + px * 2],
-            fill=self.COLORS["claude_eyes"]
+        self.frame.paste(
+            self._get_subagent_head_stamp(px, head_w, head_h, body_color, outline),
+            (x - head_w // 2 - px, head_y - head_h // 2 - px)
         )
 
         # Activity-specific indicator above subagent
@@ -1857,23 +2260,23 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             # Small binoculars icon
             lens_r = px
             gap = px * 2
-            self.draw.ellipse(
+            draw.ellipse(
                 [x - gap - lens_r, indicator_y - lens_r, x - gap + lens_r, indicator_y + lens_r],
                 fill=(80, 80, 100), outline=(60, 60, 80)
             )
-            self.draw.ellipse(
+            draw.ellipse(
                 [x + gap - lens_r, indicator_y - lens_r, x + gap + lens_r, indicator_y + lens_r],
                 fill=(80, 80, 100), outline=(60, 60, 80)
             )
             # Glint animation
-            glint_x = x - gap + int(math.sin(frame * 0.1) * px)
-            self.draw.rectangle([glint_x, indicator_y - px, glint_x + 1, indicator_y], fill=(180, 200, 255))
+            glint_x = x - gap + int(phase_sin[0.1] * px)
+            draw.rectangle([glint_x, indicator_y - px, glint_x + 1, indicator_y], fill=(180, 200, 255))
 
         elif activity == "thinking":
             # Mini thought bubble
-            bubble_bob = int(math.sin(frame * 0.08) * 2)
+            bubble_bob = int(phase_sin[0.08] * 2)
             for i, (bx_off, by_off, br) in enumerate([(-px, px, 1), (-px*2, 0, 2), (-px*3, -px*2, 3)]):
-                self.draw.ellipse(
+                draw.ellipse(
                     [x + bx_off - br, indicator_y + by_off + bubble_bob - br,
                      x + bx_off + br, indicator_y + by_off + bubble_bob + br],
                     fill=(255, 255, 255), outline=(200, 200, 200)
@@ -1882,27 +2285,27 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         elif activity == "reading":
             # Mini book icon
             book_w, book_h = px * 3, px * 2
-            self.draw.rectangle(
+            draw.rectangle(
                 [x - book_w // 2, indicator_y - book_h // 2, x + book_w // 2, indicator_y + book_h // 2],
                 fill=(240, 230, 210), outline=(180, 160, 130)
             )
             # Spine
-            self.draw.line([(x, indicator_y - book_h // 2), (x, indicator_y + book_h // 2)], fill=(160, 140, 110))
+            draw.line([(x, indicator_y - book_h // 2), (x, indicator_y + book_h // 2)], fill=(160, 140, 110))
 
         elif activity == "writing":
             # Pencil/code symbol
             symbols = ["{}", "< >", "[]"]
-            sym_idx = (frame // 20 + hash(agent.id)) % len(symbols)
-            self.draw.text((x - px * 2, indicator_y - px), symbols[sym_idx], fill=(150, 200, 255))
+            sym_idx = (frame // 20 + agent_hash) % len(symbols)
+            self._draw_text_cached((x - px * 2, indicator_y - px), symbols[sym_idx], (150, 200, 255))
 
         elif activity == "searching":
             # Mini magnifying glass
             glass_r = px * 2
-            self.draw.ellipse(
+            draw.ellipse(
                 [x - glass_r, indicator_y - glass_r, x + glass_r, indicator_y + glass_r],
                 outline=(200, 150, 50), width=1
             )
-            self.draw.line(
+            draw.line(
                 [(x + glass_r - 1, indicator_y + glass_r - 1), (x + glass_r + px, indicator_y + glass_r + px)],
                 fill=(200, 150, 50), width=1
             )
@@ -1910,13 +2313,13 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         elif activity == "building":
             # Mini rotating gear
             gear_r = px * 2
-            rotation = frame * 0.08 + hash(agent.id)
+            rotation = frame * 0.08 + agent_hash
             for i in range(4):
                 angle = rotation + i * math.pi / 2
                 sx = x + int(math.cos(angle) * gear_r)
                 sy = indicator_y + int(math.sin(angle) * gear_r)
-                self.draw.rectangle([sx - 1, sy - 1, sx + 1, sy + 1], fill=(200, 150, 50))
-            self.draw.ellipse([x - px, indicator_y - px, x + px, indicator_y + px], fill=(180, 130, 40))
+                draw.rectangle([sx - 1, sy - 1, sx + 1, sy + 1], fill=(200, 150, 50))
+            draw.ellipse([x - px, indicator_y - px, x + px, indicator_y + px], fill=(180, 130, 40))
 
         elif activity == "communicating":
             # Radio waves
@@ -1924,18 +2327,18 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             for i in range(2):
                 arc_r = int((px + i * px * 2) * (0.5 + wave_phase * 0.5))
                 alpha = int(200 * (1 - wave_phase))
-                self.draw.arc(
+                draw.arc(
                     [x + px - arc_r, indicator_y - arc_r, x + px + arc_r, indicator_y + arc_r],
                     start=-45, end=45, fill=(alpha, alpha, 255), width=1
                 )
 
         else:
             # Default: simple orbiting dot
-            orbit_angle = frame * 0.15 + hash(agent.id) % 100
+            orbit_angle = frame * 0.15 + hash_offset
             orbit_r = px * 4
             dot_x = x + int(math.cos(orbit_angle) * orbit_r)
             dot_y = indicator_y + int(math.sin(orbit_angle) * orbit_r * 0.5)
-            self.draw.ellipse(
+            draw.ellipse(
                 [dot_x - px, dot_y - px, dot_x + px, dot_y + px],
                 fill=(200, 200, 255)
             )
@@ -1946,10 +2349,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             "Plan": "PLAN",
             "general-purpose": "GEN",
         }.get(agent.agent_type, "AGT")
-        self.draw.text(
+        self._draw_text_cached(
             (x - px * 3, head_y - head_h - px * 4),
             type_short,
-            fill=(200, 200, 200)
+            (200, 200, 200)
         )
 
         # Status indicator (above type label)
@@ -1962,10 +2365,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 # Green checkmark
                 check_color = (100, 255, 100)
                 # Draw checkmark
-                self.draw.line([(x - px * 2, status_y), (x, status_y + px * 2)], fill=check_color, width=2)
-                self.draw.line([(x, status_y + px * 2), (x + px * 3, status_y - px)], fill=check_color, width=2)
+                draw.line([(x - px * 2, status_y), (x, status_y + px * 2)], fill=check_color, width=2)
+                draw.line([(x, status_y + px * 2), (x + px * 3, status_y - px)], fill=check_color, width=2)
                 # Glow effect
-                self.draw.ellipse(
+                draw.ellipse(
                     [x - px * 4, status_y - px * 2, x + px * 4, status_y + px * 4],
                     outline=(100, 255, 100)
                 )
@@ -1973,12 +2376,12 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             elif status_value == "error":
                 # Red X
                 error_color = (255, 100, 100)
-                self.draw.line([(x - px * 2, status_y - px), (x + px * 2, status_y + px * 3)], fill=error_color, width=2)
-                self.draw.line([(x - px * 2, status_y + px * 3), (x + px * 2, status_y - px)], fill=error_color, width=2)
+                draw.line([(x - px * 2, status_y - px), (x + px * 2, status_y + px * 3)], fill=error_color, width=2)
+                draw.line([(x - px * 2, status_y + px * 3), (x + px * 2, status_y - px)], fill=error_color, width=2)
                 # Pulsing glow
-                pulse = abs(math.sin(frame * 0.2))
+                pulse = abs(phase_sin[0.2])
                 glow_r = int(px * 4 * (1 + pulse * 0.3))
-                self.draw.ellipse(
+                draw.ellipse(
                     [x - glow_r, status_y - glow_r // 2, x + glow_r, status_y + glow_r],
                     outline=(255, int(100 * pulse), int(100 * pulse))
                 )
@@ -1987,7 +2390,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 # Lightning bolt / energy indicator
                 bolt_color = (255, 220, 100)
                 # Animated bolt
-                bolt_offset = int(math.sin(frame * 0.3) * px)
+                bolt_offset = int(phase_sin[0.3] * px)
                 points = [
                     (x - px, status_y - px + bolt_offset),
                     (x + px, status_y + px + bolt_offset),
@@ -1997,20 +2400,21 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     (x + px, status_y + px * 2 + bolt_offset),
                 ]
                 for i in range(len(points) - 1):
-                    self.draw.line([points[i], points[i + 1]], fill=bolt_color, width=1)
+                    draw.line([points[i], points[i + 1]], fill=bolt_color, width=1)
                 # Sparkle
                 sparkle_phase = frame * 0.2
                 for i in range(3):
                     angle = sparkle_phase + i * 2.1
                     sx = x + int(math.cos(angle) * px * 3)
                     sy = status_y + px + int(math.sin(angle) * px * 2)
-                    self.draw.point((sx, sy), fill=(255, 255, 200))
+                    draw.point((sx, sy), fill=(255, 255, 200))
 
     def _render_activity_accessory(self, x: int, head_y: int, body_y: int,
                                     scale: float, activity: str, frame: int) -> None:
         """Render activity-specific visual elements (icons near Claude, not text)."""
         # Note: Text bubble is now handled by _render_activity_indicator
         # This method only draws small icons/props for certain activities
+        phase_sin = self._phase_sines(frame)
 
         if activity == "reading":
             # Book
@@ -2031,16 +2435,18 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         elif activity == "writing":
             # Floating code/text particles
-            for i in range(5):
-                angle = (frame * 0.02 + i * 1.2) % (2 * math.pi)
+            color = self.COLORS["accent_secondary"]
+            base_phase = frame * 0.02
+            two_pi = 2 * math.pi
+            base_y = body_y - int(10 * scale)
+            for i, symbol in enumerate(self._CODE_SYMBOLS):
+                angle = (base_phase + i * 1.2) % two_pi
                 radius = 50 + i * 10
                 px = x + int(math.cos(angle) * radius * scale * 0.4)
-                py = body_y - int(10 * scale) + int(math.sin(angle * 2) * 20)
+                py = base_y + int(math.sin(angle * 2) * 20)
 
                 # Code symbols
-                symbols = ["{ }", "< >", "[ ]", "( )", "=>"]
-                self.draw.text((px, py), symbols[i % len(symbols)],
-                              fill=self.COLORS["accent_secondary"])
+                self._draw_text_cached((px, py), symbol, color)
 
         elif activity == "searching":
             # Magnifying glass
@@ -2063,17 +2469,14 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             gear_y = body_y - int(30 * scale)
             rotation = frame * 0.05
 
-            for i in range(6):
-                angle = rotation + i * math.pi / 3
-                x1 = gear_x + int(math.cos(angle) * 12)
-                y1 = gear_y + int(math.sin(angle) * 12)
-                x2 = gear_x + int(math.cos(angle) * 20)
-                y2 = gear_y + int(math.sin(angle) * 20)
-                self.draw.line([(x1, y1), (x2, y2)], fill=self.COLORS["accent_primary"], width=3)
+            gear_color = self.COLORS["accent_primary"]
+            spokes = gear_spokes(rotation, gear_x, gear_y, 12, 20)
+            for x1, y1, x2, y2 in zip(*(a.tolist() for a in spokes)):
+                self.draw.line([(x1, y1), (x2, y2)], fill=gear_color, width=3)
 
             self.draw.ellipse(
                 [gear_x - 10, gear_y - 10, gear_x + 10, gear_y + 10],
-                fill=self.COLORS["accent_primary"]
+                fill=gear_color
             )
 
         elif activity == "thinking":
@@ -2082,10 +2485,12 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             bubble_y = head_y - int(20 * scale)
 
             # Three ascending bubbles
+            step_x = int(8 * scale)
+            step_y = int(12 * scale)
             for i in range(3):
                 size = int((4 + i * 3) * scale)
-                bx = bubble_x - i * int(8 * scale)
-                by = bubble_y - i * int(12 * scale)
+                bx = bubble_x - i * step_x
+                by = bubble_y - i * step_y
                 bob_offset = int(math.sin(frame * 0.08 + i * 0.5) * 3)
                 self.draw.ellipse(
                     [bx - size, by - size + bob_offset, bx + size, by + size + bob_offset],
@@ -2097,7 +2502,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             cloud_y = bubble_y - int(50 * scale)
             cloud_w = int(40 * scale)
             cloud_h = int(25 * scale)
-            bob = int(math.sin(frame * 0.06) * 2)
+            bob = int(phase_sin[0.06] * 2)
 
             # Cloud shape (overlapping circles)
             for cx, cy, cr in [
@@ -2128,7 +2533,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             scope_gap = int(8 * scale)
 
             # Scanning animation
-            scan_angle = math.sin(frame * 0.04) * 0.3
+            scan_angle = phase_sin[0.04] * 0.3
 
             # Left lens
             left_x = scope_x - scope_gap
@@ -2137,7 +2542,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 fill=(60, 60, 80), outline=(40, 40, 50), width=2
             )
             # Lens glint
-            glint_offset = int(math.sin(frame * 0.1) * 3)
+            glint_offset = int(phase_sin[0.1] * 3)
             self.draw.ellipse(
                 [left_x - 3 + glint_offset, scope_y - 5, left_x + 1 + glint_offset, scope_y - 1],
                 fill=(150, 180, 255)
@@ -2186,14 +2591,11 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     arc_alpha = int(255 * (1 - wave_phase / 1.5))
 
                     # Draw arc segments
-                    for angle in range(-30, 31, 10):
-                        rad = math.radians(angle)
+                    arc_color = (arc_alpha, arc_alpha, 255)
+                    for rad in self._WAVE_ARC_RADIANS:
                         ax = wave_x + int(math.cos(rad) * arc_r)
                         ay = wave_y + int(math.sin(rad) * arc_r * 0.5)
-                        self.draw.ellipse(
-                            [ax - 2, ay - 2, ax + 2, ay + 2],
-                            fill=(arc_alpha, arc_alpha, 255)
-                        )
+                        self.draw.ellipse([ax - 2, ay - 2, ax + 2, ay + 2], fill=arc_color)
 
             # Central speaker/antenna icon
             self.draw.polygon(
@@ -2206,16 +2608,34 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             # Subtle floating sparkles/dust motes when idle
             for i in range(4):
                 sparkle_phase = (frame * 0.03 + i * 1.5) % (2 * math.pi)
-                sparkle_x = x + int(math.cos(sparkle_phase + i) * 40 * scale)
-                sparkle_y = body_y - int(20 * scale) + int(math.sin(sparkle_phase * 2) * 30)
-                sparkle_alpha = int(100 + 100 * math.sin(sparkle_phase))
+                sparkle_sin = math.sin(sparkle_phase)
+                sparkle_alpha = int(100 + 100 * sparkle_sin)
 
                 if sparkle_alpha > 50:
-                    size = int(2 * scale * (0.5 + 0.5 * math.sin(sparkle_phase)))
-                    self.draw.ellipse(
-                        [sparkle_x - size, sparkle_y - size, sparkle_x + size, sparkle_y + size],
-                        fill=(255, 255, 200, sparkle_alpha)
-                    )
+                    sparkle_x = x + int(math.cos(sparkle_phase + i) * 40 * scale)
+                    sparkle_y = body_y - int(20 * scale) + int(math.sin(sparkle_phase * 2) * 30)
+                    size = int(2 * scale * (0.5 + 0.5 * sparkle_sin))
+                    # Blend into the scene through a coverage mask so the frame
+                    # stays opaque (ImageDraw would write the alpha through)
+                    mask = Image.new("L", (size * 2 + 1, size * 2 + 1), 0)
+                    ImageDraw.Draw(mask).ellipse([0, 0, size * 2, size * 2], fill=sparkle_alpha)
+                    self.frame.paste((255, 255, 200), (sparkle_x - size, sparkle_y - size), mask)
+
+    def _draw_text_cached(self, xy: tuple[int, int], text: str, fill: tuple) -> None:
+        """Draw default-font text by pasting a cached glyph mask.
+
+        Equivalent to ``self.draw.text(xy, text, fill=fill)`` on the opaque
+        frame, but the string is only rasterized once.
+        """
+        mask = self._text_mask_cache.get(text)
+        if mask is None:
+            if len(self._text_mask_cache) >= 256:
+                self._text_mask_cache.clear()
+            _, _, right, bottom = self.draw.textbbox((0, 0), text)
+            mask = Image.new("L", (max(1, right), max(1, bottom)), 0)
+            ImageDraw.Draw(mask).text((0, 0), text, fill=255)
+            self._text_mask_cache[text] = mask
+        self.frame.paste(fill, xy, mask)
 
     def _render_tool_spinner(self, state: GameState) -> None:
         """Render tool-specific spinner/indicator near Claude."""
@@ -2223,9 +2643,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         if not tool or state.main_agent.activity.value == "idle":
             return
 
-        scale = min(self.width / 800, self.height / 400)
-        scale = max(0.5, min(scale, 2.0))
-        max(2, self.height // 120)
+        scale = self._ui_scale
 
         # Position spinner to the right of Claude
         center_x = self.width // 2
@@ -2238,7 +2656,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Tool-specific spinner animations
         if tool in ["Read"]:
             # Page flip animation - book pages
-            page_offset = int((frame % 30) / 10)
+            page_offset = frame % 30 // 10
             book_colors = [(200, 180, 150), (220, 200, 170), (240, 220, 190)]
             book_w = int(20 * scale)
             book_h = int(16 * scale)
@@ -2249,8 +2667,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 outline=(100, 80, 60)
             )
             # Page lines
+            line_top = spinner_y + int(4 * scale)
+            line_gap = int(3 * scale)
             for i in range(3):
-                line_y = spinner_y + int(4 * scale) + i * int(3 * scale)
+                line_y = line_top + i * line_gap
                 self.draw.line(
                     [(spinner_x + 3, line_y), (spinner_x + book_w - 3, line_y)],
                     fill=(80, 60, 40),
@@ -2259,7 +2679,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         elif tool in ["Write", "Edit"]:
             # Pencil wiggle with writing particles
-            wiggle = int(3 * math.sin(frame * 0.4))
+            wiggle = int(3 * self._phase_sines(frame)[0.4])
             pencil_len = int(20 * scale)
             # Pencil body (yellow)
             self.draw.rectangle(
@@ -2296,7 +2716,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 outline=(60, 60, 80)
             )
             # Prompt
-            self.draw.text((spinner_x + 2, spinner_y + 2), ">", fill=(100, 255, 100))
+            self._draw_text_cached((spinner_x + 2, spinner_y + 2), ">", (100, 255, 100))
             # Cursor
             if cursor_visible:
                 cursor_x = spinner_x + int(10 * scale)
@@ -2307,9 +2727,9 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         elif tool in ["Grep", "Glob"]:
             # Magnifying glass sweep
-            sweep_angle = (frame % 60) * 6  # 0-360 over 60 frames
-            glass_x = spinner_x + int(10 * scale) + int(8 * math.cos(math.radians(sweep_angle)))
-            glass_y = spinner_y + int(8 * scale) + int(4 * math.sin(math.radians(sweep_angle)))
+            sweep_cos, sweep_sin = self._SWEEP_TABLE[frame % 60]  # 0-360 over 60 frames
+            glass_x = spinner_x + int(10 * scale) + int(8 * sweep_cos)
+            glass_y = spinner_y + int(8 * scale) + int(4 * sweep_sin)
             glass_r = int(8 * scale)
             # Glass circle
             self.draw.ellipse(
@@ -2355,10 +2775,12 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 [1, 0, 0, 0, 1, 1],  # ⠏
             ]
             dot_size = int(3 * scale)
+            dot_step_x = int(8 * scale)
+            dot_step_y = int(6 * scale)
             for i, (dx, dy) in enumerate(dot_positions):
                 if pattern[dot_idx][i]:
-                    dx_px = spinner_x + dx * int(8 * scale)
-                    dy_px = spinner_y + dy * int(6 * scale)
+                    dx_px = spinner_x + dx * dot_step_x
+                    dy_px = spinner_y + dy * dot_step_y
                     self.draw.ellipse(
                         [dx_px, dy_px, dx_px + dot_size, dy_px + dot_size],
                         fill=(100, 200, 255)
@@ -2428,29 +2850,41 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         """Render particle effects."""
         self.particle_count = len(state.particles)
 
-        for particle in state.particles:
-            # Skip dead particles
-            if particle.lifetime <= 0 or particle.max_lifetime <= 0:
-                continue
+        # Skip dead particles
+        alive = [p for p in state.particles if p.lifetime > 0 and p.max_lifetime > 0]
+        if not alive:
+            return
+
+        # Simple screen-space particles (no camera transform for idle game style)
+        # Center the particle system around Claude
+        center_x = self.width // 2
+        center_y = int(self.height * 0.55)
+        agent_pos = state.main_agent.position
+
+        pos = np.array([(p.position.x, p.position.y) for p in alive], dtype=np.float64)
+        life = np.array([(p.lifetime, p.max_lifetime, p.scale) for p in alive], dtype=np.float64)
+        base_colors = np.array([p.color for p in alive], dtype=np.float64)
 
-            # Simple screen-space particles (no camera transform for idle game style)
-            # Center the particle system around Claude
-            center_x = self.width // 2
-            center_y = int(self.height * 0.55)
+        screen_x = center_x + (pos[:, 0] - agent_pos.x).astype(np.int64)
+        screen_y = center_y + (pos[:, 1] - agent_pos.y).astype(np.int64)
 
-            screen_x = center_x + int(particle.position.x - state.main_agent.position.x)
-            screen_y = center_y + int(particle.position.y - state.main_agent.position.y)
+        # Clamp alpha to valid range
+        alpha = np.clip(life[:, 0] / life[:, 1], 0.0, 1.0)
+        colors = np.clip((base_colors * alpha[:, None]).astype(np.int64), 0, 255)
+        sizes = np.maximum(1, (4 * life[:, 2] * alpha).astype(np.int64))
 
-            # Clamp alpha to valid range
-            alpha = max(0.0, min(1.0, particle.lifetime / particle.max_lifetime))
-            color = tuple(max(0, min(255, int(c * alpha))) for c in particle.color)
-            size = max(1, int(4 * particle.scale * alpha))
+        # Cull particles whose disc lies entirely off the frame
+        onscreen = ((screen_x + sizes >= 0) & (screen_y + sizes >= 0)
+                    & (screen_x - sizes < self.width) & (screen_y - sizes < self.height))
+        if not onscreen.all():
+            screen_x, screen_y = screen_x[onscreen], screen_y[onscreen]
+            sizes, colors = sizes[onscreen], colors[onscreen]
 
-            # Validate ellipse coordinates before drawing
-            x1, y1 = screen_x - size, screen_y - size
-            x2, y2 = screen_x + size, screen_y + size
-            if x2 > x1 and y2 > y1:
-                self.draw.ellipse([x1, y1, x2, y2], fill=color)
+        # Each particle is a filled disc
+        ellipse = self.draw.ellipse
+        for sx, sy, size, color in zip(screen_x.tolist(), screen_y.tolist(),
+                                       sizes.tolist(), colors.tolist()):
+            ellipse([sx - size, sy - size, sx + size, sy + size], fill=tuple(color))
 
     def _render_floating_texts(self, state: GameState) -> None:
         """Render floating text popups (e.g., +5 XP)."""
@@ -2468,10 +2902,6 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             # Calculate alpha (fade out)
             alpha = ft.alpha
 
-            # Scale text size based on screen
-            scale = min(self.width / 800, self.height / 400)
-            scale = max(0.5, min(scale, 2.0))
-
             # Color with alpha
             color = tuple(int(c * alpha) for c in ft.color)
 
@@ -2480,18 +2910,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
             # Draw outline (4 directions)
             for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                self.draw.text(
-                    (screen_x + dx, screen_y + dy),
-                    ft.text,
-                    fill=outline_color
-                )
+                self._draw_text_cached((screen_x + dx, screen_y + dy), ft.text, outline_color)
 
             # Draw main text
-            self.draw.text(
-                (screen_x, screen_y),
-                ft.text,
-                fill=color
-            )
+            self._draw_text_cached((screen_x, screen_y), ft.text, color)
 
     def _render_level_up_overlay(self, state: GameState) -> None:
         """Render level-up celebration overlay."""
@@ -2501,15 +2923,16 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Calculate animation progress (0 to 1, where 1 is start of animation)
         progress = state.progression.level_up_timer / 3.0  # 3 second duration
 
-        scale = min(self.width / 800, self.height / 400)
-        scale = max(0.5, min(scale, 2.0))
-
         # Flash effect at the start
         if progress > 0.9:
             flash_alpha = int((progress - 0.9) * 10 * 100)
-            overlay = Image.new("RGBA", (self.width, self.height), (255, 255, 255, flash_alpha))
-            self.frame = Image.alpha_composite(self.frame, overlay)
-            self.draw = ImageDraw.Draw(self.frame)
+            # Refill one reused overlay rather than allocating a frame-sized image
+            overlay = self._stamp_cache.get(("flash_overlay",))
+            if overlay is None:
+                overlay = Image.new("RGBA", (self.width, self.height))
+                self._stamp_cache[("flash_overlay",)] = overlay
+            overlay.paste((255, 255, 255, flash_alpha), (0, 0, self.width, self.height))
+            self.frame.alpha_composite(overlay)
 
         # "LEVEL UP!" banner
         if progress > 0.3:
@@ -2519,9 +2942,6 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             banner_y = int(self.height * 0.25)
             banner_text = "LEVEL UP!"
 
-            # Pulsing scale effect
-            1.0 + 0.1 * math.sin(self._frame_count * 0.3)
-
             # Gold color with fade
             gold = (255, 215, 0)
             color = tuple(int(c * banner_alpha) for c in gold)
@@ -2533,30 +2953,34 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
             # Draw outline
             for dx, dy in [(-2, 0), (2, 0), (0, -2), (0, 2), (-2, -2), (2, 2), (-2, 2), (2, -2)]:
-                self.draw.text((text_x + dx, text_y + dy), banner_text, fill=outline_color)
+                self._draw_text_cached((text_x + dx, text_y + dy), banner_text, outline_color)
 
             # Draw main text
-            self.draw.text((text_x, text_y), banner_text, fill=color)
+            self._draw_text_cached((text_x, text_y), banner_text, color)
 
             # Level number below
             level_text = f"Level {state.progression.level}"
             level_x = self.width // 2 - len(level_text) * 3
-            self.draw.text((level_x, text_y + 20), level_text, fill=color)
+            self._draw_text_cached((level_x, text_y + 20), level_text, color)
 
         # Confetti particles
         if progress > 0.5:
-            import random
-            random.seed(int(self._frame_count / 2))
+            # A private RNG keeps the original random.seed(frame / 2) layout without
+            # resetting the global generator the particle system draws from
+            seed = self._frame_count // 2
+            if self._confetti[0] != seed:
+                rng = random.Random(seed)
+                self._confetti = (seed, [
+                    (rng.randint(0, self.width), rng.randint(0, self.height), rng.randint(2, 5))
+                    for _ in range(20)
+                ])
             confetti_colors = [
                 (255, 100, 100), (100, 255, 100), (100, 100, 255),
                 (255, 255, 100), (255, 100, 255), (100, 255, 255),
             ]
-            for i in range(20):
-                x = random.randint(0, self.width)
-                y = random.randint(0, self.height)
+            for i, (x, y, size) in enumerate(self._confetti[1]):
                 # Fall down over time
                 y = (y + int((1 - progress) * 200)) % self.height
-                size = random.randint(2, 5)
                 color = confetti_colors[i % len(confetti_colors)]
                 alpha_color = tuple(int(c * progress) for c in color)
                 self.draw.rectangle(
@@ -2564,51 +2988,56 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     fill=alpha_color
                 )
 
-    def _render_stats_panel(self, state: GameState) -> None:
-        """Render pixel art wood panel UI at the bottom like the reference."""
-        px = max(2, self.height // 120)
-        scale = min(self.width / 800, self.height / 400)
-        scale = max(0.5, min(scale, 2.0))
+    def _get_stats_panel_background(self, px: int, scale: float, panel_y: int) -> Image.Image:
+        """Get the static stats panel (wood, grain, coin icon) as an opaque image.
 
-        panel_h = int(55 * scale)
-        panel_y = self.height - panel_h
+        The image covers the full width from the top of the border down to the
+        bottom of the frame.
+        """
+        key = ("stats_panel", px, scale, panel_y)
+        panel = self._stamp_cache.get(key)
+        if panel is not None:
+            return panel
 
-        # Wood panel background with border
         border_size = px * 2
+        panel_top = panel_y - border_size
+        panel = Image.new("RGBA", (self.width, self.height - panel_top), (0, 0, 0, 255))
+        draw = ImageDraw.Draw(panel)
+        # Draw in frame coordinates shifted up to the panel's top row
+        panel_y -= panel_top
+        height = self.height - panel_top
 
         # Dark border/outline
-        self.draw.rectangle(
-            [0, panel_y - border_size, self.width, self.height],
+        draw.rectangle(
+            [0, panel_y - border_size, self.width, height],
             fill=self.COLORS["ui_border"]
         )
 
         # Main wood panel
-        self.draw.rectangle(
-            [border_size, panel_y, self.width - border_size, self.height - border_size],
+        draw.rectangle(
+            [border_size, panel_y, self.width - border_size, height - border_size],
             fill=self.COLORS["ui_bg"]
         )
 
         # Wood grain lines (horizontal)
-        for wy in range(panel_y + px * 3, self.height - border_size, px * 4):
-            self.draw.rectangle(
+        for wy in range(panel_y + px * 3, height - border_size, px * 4):
+            draw.rectangle(
                 [border_size + px, wy, self.width - border_size - px, wy + px],
                 fill=self.COLORS["ui_bg_dark"]
             )
 
-        # === Left section: Level with gold coin icon ===
+        # Gold coin icon
         margin = int(12 * scale)
         level_x = margin + border_size
         level_y = panel_y + int(10 * scale)
-
-        # Gold coin icon
         coin_size = int(20 * scale)
         # Coin outline
-        self.draw.ellipse(
+        draw.ellipse(
             [level_x - px, level_y - px, level_x + coin_size + px, level_y + coin_size + px],
             fill=self.COLORS["outline"]
         )
         # Coin body
-        self.draw.ellipse(
+        draw.ellipse(
             [level_x, level_y, level_x + coin_size, level_y + coin_size],
             fill=self.COLORS["accent_primary"]
         )
@@ -2616,13 +3045,36 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         shine_x1, shine_y1 = level_x + px * 2, level_y + px * 2
         shine_x2, shine_y2 = level_x + coin_size // 2, level_y + coin_size // 2
         if shine_x2 > shine_x1 and shine_y2 > shine_y1:
-            self.draw.ellipse([shine_x1, shine_y1, shine_x2, shine_y2], fill=(255, 230, 100))
+            draw.ellipse([shine_x1, shine_y1, shine_x2, shine_y2], fill=(255, 230, 100))
+
+        self._stamp_cache[key] = panel
+        return panel
+
+    def _render_stats_panel(self, state: GameState) -> None:
+        """Render pixel art wood panel UI at the bottom like the reference."""
+        px = self._px
+        scale = self._ui_scale
+        colors = self.COLORS
+
+        panel_h = int(55 * scale)
+        panel_y = self.height - panel_h
+
+        # Wood panel, border, grain and coin icon never change - paste cached copy
+        border_size = px * 2
+        panel_top = panel_y - border_size
+        self.frame.paste(self._get_stats_panel_background(px, scale, panel_y), (0, panel_top))
+
+        # === Left section: Level with gold coin icon ===
+        margin = int(12 * scale)
+        level_x = margin + border_size
+        level_y = panel_y + int(10 * scale)
+        coin_size = int(20 * scale)
 
         # Token count
-        self.draw.text(
+        self._draw_text_cached(
             (level_x + coin_size + px * 3, level_y + px),
             f"{state.resources.tokens}",
-            fill=self.COLORS["ui_text"]
+            colors["ui_text"]
         )
 
         # === Center: Level bar ===
@@ -2634,12 +3086,12 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Level text above bar (with pulse on level-up)
         level_text = f"LEVEL {state.progression.level}"
         text_x = bar_x + bar_w // 2 - len(level_text) * 3
-        level_color = self.COLORS["ui_text"]
+        level_color = colors["ui_text"]
         if state.progression.level_up_timer > 0:
             # Pulse gold during level-up celebration
-            pulse = int(127 + 127 * math.sin(self._frame_count * 0.4))
+            pulse = int(127 + 127 * self._phase_sines(self._frame_count)[0.4])
             level_color = (255, 200 + pulse // 4, pulse // 2)
-        self.draw.text((text_x, bar_y - int(2 * scale)), level_text, fill=level_color)
+        self._draw_text_cached((text_x, bar_y - int(2 * scale)), level_text, level_color)
 
         # Use animated display_xp for smooth fill
         display_xp = state.progression.display_xp if hasattr(state.progression, 'display_xp') else state.progression.experience
@@ -2648,9 +3100,6 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Glow effect when close to level-up (last 20%)
         bar_inner_y = bar_y + int(12 * scale)
         if xp_pct > 0.8:
-            glow_intensity = (xp_pct - 0.8) / 0.2  # 0 to 1
-            glow_pulse = 0.5 + 0.5 * math.sin(self._frame_count * 0.2)
-            int(glow_intensity * glow_pulse * 60)
             # Draw glow around bar
             for glow_offset in range(1, 4):
                 self.draw.rectangle(
@@ -2659,15 +3108,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     outline=(200, 100, 255)
                 )
 
-        # XP bar outline
+        # XP bar background with its outline in one call
         self.draw.rectangle(
             [bar_x - px, bar_inner_y - px, bar_x + bar_w + px, bar_inner_y + bar_h + px],
-            fill=self.COLORS["outline"]
-        )
-        # Bar background
-        self.draw.rectangle(
-            [bar_x, bar_inner_y, bar_x + bar_w, bar_inner_y + bar_h],
-            fill=(40, 30, 50)
+            fill=(40, 30, 50), outline=colors["outline"], width=px
         )
 
         # Milestone markers at 25%, 50%, 75%
@@ -2686,7 +3130,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             # Only draw if rectangle has valid dimensions (x1 > x0)
             if fill_w > px * 2:
                 # Determine fill color - pulse brighter on XP gain
-                fill_color = self.COLORS["accent_xp"]
+                fill_color = colors["accent_xp"]
                 if state.progression.xp_gain_flash > 0:
                     flash_intensity = state.progression.xp_gain_flash / 0.5
                     pulse_bright = int(flash_intensity * 50)
@@ -2709,10 +3153,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         # XP text
         xp_text = f"{state.progression.experience}/{state.progression.experience_to_next}"
-        self.draw.text(
+        self._draw_text_cached(
             (bar_x + bar_w + px * 4, bar_y + int(14 * scale)),
             xp_text,
-            fill=self.COLORS["ui_text"]
+            colors["ui_text"]
         )
 
         # === Right section: Tools and agents counts ===
@@ -2723,32 +3167,32 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         # Tools icon (hammer/wrench shape)
         self.draw.rectangle(
             [right_x, icon_y, right_x + icon_size, icon_y + icon_size],
-            fill=self.COLORS["accent_secondary"]
+            fill=colors["accent_secondary"]
         )
         self.draw.rectangle(
             [right_x - px, icon_y - px, right_x + icon_size + px, icon_y + icon_size + px],
-            outline=self.COLORS["outline"]
+            outline=colors["outline"]
         )
-        self.draw.text(
+        self._draw_text_cached(
             (right_x + icon_size + px * 3, icon_y),
             f"{state.progression.total_tools_used}",
-            fill=self.COLORS["ui_text"]
+            colors["ui_text"]
         )
 
         # Agents icon (person shape)
         agent_x = right_x + int(50 * scale)
         self.draw.ellipse(
             [agent_x, icon_y, agent_x + icon_size, icon_y + icon_size],
-            fill=self.COLORS["accent_success"]
+            fill=colors["accent_success"]
         )
         self.draw.rectangle(
             [agent_x - px, icon_y - px, agent_x + icon_size + px, icon_y + icon_size + px],
-            outline=self.COLORS["outline"]
+            outline=colors["outline"]
         )
-        self.draw.text(
+        self._draw_text_cached(
             (agent_x + icon_size + px * 3, icon_y),
             f"{state.progression.total_subagents_spawned}",
-            fill=self.COLORS["ui_text"]
+            colors["ui_text"]
         )
 
         # === API Cost Tracker (top right corner) ===
@@ -2781,10 +3225,10 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
 
         # Cost header
         cost_text = f"${api_costs.total_cost_usd:.4f}"
-        self.draw.text(
+        self._draw_text_cached(
             (panel_x + px * 2, panel_y + px * 2),
             cost_text,
-            fill=self.COLORS["accent_primary"]
+            self.COLORS["accent_primary"]
         )
 
         # Token breakdown (compact)
@@ -2796,26 +3240,24 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         else:
             token_text = f"{api_costs.total_tokens} tok"
 
-        self.draw.text(
+        self._draw_text_cached(
             (panel_x + px * 2, panel_y + px * 2 + int(14 * scale)),
             token_text,
-            fill=(180, 180, 200)
+            (180, 180, 200)
         )
 
         # Input/Output split
         in_k = api_costs.input_tokens / 1000
         out_k = api_costs.output_tokens / 1000
         split_text = f"in:{in_k:.0f}k out:{out_k:.0f}k"
-        self.draw.text(
+        self._draw_text_cached(
             (panel_x + px * 2, panel_y + px * 2 + int(26 * scale)),
             split_text,
-            fill=(140, 140, 160)
+            (140, 140, 160)
         )
 
     def _render_activity_indicator(self, state: GameState) -> None:
         """Render activity indicator as pixel art banner at top of screen."""
-        import time
-
         activity = state.main_agent.activity.value
 
         # Get the display text - use current tool, or recent last_tool if within display window
@@ -2838,10 +3280,22 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         else:
             # For thinking, try to read the actual verb from Claude Code's terminal
             if activity == "thinking":
-                # Only refresh verb cache every 10 frames (~0.3s at 30fps)
-                if self._frame_count - self._verb_cache_frame >= 10:
-                    self._cached_verb = self._get_claude_code_verb()
+                # Refresh the verb cache every 10 frames (~0.3s at 30fps), backing
+                # off to every 60 frames while no status line is found
+                if self._frame_count - self._verb_cache_frame >= self._verb_poll_interval:
+                    # The pane layout rarely changes - relist it every ~10s
+                    if (self._pane_ids is None
+                            or self._frame_count - self._pane_ids_frame >= self._PANE_LIST_TTL):
+                        self._pane_ids = self._get_other_tmux_panes()
+                        self._pane_ids_frame = self._frame_count
+                    self._cached_verb = self._get_claude_code_verb(self._pane_ids)
                     self._verb_cache_frame = self._frame_count
+                    if self._cached_verb:
+                        self._verb_poll_interval = self._VERB_POLL_MIN
+                    else:
+                        self._verb_poll_interval = min(
+                            self._verb_poll_interval * 2, self._VERB_POLL_MAX
+                        )
 
                 if self._cached_verb:
                     display_text = f"{self._cached_verb}..."
@@ -2850,21 +3304,12 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     verb_index = (self._frame_count // 60) % len(self.THINKING_VERBS)
                     display_text = self.THINKING_VERBS[verb_index]
             else:
-                activity_verbs = {
-                    "reading": "Reading...",
-                    "writing": "Writing...",
-                    "searching": "Searching...",
-                    "building": "Building...",
-                    "exploring": "Exploring...",
-                    "communicating": "Connecting...",
-                    "resting": "Resting...",
-                    "celebrating": "Celebrating!",
-                }
-                display_text = activity_verbs.get(activity, activity.title() + "...")
-
-        px = max(2, self.height // 120)
-        scale = min(self.width / 800, self.height / 400)
-        scale = max(0.5, min(scale, 2.0))
+                display_text = self.ACTIVITY_VERBS.get(activity)
+                if display_text is None:
+                    display_text = activity.title() + "..."
+
+        px = self._px
+        scale = self._ui_scale
 
         # Get agent's actual screen position
         # Agent position is relative offset from center, so convert to screen coords
@@ -2889,21 +3334,11 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         banner_y = max(px * 2, banner_y)
 
         # Pulsing animation
-        pulse = (self._frame_count % 30) < 15
-
-        # Banner outline (black border)
-        self.draw.rectangle(
-            [banner_x - px * 2, banner_y - px * 2,
-             banner_x + banner_w + px * 2, banner_y + banner_h + px * 2],
-            fill=self.COLORS["outline"]
-        )
+        pulse = self._BANNER_PULSE_TABLE[self._frame_count % 30]
 
-        # Banner background (gold/yellow, slightly different on pulse)
-        banner_color = (255, 255, 255) if pulse else (245, 245, 245)
-        self.draw.rectangle(
-            [banner_x, banner_y, banner_x + banner_w, banner_y + banner_h],
-            fill=banner_color
-        )
+        # Outlined banner, rendered once per size and pulse state
+        banner = self._get_banner_sprite(pulse, banner_w, banner_h, px)
+        self.frame.paste(banner, (banner_x - px * 2, banner_y - px * 2))
 
         # Small pointer/tail pointing down toward Claude
         # Pointer points to actual agent position, but stays within banner bounds
@@ -2924,24 +3359,41 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         )
 
         # Activity text (dark text on light background)
+        # Drawn on the frame, not the sprite, since long text can run past the banner
         text_x = banner_x + int(8 * scale)
         text_y = banner_y + px
-        self.draw.text((text_x, text_y), display_text, fill=self.COLORS["ui_text_dark"])
+        self._draw_text_cached((text_x, text_y), display_text, self.COLORS["ui_text_dark"])
+
+    def _get_banner_sprite(self, pulse: bool, banner_w: int, banner_h: int, px: int) -> Image.Image:
+        """Get the opaque activity banner: black border and background."""
+        key = ("banner", pulse, banner_w, banner_h, px)
+        sprite = self._stamp_cache.get(key)
+        if sprite is None:
+            sprite = Image.new("RGBA", (banner_w + px * 4 + 1, banner_h + px * 4 + 1),
+                               self.COLORS["outline"] + (255,))
+            sprite_draw = ImageDraw.Draw(sprite)
+            # Banner background (gold/yellow, slightly different on pulse)
+            banner_color = (255, 255, 255) if pulse else (245, 245, 245)
+            sprite_draw.rectangle([px * 2, px * 2, banner_w + px * 2, banner_h + px * 2], fill=banner_color)
+            self._stamp_cache[key] = sprite
+        return sprite
 
     def _render_achievement_popups(self, state: GameState) -> None:
         """Render achievement unlock popups sliding in from the right."""
         if not hasattr(state, 'achievement_popups') or not state.achievement_popups:
             return
 
-        scale = min(self.width / 800, self.height / 400)
-        scale = max(0.5, min(scale, 2.0))
-        px = max(2, self.height // 120)
+        scale = self._ui_scale
+        px = self._px
 
         # Stack popups from bottom-right
         popup_h = int(50 * scale)
         popup_w = int(180 * scale)
         margin = int(10 * scale)
         start_y = int(self.height * 0.3)
+        draw = self.draw
+        outline = self.COLORS["outline"]
+        accent = self.COLORS["accent_primary"]
 
         for i, popup in enumerate(state.achievement_popups[:3]):  # Max 3 visible
             achievement = popup.achievement
@@ -2962,20 +3414,20 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             popup_y = start_y + i * (popup_h + margin)
 
             # Popup background with border
-            self.draw.rectangle(
+            draw.rectangle(
                 [popup_x - px, popup_y - px, popup_x + popup_w + px, popup_y + popup_h + px],
-                fill=self.COLORS["outline"]
+                fill=outline
             )
-            self.draw.rectangle(
+            draw.rectangle(
                 [popup_x, popup_y, popup_x + popup_w, popup_y + popup_h],
                 fill=(50, 45, 60)
             )
 
             # Gold accent bar on left
             accent_w = int(4 * scale)
-            self.draw.rectangle(
+            draw.rectangle(
                 [popup_x, popup_y, popup_x + accent_w, popup_y + popup_h],
-                fill=self.COLORS["accent_primary"]
+                fill=accent
             )
 
             # Icon
@@ -2983,34 +3435,25 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             icon_x = popup_x + accent_w + int(8 * scale)
             icon_y = popup_y + (popup_h - icon_size) // 2
             # Draw icon background circle
-            self.draw.ellipse(
+            draw.ellipse(
                 [icon_x, icon_y, icon_x + icon_size, icon_y + icon_size],
                 fill=(80, 70, 100)
             )
             # Draw icon text (emoji)
             icon_text_x = icon_x + icon_size // 2 - 4
             icon_text_y = icon_y + icon_size // 2 - 6
-            self.draw.text((icon_text_x, icon_text_y), achievement.icon, fill=(255, 255, 255))
+            self._draw_text_cached((icon_text_x, icon_text_y), achievement.icon, (255, 255, 255))
 
             # Achievement text
             text_x = icon_x + icon_size + int(8 * scale)
 
             # "ACHIEVEMENT" header
             header_y = popup_y + int(6 * scale)
-            self.draw.text(
-                (text_x, header_y),
-                "ACHIEVEMENT",
-                fill=(150, 140, 160)
-            )
+            self._draw_text_cached((text_x, header_y), "ACHIEVEMENT", (150, 140, 160))
 
             # Achievement name
             name_y = header_y + int(12 * scale)
-            name_color = self.COLORS["accent_primary"]
-            self.draw.text(
-                (text_x, name_y),
-                achievement.name,
-                fill=name_color
-            )
+            self._draw_text_cached((text_x, name_y), achievement.name, accent)
 
             # Description (if space)
             if popup_h > int(45 * scale):
@@ -3020,11 +3463,7 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                 max_chars = int((popup_w - icon_size - 30) / 5)
                 if len(desc_text) > max_chars:
                     desc_text = desc_text[:max_chars - 3] + "..."
-                self.draw.text(
-                    (text_x, desc_y),
-                    desc_text,
-                    fill=(120, 110, 130)
-                )
+                self._draw_text_cached((text_x, desc_y), desc_text, (120, 110, 130))
 
             # Sparkle effect
             if progress < 0.5:
@@ -3035,89 +3474,160 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
                     sparkle_y = popup_y + popup_h // 2 + int(math.sin(angle) * 20)
                     sparkle_size = int(3 * scale * (0.5 - progress))
                     if sparkle_size > 0:
-                        self.draw.ellipse(
+                        draw.ellipse(
                             [sparkle_x - sparkle_size, sparkle_y - sparkle_size,
                              sparkle_x + sparkle_size, sparkle_y + sparkle_size],
-                            fill=self.COLORS["accent_primary"]
+                            fill=accent
                         )
 
-    def _draw_rounded_rect(self, x1: int, y1: int, x2: int, y2: int,
-                           radius: int, fill=None, outline=None) -> None:
-        """Draw a rounded rectangle."""
-        # Clamp radius
-        radius = min(radius, (x2 - x1) // 2, (y2 - y1) // 2)
-
-        if fill:
-            # Main rectangle
-            self.draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-            self.draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
-            # Corners
-            self.draw.ellipse([x1, y1, x1 + radius * 2, y1 + radius * 2], fill=fill)
-            self.draw.ellipse([x2 - radius * 2, y1, x2, y1 + radius * 2], fill=fill)
-            self.draw.ellipse([x1, y2 - radius * 2, x1 + radius * 2, y2], fill=fill)
-            self.draw.ellipse([x2 - radius * 2, y2 - radius * 2, x2, y2], fill=fill)
-
-        if outline:
-            # Draw outline arcs and lines
-            self.draw.arc([x1, y1, x1 + radius * 2, y1 + radius * 2], 180, 270, fill=outline)
-            self.draw.arc([x2 - radius * 2, y1, x2, y1 + radius * 2], 270, 360, fill=outline)
-            self.draw.arc([x1, y2 - radius * 2, x1 + radius * 2, y2], 90, 180, fill=outline)
-            self.draw.arc([x2 - radius * 2, y2 - radius * 2, x2, y2], 0, 90, fill=outline)
-            self.draw.line([(x1 + radius, y1), (x2 - radius, y1)], fill=outline)
-            self.draw.line([(x1 + radius, y2), (x2 - radius, y2)], fill=outline)
-            self.draw.line([(x1, y1 + radius), (x1, y2 - radius)], fill=outline)
-            self.draw.line([(x2, y1 + radius), (x2, y2 - radius)], fill=outline)
-
     def _display_frame(self) -> None:
         """Display the frame using the appropriate terminal protocol."""
+        if self._async_output and self._writer is None:
+            # The writer thread takes over the terminal fd - let anything
+            # already buffered on sys.stdout reach it first
+            sys.stdout.flush()
+            self._writer = FrameWriter()
+
+        frame_bytes = self.frame.tobytes()
+        previous_bytes = self._last_frame_bytes
+        if self._writer is not None and self._writer.take_dropped():
+            # A queued frame never reached the terminal, so the screen may not
+            # match previous_bytes - resend in full, even if nothing changed
+            previous_bytes = None
+        elif not self._first_frame and frame_bytes == previous_bytes:
+            # Nothing visible changed since the last frame - skip encoding and output
+            return
+
+        # With a background writer, collect the frame and hand it off instead
+        # of blocking on the terminal
+        out = FrameBuffer() if self._writer is not None else sys.stdout
+
         if self.protocol == "kitty":
-            self._display_kitty()
+            self._display_kitty(out, frame_bytes, previous_bytes)
         elif self.protocol == "iterm2":
-            self._display_iterm2()
+            self._display_iterm2(out)
         elif self.protocol == "sixel":
-            self._display_sixel()
+            if not self._display_sixel(out):
+                # Nothing reached the terminal - don't let the next identical
+                # frame be skipped as unchanged
+                return
         else:
             self.frame.save("/tmp/claude_world_frame.png")
             if self._first_frame:
-                print("\033[2J\033[H[Frame saved to /tmp/claude_world_frame.png]")
+                out.write("\033[2J\033[H[Frame saved to /tmp/claude_world_frame.png]\n")
+
+        if self._writer is not None:
+            data = out.getvalue()
+            if data:
+                self._writer.submit(data)
+
+        # Only a frame that was actually written counts as on screen
+        self._last_frame_bytes = frame_bytes
+
+    def _display_kitty(self, out: TextIO, frame_bytes: bytes | None = None,
+                       previous_bytes: bytes | None = None) -> None:
+        """Display using Kitty graphics protocol.
+
+        The image is transmitted under a fixed id. Once it is on screen, later
+        frames only send the changed regions, written into the displayed
+        image in place with ``a=f`` edits of its root frame.
+        """
+        if frame_bytes is None:
+            frame_bytes = self.frame.tobytes()
 
-    def _display_kitty(self) -> None:
-        """Display using Kitty graphics protocol."""
         # Clear tmux scrollback every 100 frames to prevent memory leak
         if is_inside_tmux() and (self._frame_count - self._last_scrollback_clear) >= 100:
             self._clear_tmux_scrollback()
             self._last_scrollback_clear = self._frame_count
 
+        regions = None
         if self._first_frame:
-            sys.stdout.write("\033[2J\033[H\033[?25l")
+            parts = [b"\033[2J\033[H\033[?25l"]
             self._first_frame = False
         else:
-            sys.stdout.write("\033[H")
+            parts = []
+            if previous_bytes is not None and len(previous_bytes) == self.width * self.height * 4:
+                regions = self._dirty_regions(frame_bytes, previous_bytes)
+            if regions is None:
+                parts.append(b"\033[H")
+
+        if regions is None:
+            # Full frame: transmit and place the image, replacing the old one
+            # When downsampled, have the terminal scale the image over the cells
+            placement = ""
+            if self.scale > 1 and self._cell_width > 0 and self._cell_height > 0:
+                cols = -(-self.display_width // self._cell_width)
+                rows = -(-self.display_height // self._cell_height)
+                placement = f"c={cols},r={rows},"
+
+            prefix = (
+                f"\033_Ga=T,f=24,s={self.width},v={self.height},o=z,"
+                f"i={self._KITTY_IMAGE_ID},q=2,{placement}m="
+            )
+            self._append_kitty_chunks(parts, prefix, self.frame.convert("RGB").tobytes())
+        else:
+            pixels = np.frombuffer(frame_bytes, dtype=np.uint8).reshape(self.height, self.width, 4)
+            for x1, y1, x2, y2 in regions:
+                prefix = (
+                    f"\033_Ga=f,r=1,i={self._KITTY_IMAGE_ID},q=2,f=24,"
+                    f"x={x1},y={y1},s={x2 - x1},v={y2 - y1},o=z,m="
+                )
+                self._append_kitty_chunks(parts, prefix, pixels[y1:y2, x1:x2, :3].tobytes())
 
-        buf = io.BytesIO()
-        try:
-            self.frame.save(buf, format="PNG")
-            raw_data = buf.getvalue()
-        finally:
-            buf.close()
-            del buf
+        out.buffer.write(b"".join(parts))
+        out.flush()
 
-        data = base64.b64encode(raw_data).decode("ascii")
-        del raw_data  # Free raw bytes
+    def _dirty_regions(self, frame_bytes: bytes,
+                       previous_bytes: bytes) -> list[tuple[int, int, int, int]] | None:
+        """Rectangles (x1, y1, x2, y2) covering pixels changed since the last frame.
 
-        chunk_size = 4096
-        for i in range(0, len(data), chunk_size):
-            chunk = data[i:i+chunk_size]
-            m = 1 if i + chunk_size < len(data) else 0
-            if i == 0:
-                sys.stdout.write(f"\033_Ga=T,f=100,m={m};{chunk}\033\\")
-            else:
-                sys.stdout.write(f"\033_Gm={m};{chunk}\033\\")
+        The frame is split into bands of ``_DIRTY_BAND`` rows and each band
+        with changes contributes the span of columns that changed in it.
+        Returns None when the regions cover most of the frame and a full
+        transmit is cheaper.
+        """
+        current = np.frombuffer(frame_bytes, dtype=np.uint32).reshape(self.height, self.width)
+        previous = np.frombuffer(previous_bytes, dtype=np.uint32).reshape(current.shape)
+        changed = current != previous
+        rows_changed = changed.any(axis=1)
+
+        regions = []
+        area = 0
+        for band_y in range(0, self.height, self._DIRTY_BAND):
+            band_rows = np.flatnonzero(rows_changed[band_y:band_y + self._DIRTY_BAND])
+            if not band_rows.size:
+                continue
+            y1 = band_y + int(band_rows[0])
+            y2 = band_y + int(band_rows[-1]) + 1
+            cols = np.flatnonzero(changed[y1:y2].any(axis=0))
+            x1, x2 = int(cols[0]), int(cols[-1]) + 1
+            regions.append((x1, y1, x2, y2))
+            area += (x2 - x1) * (y2 - y1)
+
+        if area * 2 > self.width * self.height:
+            return None
+        return regions
 
-        del data  # Free base64 string
-        sys.stdout.flush()
+    def _append_kitty_chunks(self, parts: list[bytes], prefix: str, raw_pixels: bytes) -> None:
+        """Append a Kitty graphics command carrying raw RGB pixels.
 
-    def _display_iterm2(self) -> None:
+        The frame is opaque, so pixels go out as raw RGB (f=24), a quarter
+        fewer bytes than RGBA, with fast zlib compression (o=z) rather than
+        a PNG, which costs a full default-level deflate. Chunks
+        are assembled as bytes so the frame reaches the binary buffer in one
+        write, skipping per-chunk str formatting and encoding.
+        """
+        data = base64.b64encode(zlib.compress(raw_pixels, 1))
+        first_prefix = prefix.encode("ascii")
+        chunk_size = 4096
+        data_len = len(data)
+        for i in range(0, data_len, chunk_size):
+            parts.append(first_prefix if i == 0 else b"\033_Gm=")
+            parts.append(b"1;" if i + chunk_size < data_len else b"0;")
+            parts.append(data[i:i + chunk_size])
+            parts.append(b"\033\\")
+
+    def _display_iterm2(self, out: TextIO) -> None:
         """Display using iTerm2 inline images."""
         # Clear tmux scrollback every 100 frames to prevent memory leak
         if is_inside_tmux() and (self._frame_count - self._last_scrollback_clear) >= 100:
@@ -3125,79 +3635,93 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
             self._last_scrollback_clear = self._frame_count
 
         if self._first_frame:
-            sys.stdout.write("\033[2J\033[H\033[?25l")
+            header = b"\033[2J\033[H\033[?25l"
             self._first_frame = False
         else:
-            sys.stdout.write("\033[H")
-
-        buf = io.BytesIO()
-        try:
-            self.frame.save(buf, format="PNG")
-            raw_data = buf.getvalue()
-        finally:
-            buf.close()
-            del buf
+            header = b"\033[H"
 
-        data = base64.b64encode(raw_data).decode("ascii")
-        del raw_data  # Free raw bytes
+        # iTerm2 only takes encoded image files; a low compression level keeps
+        # the PNG encode cheap
+        with self._encode_frame(self.frame, format="PNG", compress_level=1) as raw_data:
+            data = base64.b64encode(raw_data)
 
         if is_inside_tmux():
-            self._display_iterm2_multipart(data)
+            self._display_iterm2_multipart(header, data, out)
         else:
-            img_seq = f"\033]1337;File=inline=1;width={self.width}px;height={self.height}px;preserveAspectRatio=0:{data}\007"
-            sys.stdout.write(img_seq)
-            del img_seq
+            img_prefix = (
+                f"\033]1337;File=inline=1;width={self.display_width}px;"
+                f"height={self.display_height}px;preserveAspectRatio=0:"
+            ).encode("ascii")
+            out.buffer.write(b"".join((header, img_prefix, data, b"\007")))
 
-        del data  # Free base64 string
-        sys.stdout.flush()
+        del data  # Free base64 bytes
+        out.flush()
 
-    def _display_iterm2_multipart(self, data: str) -> None:
+    def _display_iterm2_multipart(self, header: bytes, data: bytes, out: TextIO) -> None:
         """Display image using iTerm2 multipart protocol for tmux."""
         chunk_size = 65536
-        start_seq = f"\033]1337;MultipartFile=inline=1;width={self.width}px;height={self.height}px;preserveAspectRatio=0\007"
-        sys.stdout.write(tmux_wrap(start_seq))
+        start_seq = f"\033]1337;MultipartFile=inline=1;width={self.display_width}px;height={self.display_height}px;preserveAspectRatio=0\007"
+        end_seq = "\033]1337;FileEnd\007"
 
+        # Base64 never contains ESC, so every part shares one wrapped
+        # prefix/suffix and the chunks are spliced in between
+        part_prefix, part_suffix = (
+            tmux_wrap("\033]1337;FilePart=\0\007").encode("ascii").split(b"\0")
+        )
+        parts = [header, tmux_wrap(start_seq).encode("ascii")]
         for i in range(0, len(data), chunk_size):
-            chunk = data[i:i + chunk_size]
-            part_seq = f"\033]1337;FilePart={chunk}\007"
-            sys.stdout.write(tmux_wrap(part_seq))
+            parts += (part_prefix, data[i:i + chunk_size], part_suffix)
+        parts.append(tmux_wrap(end_seq).encode("ascii"))
 
-        end_seq = "\033]1337;FileEnd\007"
-        sys.stdout.write(tmux_wrap(end_seq))
+        out.buffer.write(b"".join(parts))
 
     def _get_tmux_pane_size(self) -> tuple[int, int]:
         """Get the tmux pane size in characters."""
         return self._get_pane_size_static()
 
-    def _display_sixel(self) -> None:
-        """Display using Sixel graphics - scales to fill terminal pane."""
-        if not shutil.which("img2sixel"):
+    def _display_sixel(self, out: TextIO) -> bool:
+        """Display using Sixel graphics - scales to fill terminal pane.
+
+        Returns False if img2sixel failed and nothing was written.
+        """
+        # Search PATH once rather than stat-ing every PATH entry each frame
+        if not self._img2sixel_checked:
+            self._img2sixel_path = shutil.which("img2sixel")
+            self._img2sixel_checked = True
+        if not self._img2sixel_path:
             self.frame.save("/tmp/claude_world_frame.png")
             if self._first_frame:
-                print("[img2sixel not found]")
+                out.write("[img2sixel not found]\n")
                 self._first_frame = False
-            return
-
-        tmp_path = "/tmp/claude_world_frame.png"
-        self.frame.save(tmp_path, format="PNG")
+            return True
 
+        # Pipe an uncompressed BMP over stdin instead of a PNG round-trip
+        # through /tmp - no deflate, no file write, no PNG decode
+        written = False
         try:
-            import subprocess
             # Force exact pixel dimensions to prevent auto-scaling flickering
-            result = subprocess.run(
-                ["img2sixel", "-w", f"{self.width}px", "-h", f"{self.height}px", tmp_path],
-                capture_output=True,
-            )
+            with self._encode_frame(self._sixel_source_image(), format="BMP") as bmp_data:
+                result = subprocess.run(
+                    [
+                        self._img2sixel_path,
+                        "-w", f"{self.display_width}px",
+                        "-h", f"{self.display_height}px",
+                        "-",
+                    ],
+                    input=bmp_data,
+                    capture_output=True,
+                )
             if result.returncode == 0:
                 # Combine cursor positioning with sixel output to prevent flicker
                 # Don't flush between cursor move and image - do it all at once
                 if self._first_frame:
-                    sys.stdout.write("\033[2J\033[H\033[?25l")
+                    out.write("\033[2J\033[H\033[?25l")
                     self._first_frame = False
                 else:
-                    sys.stdout.write("\033[H")
-                sys.stdout.buffer.write(result.stdout)
-                sys.stdout.flush()
+                    out.write("\033[H")
+                out.buffer.write(result.stdout)
+                out.flush()
+                written = True
             # Explicitly delete result to free subprocess buffers
             del result
         except Exception:
@@ -3207,6 +3731,43 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
         if is_inside_tmux() and (self._frame_count - self._last_scrollback_clear) >= 900:
             self._clear_tmux_scrollback()
             self._last_scrollback_clear = self._frame_count
+        return written
+
+    def _encode_frame(self, image: Image.Image, **params) -> memoryview:
+        """Encode an image into the reused buffer and return a view of the bytes.
+
+        Use the view as a context manager: the buffer cannot be rewound for
+        the next frame while a view is still held.
+        """
+        buf = self._encode_buf
+        buf.seek(0)
+        buf.truncate()
+        image.save(buf, **params)
+        return buf.getbuffer()
+
+    def _sixel_source_image(self) -> Image.Image:
+        """Frame as an 8-bit paletted image when it fits in 256 colours.
+
+        Most frames use far fewer than 256 distinct colours, so mapping
+        them onto their own palette is lossless. img2sixel then reuses the
+        palette instead of quantizing, and reads a third of the bytes.
+        Busier frames fall back to RGB and img2sixel's own quantizer.
+        """
+        colors = self.frame.getcolors(256)
+        if colors is None:
+            return self.frame.convert("RGB")
+
+        # Map packed RGBA pixels to palette indices with a sorted lookup;
+        # Image.quantize(palette=...) is approximate and would shift colours
+        rgba = np.array([c for _, c in colors], dtype=np.uint8)
+        keys = rgba.view(np.uint32)[:, 0]
+        order = np.argsort(keys)
+        pixels = np.frombuffer(self.frame.tobytes(), dtype=np.uint32).reshape(self.height, self.width)
+        indices = np.searchsorted(keys[order], pixels).astype(np.uint8)
+
+        image = Image.fromarray(indices, "P")
+        image.putpalette(rgba[order, :3].tobytes())
+        return image
 
     def _clear_tmux_scrollback(self) -> None:
         """Clear tmux pane scrollback buffer to free terminal memory."""
@@ -3215,21 +3776,34 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
     def force_clear(self) -> None:
         """Force a full screen clear on next frame."""
         self._first_frame = True
+        self._last_frame_bytes = None
+
+    def write_terminal(self, data: str) -> None:
+        """Write control output to the terminal, in order with displayed frames."""
+        if self._writer is not None:
+            self._writer.write(data.encode("utf-8"))
+        else:
+            sys.stdout.write(data)
+            sys.stdout.flush()
 
     def enable_focus_reporting(self) -> None:
         """Enable terminal focus reporting."""
-        sys.stdout.write("\033[?1004h")
-        sys.stdout.flush()
+        self.write_terminal("\033[?1004h")
         self._focus_reporting_enabled = True
 
     def disable_focus_reporting(self) -> None:
         """Disable terminal focus reporting."""
-        sys.stdout.write("\033[?1004l")
-        sys.stdout.flush()
+        self.write_terminal("\033[?1004l")
         self._focus_reporting_enabled = False
 
     def cleanup(self) -> None:
         """Restore terminal state."""
+        # Let queued frames reach the terminal before restoring it; from here
+        # on output goes straight to sys.stdout
+        self._async_output = False
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
         if self._focus_reporting_enabled:
             sys.stdout.write("\033[?1004l")
         sys.stdout.write("\033[2J\033[H\033[?25h")
@@ -3238,7 +3812,9 @@ class TerminalGraphicsRenderer(WorldObjectsMixin):
     def _lerp_color(self, c1: Tuple[int, int, int], c2: Tuple[int, int, int],
                     t: float) -> Tuple[int, int, int]:
         """Linear interpolate between two colors."""
-        return tuple(int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3))
+        r1, g1, b1 = c1
+        r2, g2, b2 = c2
+        return (int(r1 + (r2 - r1) * t), int(g1 + (g2 - g1) * t), int(b1 + (b2 - b1) * t))
 
     def get_screen_string(self) -> str:
         """Get a text representation (for compatibility)."""
@@ -170,10 +170,14 @@ class OutputCapture:
                 count += 1
         return count
 
+    def _all_writes(self) -> list[str]:
+        """Text writes plus binary writes decoded as latin-1."""
+        return self.writes + [w.decode("latin-1") for w in self.buffer_writes]
+
     def count_iterm2_images(self) -> int:
         """Count iTerm2 inline image sequences."""
         count = 0
-        for w in self.writes:
+        for w in self._all_writes():
             # Regular iTerm2 image
             count += len(re.findall(r"\033\]1337;File=inline=1", w))
             # Multipart start
@@ -183,7 +187,7 @@ class OutputCapture:
     def count_kitty_images(self) -> int:
         """Count Kitty graphics protocol transmissions."""
         count = 0
-        for w in self.writes:
+        for w in self._all_writes():
             # Kitty image start (a=T means transmit)
             count += len(re.findall(r"\033_Ga=T", w))
         return count
@@ -191,7 +195,7 @@ class OutputCapture:
     def extract_iterm2_dimensions(self) -> list[tuple[int, int]]:
         """Extract width/height from iTerm2 image sequences."""
         dims = []
-        for w in self.writes:
+        for w in self._all_writes():
             matches = re.findall(r"width=(\d+)px;height=(\d+)px", w)
             dims.extend((int(m[0]), int(m[1])) for m in matches)
         return dims
@@ -433,6 +437,29 @@ class TestSixelScaling:
         assert args[w_idx + 1] == "800px", f"Width should be 800px, got {args[w_idx + 1]}"
         assert args[h_idx + 1] == "400px", f"Height should be 400px, got {args[h_idx + 1]}"
 
+    def test_img2sixel_path_resolved_once(self, mock_game_state):
+        """Test img2sixel is looked up on PATH once and then run by absolute path."""
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = b"\033Pq~-\033\\"
+
+        with patch.object(TerminalGraphicsRenderer, '_get_terminal_pixel_size', return_value=(800, 400)):
+            with patch.object(TerminalGraphicsRenderer, '_get_pane_size_static', return_value=(100, 30)):
+                with patch.object(TerminalGraphicsRenderer, '_get_cell_size', return_value=(8, 16)):
+                    with patch('shutil.which', return_value='/usr/bin/img2sixel') as which:
+                        with patch('subprocess.run', return_value=mock_result) as run:
+                            with patch.object(sys, 'stdout', OutputCapture()):
+                                renderer = TerminalGraphicsRenderer(width=800, height=400)
+                                renderer.protocol = "sixel"
+                                for _ in range(3):
+                                    renderer.force_clear()
+                                    renderer.render_frame(mock_game_state)
+
+        sixel_calls = [c for c in run.call_args_list if "img2sixel" in str(c.args[0])]
+        assert len(sixel_calls) == 3
+        assert all(c.args[0][0] == '/usr/bin/img2sixel' for c in sixel_calls)
+        assert [c.args for c in which.call_args_list].count(("img2sixel",)) == 1
+
     def test_frame_saved_at_correct_size_for_sixel(self, mock_game_state):
         """Test the PNG saved for sixel is at renderer's native size."""
         with patch.object(TerminalGraphicsRenderer, '_get_terminal_pixel_size', return_value=(800, 400)):
@@ -446,43 +473,36 @@ class TestSixelScaling:
                         assert renderer.frame.width == 800
                         assert renderer.frame.height == 400
 
-    def test_png_saved_for_sixel_has_correct_dimensions(self, mock_game_state):
-        """Test the actual PNG file saved for img2sixel has correct dimensions."""
+    def test_image_piped_to_img2sixel_has_correct_dimensions(self, mock_game_state):
+        """Test the image piped to img2sixel's stdin has correct dimensions."""
+        import io
         from PIL import Image
-        import tempfile
-        import os
 
-        saved_path = None
+        piped = []
 
-        def capture_save(self_img, path, **kwargs):
-            nonlocal saved_path
-            saved_path = path
-            # Actually save the image so we can check it
-            original_save(self_img, path, **kwargs)
+        def capture_run(args, **kwargs):
+            if args and "img2sixel" in str(args[0]):
+                piped.append(bytes(kwargs["input"]))
+            return mock_result
 
         mock_result = MagicMock()
         mock_result.returncode = 0
         mock_result.stdout = b"\033Pq~-\033\\"
 
-        from PIL.Image import Image as PILImage
-        original_save = PILImage.save
-
         with patch.object(TerminalGraphicsRenderer, '_get_terminal_pixel_size', return_value=(800, 400)):
             with patch.object(TerminalGraphicsRenderer, '_get_pane_size_static', return_value=(100, 30)):
                 with patch.object(TerminalGraphicsRenderer, '_get_cell_size', return_value=(8, 16)):
                     with patch('shutil.which', return_value='/usr/bin/img2sixel'):
-                        with patch('subprocess.run', return_value=mock_result):
-                            with patch.object(PILImage, 'save', capture_save):
-                                with patch.object(sys, 'stdout', OutputCapture()):
-                                    renderer = TerminalGraphicsRenderer(width=800, height=400)
-                                    renderer.render_frame(mock_game_state)
+                        with patch('subprocess.run', side_effect=capture_run):
+                            with patch.object(sys, 'stdout', OutputCapture()):
+                                renderer = TerminalGraphicsRenderer(width=800, height=400)
+                                renderer.render_frame(mock_game_state)
 
-        # Verify the saved PNG has correct dimensions
-        assert saved_path is not None, "PNG was not saved"
-        if os.path.exists(saved_path):
-            with Image.open(saved_path) as img:
-                assert img.width == 800, f"PNG width {img.width} != renderer width 800"
-                assert img.height == 400, f"PNG height {img.height} != renderer height 400"
+        # Verify the piped image has correct dimensions
+        assert piped and piped[0], "No image data was piped to img2sixel"
+        with Image.open(io.BytesIO(piped[0])) as img:
+            assert img.width == 800, f"Image width {img.width} != renderer width 800"
+            assert img.height == 400, f"Image height {img.height} != renderer height 400"
 
 
 class TestFrameCountTracking:
@@ -8,6 +8,13 @@ from pathlib import Path
 from claude_world.renderer.sprite_loader import SpriteLoader
 from claude_world.renderer.particle_system import ParticleSystem, ParticleEmitter, EffectConfig
 from claude_world.renderer.headless import HeadlessRenderer
+from claude_world.renderer.kernels import (
+    bush_leaves,
+    dash_segments,
+    gear_spokes,
+    pool_sparkles,
+    wave_offsets,
+)
 from claude_world.types import (
     Position,
     Velocity,
@@ -205,6 +212,71 @@ class TestHeadlessRenderer:
         assert all(c == " " for c in renderer.screen[0])
 
 
+class TestKernels:
+    """Tests for the numeric animation kernels."""
+
+    def test_wave_offsets_match_scalar_math(self):
+        """Test wave offsets equal the per-row int(sin(...) * amplitude)."""
+        import math
+
+        offsets = wave_offsets(100, 400, 18, 4.2, 0.05, 6)
+        expected = [int(math.sin(4.2 + y * 0.05) * 6) for y in range(100, 400, 18)]
+        assert offsets.tolist() == expected
+
+    def test_gear_spokes_match_scalar_math(self):
+        """Test gear spoke endpoints equal the per-spoke int(cos/sin(...) * r)."""
+        import math
+
+        x1, y1, x2, y2 = gear_spokes(0.7, 50, 60, 12, 20)
+        angles = [0.7 + i * math.pi / 3 for i in range(6)]
+        assert x1.tolist() == [50 + int(math.cos(a) * 12) for a in angles]
+        assert y1.tolist() == [60 + int(math.sin(a) * 12) for a in angles]
+        assert x2.tolist() == [50 + int(math.cos(a) * 20) for a in angles]
+        assert y2.tolist() == [60 + int(math.sin(a) * 20) for a in angles]
+
+    def test_pool_sparkles_match_scalar_math(self):
+        """Test tide pool sparkles equal the per-sparkle scalar orbit math."""
+        import math
+
+        xs, ys, visible = pool_sparkles(137, 300, 200, 3)
+        phases = [(137 * 0.1 + i * 1.5) % (math.pi * 2) + i for i in range(4)]
+        assert xs.tolist() == [300 + int(math.cos(a) * 3 * 3) for a in phases]
+        assert ys.tolist() == [200 + int(math.sin(a) * 3 * 1.5) for a in phases]
+        assert visible.tolist() == [(137 + i * 7) % 20 < 12 for i in range(4)]
+
+    def test_bush_leaves_match_scalar_math(self):
+        """Test bush leaves equal the per-leaf scalar fling math."""
+        import math
+
+        xs, ys, visible = bush_leaves(211, 300, 200, 4)
+        phases = [(211 * 0.3 + i * 7) % 25 for i in range(5)]
+        assert xs.tolist() == [300 + int(math.cos(211 * 0.2 + i * 1.3) * (4 * 4 + p * 4 * 0.6))
+                               for i, p in enumerate(phases)]
+        assert ys.tolist() == [200 - 4 * 3 - int(p * 4 * 0.5) for p in phases]
+        assert visible.tolist() == [p < 18 for p in phases]
+
+    def test_dash_segments_match_scalar_loop(self):
+        """Test dash endpoints equal the running pos += segment_len loop."""
+        import math
+
+        x1, y1, dx, dy = 40, 300, 230, -170
+        distance = math.sqrt(dx * dx + dy * dy)
+        nx, ny = dx / distance, dy / distance
+        dash_offset = (distance - 87 * 3 % 20) % 20
+
+        expected = []
+        pos = dash_offset
+        while pos < distance:
+            start, end = max(0, pos), min(distance, pos + 12)
+            if end > start:
+                expected.append((int(x1 + nx * start), int(y1 + ny * start),
+                                 int(x1 + nx * end), int(y1 + ny * end)))
+            pos += 18
+
+        segments = dash_segments(x1, y1, nx, ny, distance, dash_offset, 12, 6)
+        assert list(zip(*(s.tolist() for s in segments))) == expected
+
+
 class TestRendererIntegration:
     """Integration tests for renderer with game state."""
 
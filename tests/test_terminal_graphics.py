@@ -86,6 +86,48 @@ class TestTerminalGraphicsRendererBasics:
         assert renderer.width > 0
         assert renderer.height > 0
 
+    @pytest.mark.skipif(not HAS_PIL, reason="PIL not available")
+    def test_offscreen_prop_draws_nothing(self, mock_terminal_renderer):
+        """Test a world-object prop anchored off the frame is skipped entirely."""
+        renderer = mock_terminal_renderer
+        before = renderer.frame.tobytes()
+
+        renderer._draw_bush(-1000, 150, 2, 5, active=True)
+        renderer._draw_thinking_spot(200, 1000, 2, 5, active=True)
+
+        assert renderer.frame.tobytes() == before
+        assert not renderer._prop_offscreen(200, 150, 2)
+
+    @pytest.mark.skipif(not HAS_PIL, reason="PIL not available")
+    def test_prop_animation_follows_frame_argument(self, game_state):
+        """Test animated props use the frame they are given, not the render counter."""
+        from claude_world.renderer.terminal_graphics import TerminalGraphicsRenderer
+
+        frames = []
+        for frame_count in (0, 12):
+            renderer = TerminalGraphicsRenderer(width=400, height=300)
+            renderer._display_frame = MagicMock()
+            renderer._frame_count = frame_count
+            renderer.render_frame(game_state)
+            renderer.frame.paste((0, 0, 0, 255), (0, 0, 400, 300))
+            renderer._draw_bush(200, 150, 2, 13, active=True)
+            renderer._draw_thinking_spot(100, 150, 2, 13, active=True)
+            frames.append(renderer.frame.tobytes())
+
+        assert frames[0] == frames[1]
+
+    @pytest.mark.skipif(not HAS_PIL, reason="PIL not available")
+    def test_idle_look_table_follows_schedule(self):
+        """Test the idle look-around table holds left, center, right, center."""
+        from claude_world.renderer.terminal_graphics import TerminalGraphicsRenderer
+
+        table = TerminalGraphicsRenderer._LOOK_DIR_TABLE
+        assert len(table) == 400
+        assert set(table[:60]) == {-1}
+        assert set(table[60:220]) == {0}
+        assert set(table[220:280]) == {1}
+        assert set(table[280:]) == {0}
+
 
 class TestToolCallRendering:
     """Tests for rendering during tool calls."""
@@ -361,6 +403,370 @@ class TestParticleRendering:
         mock_terminal_renderer._display_frame.assert_called()
 
 
+class TestFrameOutput:
+    """Tests for terminal output of rendered frames."""
+
+    @pytest.fixture
+    def kitty_renderer(self):
+        if not HAS_PIL:
+            pytest.skip("PIL not available")
+
+        from claude_world.renderer.terminal_graphics import TerminalGraphicsRenderer
+
+        renderer = TerminalGraphicsRenderer(width=200, height=120)
+        renderer.protocol = "kitty"
+        return renderer
+
+    def test_identical_frame_not_resent(self, kitty_renderer, game_state):
+        """Test an unchanged frame is not encoded and written again."""
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            kitty_renderer.render_frame(game_state)
+            writes = stdout.buffer.write.call_count
+            assert writes > 0
+
+            # Same pixels again - nothing should be written
+            kitty_renderer._display_frame()
+            assert stdout.buffer.write.call_count == writes
+
+    def test_force_clear_resends_frame(self, kitty_renderer, game_state):
+        """Test force_clear makes the next identical frame display again."""
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            kitty_renderer.render_frame(game_state)
+            writes = stdout.buffer.write.call_count
+
+            kitty_renderer.force_clear()
+            kitty_renderer._display_frame()
+            assert stdout.buffer.write.call_count > writes
+
+    @pytest.mark.skipif(not HAS_PIL, reason="PIL not available")
+    def test_render_scale_draws_smaller_canvas(self, game_state):
+        """Test a downsampled renderer draws at reduced size but outputs full size."""
+        from claude_world.renderer.terminal_graphics import TerminalGraphicsRenderer
+
+        renderer = TerminalGraphicsRenderer(width=800, height=400, render_scale=4)
+        renderer.protocol = "kitty"
+        renderer._cell_width, renderer._cell_height = 10, 20
+
+        assert renderer.frame.size == (200, 100)
+        assert (renderer.display_width, renderer.display_height) == (800, 400)
+
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            renderer.render_frame(game_state)
+            output = b"".join(call.args[0] for call in stdout.buffer.write.call_args_list)
+
+        assert b"c=80,r=20," in output
+
+    def test_async_output_writes_frame_from_writer_thread(self, kitty_renderer, game_state):
+        """Test frames go through the background writer, not sys.stdout."""
+        import os
+        from claude_world.renderer.display import FrameWriter
+
+        read_fd, write_fd = os.pipe()
+        try:
+            kitty_renderer._writer = FrameWriter(fd=write_fd)
+            with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+                kitty_renderer.render_frame(game_state)
+                kitty_renderer.cleanup()
+                # Only the terminal restore sequence is written directly
+                assert stdout.write.call_count == 1
+
+            os.close(write_fd)
+            write_fd = None
+            with os.fdopen(read_fd, "rb") as pipe:
+                read_fd = None
+                output = pipe.read()
+        finally:
+            for fd in (read_fd, write_fd):
+                if fd is not None:
+                    os.close(fd)
+
+        assert output.startswith(b"\033[2J\033[H")
+        assert b"\033_Ga=T,f=24," in output
+
+    def test_frame_writer_reports_drops_and_closes_when_blocked(self):
+        """Test a blocked writer reports dropped frames and close() does not hang."""
+        import os
+        import time
+        from claude_world.renderer.display import FrameWriter
+
+        read_fd, write_fd = os.pipe()
+        big = b"x" * (1 << 20)
+        writer = FrameWriter(fd=write_fd, maxsize=1)
+        try:
+            # Nobody reads the pipe, so the writer thread blocks on this frame
+            writer.submit(big)
+            deadline = time.monotonic() + 5
+            while not writer._queue.empty() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            writer.submit(b"a")
+            assert not writer.take_dropped()
+            writer.submit(b"b")
+            assert writer.take_dropped()
+            assert not writer.take_dropped()
+
+            start = time.monotonic()
+            writer.close(timeout=0.1)
+            assert time.monotonic() - start < 1
+        finally:
+            # Drain the pipe so the writer thread can finish
+            received = 0
+            while received < len(big):
+                received += len(os.read(read_fd, 1 << 16))
+            writer._thread.join(5)
+            os.close(read_fd)
+            os.close(write_fd)
+        assert not writer._thread.is_alive()
+
+    def test_frame_writer_reports_failed_write(self):
+        """Test a frame the writer thread could not write is reported as dropped."""
+        import os
+        from claude_world.renderer.display import FrameWriter
+
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        try:
+            writer = FrameWriter(fd=write_fd)
+            # The pipe has no reader, so the write fails with EPIPE
+            writer.submit(b"frame")
+            writer.close()
+        finally:
+            os.close(write_fd)
+
+        assert writer.take_dropped()
+
+    def test_frame_writer_never_drops_control_output(self):
+        """Test control output survives a full queue and stays ahead of later frames."""
+        import os
+        import threading
+        import time
+        from claude_world.renderer.display import FrameWriter
+
+        read_fd, write_fd = os.pipe()
+        big = b"x" * (1 << 20)
+        chunks = []
+
+        def drain():
+            while data := os.read(read_fd, 1 << 16):
+                chunks.append(data)
+
+        writer = FrameWriter(fd=write_fd)
+        try:
+            writer.submit(big)
+            deadline = time.monotonic() + 5
+            while not writer._queue.empty() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            writer.submit(b"<f1>")
+            writer.write(b"<clear>")
+            writer.submit(b"<f2>")
+            writer.submit(b"<f3>")
+            assert writer.take_dropped()
+
+            reader = threading.Thread(target=drain)
+            reader.start()
+            writer.close()
+            os.close(write_fd)
+            write_fd = None
+            reader.join(5)
+        finally:
+            os.close(read_fd)
+            if write_fd is not None:
+                os.close(write_fd)
+
+        assert b"".join(chunks)[len(big):] == b"<clear><f3>"
+
+    def test_async_writer_starts_after_flushing_stdout(self, game_state):
+        """Test the background writer only takes over the terminal on the first frame."""
+        from claude_world.renderer.terminal_graphics import TerminalGraphicsRenderer
+
+        renderer = TerminalGraphicsRenderer(width=200, height=120, async_output=True)
+        renderer.protocol = "kitty"
+        assert renderer._writer is None
+
+        calls = MagicMock()
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout", calls.stdout), \
+                patch("claude_world.renderer.terminal_graphics.FrameWriter", calls.FrameWriter):
+            renderer.render_frame(game_state)
+            renderer.write_terminal("\033[?1004h")
+
+        names = [name for name, _, _ in calls.mock_calls]
+        assert names[:2] == ["stdout.flush", "FrameWriter"]
+        assert "FrameWriter().submit" in names
+        calls.FrameWriter.return_value.write.assert_called_once_with(b"\033[?1004h")
+        assert not calls.stdout.write.called
+
+    def test_kitty_resends_full_frame_after_drop(self, kitty_renderer, game_state):
+        """Test a dropped queued frame makes the next frame a full transmit."""
+        import os
+        import threading
+        import time
+        from claude_world.renderer.display import FrameWriter
+
+        read_fd, write_fd = os.pipe()
+        big = b"x" * (1 << 20)
+        chunks = []
+
+        def drain():
+            while data := os.read(read_fd, 1 << 16):
+                chunks.append(data)
+
+        try:
+            writer = kitty_renderer._writer = FrameWriter(fd=write_fd)
+            # Block the writer thread on a frame nobody is reading yet
+            writer.submit(big)
+            deadline = time.monotonic() + 5
+            while not writer._queue.empty() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            with patch("claude_world.renderer.terminal_graphics.sys.stdout"):
+                kitty_renderer.render_frame(game_state)
+                kitty_renderer.frame.paste((255, 0, 255, 255), (10, 20, 14, 23))
+                kitty_renderer._display_frame()
+                # Queue is full: the first frame, with the a=T transmit, is dropped
+                kitty_renderer.frame.paste((0, 255, 255, 255), (30, 40, 34, 43))
+                kitty_renderer._display_frame()
+                # Unchanged pixels, but the terminal never saw the dropped frame
+                kitty_renderer._display_frame()
+
+                reader = threading.Thread(target=drain)
+                reader.start()
+                kitty_renderer.cleanup()
+            os.close(write_fd)
+            write_fd = None
+            reader.join(5)
+        finally:
+            for fd in (read_fd, write_fd):
+                if fd is not None:
+                    os.close(fd)
+
+        output = b"".join(chunks)[len(big):]
+        # Actions of each graphics command, skipping payload continuation chunks
+        commands = [c[:4] for c in output.split(b"\033_G")[1:] if c.startswith(b"a=")]
+        assert commands[0] == b"a=f,"
+        assert commands[-1] == b"a=T,"
+
+    def test_idle_frames_stay_opaque(self, mock_terminal_renderer, game_state):
+        """Test translucent idle sparkles are blended in, since frames go out as RGB."""
+        import numpy as np
+
+        game_state.main_agent.activity = AgentActivity.IDLE
+        for _ in range(40):
+            mock_terminal_renderer.render_frame(game_state)
+            assert np.asarray(mock_terminal_renderer.frame)[..., 3].min() == 255
+
+    def test_kitty_sends_zlib_compressed_rgb(self, kitty_renderer, game_state):
+        """Test the Kitty payload is the raw RGB frame, zlib-compressed."""
+        import base64
+        import re
+        import zlib
+
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            kitty_renderer.render_frame(game_state)
+            output = b"".join(call.args[0] for call in stdout.buffer.write.call_args_list)
+
+        width, height = kitty_renderer.frame.size
+        assert f"\033_Ga=T,f=24,s={width},v={height},o=z,".encode() in output
+        payload = b"".join(re.findall(rb"\033_G[^;]*;([^\033]*)\033\\", output))
+        assert zlib.decompress(base64.b64decode(payload)) == kitty_renderer.frame.convert("RGB").tobytes()
+
+    def test_kitty_sends_only_changed_regions(self, kitty_renderer, game_state):
+        """Test a frame with a small change is sent as in-place edits of the shown image."""
+        import base64
+        import re
+        import zlib
+        import numpy as np
+
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            kitty_renderer.render_frame(game_state)
+            stdout.buffer.write.reset_mock()
+
+            kitty_renderer.frame.paste((255, 0, 255, 255), (10, 20, 14, 23))
+            kitty_renderer._display_frame()
+            output = stdout.buffer.write.call_args.args[0]
+
+        assert b"a=T" not in output
+        edits = re.findall(rb"\033_Ga=f,r=1,i=1,q=2,f=24,x=(\d+),y=(\d+),s=(\d+),v=(\d+),o=z,m=0;([^\033]*)\033\\", output)
+        assert [tuple(int(v) for v in edit[:4]) for edit in edits] == [(10, 20, 4, 3)]
+        expected = np.asarray(kitty_renderer.frame)[20:23, 10:14, :3].tobytes()
+        assert zlib.decompress(base64.b64decode(edits[0][4])) == expected
+
+    def test_kitty_resends_full_frame_when_most_pixels_change(self, kitty_renderer, game_state):
+        """Test a mostly-changed frame is transmitted whole rather than as edits."""
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            kitty_renderer.render_frame(game_state)
+            stdout.buffer.write.reset_mock()
+
+            kitty_renderer.frame.paste((0, 0, 0, 255), (0, 0) + kitty_renderer.frame.size)
+            kitty_renderer._display_frame()
+            output = stdout.buffer.write.call_args.args[0]
+
+        assert output.startswith(b"\033[H\033_Ga=T,f=24,")
+        assert b"a=f" not in output
+
+    def test_iterm2_multipart_under_tmux_is_one_write(self, kitty_renderer, game_state):
+        """Test the tmux-wrapped iTerm2 multipart image goes out in a single write."""
+        kitty_renderer.protocol = "iterm2"
+        with patch("claude_world.renderer.terminal_graphics.is_inside_tmux", return_value=True), \
+                patch("claude_world.renderer.display.is_inside_tmux", return_value=True), \
+                patch.object(kitty_renderer, "_clear_tmux_scrollback"), \
+                patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout:
+            kitty_renderer.render_frame(game_state)
+
+        assert stdout.buffer.write.call_count == 1
+        assert stdout.write.call_count == 0
+        output = stdout.buffer.write.call_args.args[0]
+        assert output.startswith(b"\033[2J\033[H")
+        assert b"\033Ptmux;\033\033]1337;MultipartFile=inline=1;" in output
+        assert output.endswith(b"\033Ptmux;\033\033]1337;FileEnd\007\033\\")
+
+    def test_sixel_source_image_is_lossless_palette(self, kitty_renderer, game_state):
+        """Test frames with few colours are handed to img2sixel as exact 8-bit palettes."""
+        import numpy as np
+
+        kitty_renderer._display_frame = lambda: None
+        kitty_renderer.render_frame(game_state)
+
+        image = kitty_renderer._sixel_source_image()
+        assert image.mode == "P"
+        assert np.array_equal(
+            np.asarray(image.convert("RGB")), np.asarray(kitty_renderer.frame.convert("RGB"))
+        )
+
+    def test_sixel_source_image_falls_back_to_rgb(self, kitty_renderer):
+        """Test frames with more than 256 colours are left to img2sixel's quantizer."""
+        import numpy as np
+        from PIL import Image
+
+        noise = np.random.default_rng(0).integers(0, 256, (120, 200, 3), dtype=np.uint8)
+        kitty_renderer.frame.paste(Image.fromarray(noise, "RGB"))
+
+        assert kitty_renderer._sixel_source_image().mode == "RGB"
+
+    def test_failed_sixel_frame_is_retried(self, kitty_renderer, game_state):
+        """Test an unchanged frame is sent again when img2sixel failed on it."""
+        import subprocess
+
+        kitty_renderer.protocol = "sixel"
+        kitty_renderer._img2sixel_path = "img2sixel"
+        kitty_renderer._img2sixel_checked = True
+        failed = subprocess.CompletedProcess([], 1, stdout=b"", stderr=b"")
+        ok = subprocess.CompletedProcess([], 0, stdout=b"\033Pq-\033\\", stderr=b"")
+
+        with patch("claude_world.renderer.terminal_graphics.sys.stdout") as stdout, \
+                patch("claude_world.renderer.terminal_graphics.subprocess.run",
+                      side_effect=[ok, failed, ok]) as run:
+            kitty_renderer.render_frame(game_state)
+            kitty_renderer.frame.paste((255, 0, 255, 255), (10, 20, 14, 23))
+            kitty_renderer._display_frame()
+            assert stdout.buffer.write.call_count == 1
+
+            # Same pixels, but the last attempt never reached the terminal
+            kitty_renderer._display_frame()
+            assert run.call_count == 3
+            assert stdout.buffer.write.call_count == 2
+
+
 class TestAPIUsageRendering:
     """Tests for API cost tracking display."""
 
@@ -600,6 +1006,69 @@ class TestWorldObjectAnimations:
         mock_terminal_renderer._display_frame.assert_called()
 
 
+class TestClaudeCodeVerb:
+    """Tests for reading the current verb from the Claude Code pane."""
+
+    @staticmethod
+    def _fake_tmux(pane_content):
+        def run(cmd, **kwargs):
+            if "list-panes" in cmd:
+                stdout = "%1\n%2\n"
+            elif "display-message" in cmd:
+                stdout = "%2\n"
+            else:
+                stdout = pane_content
+            return MagicMock(returncode=0, stdout=stdout)
+        return run
+
+    @pytest.mark.parametrize("content,expected", [
+        ("some output\n⠋ Pondering… (esc to interrupt)\n", "Pondering"),
+        ("$ ls\n  Thought for 3s\n", "Thought"),
+        ("Loading...\nnothing here\n", None),
+    ])
+    def test_verb_extracted_from_pane(self, content, expected):
+        """Test spinner lines yield a known verb and other lines are ignored."""
+        from claude_world.renderer.terminal_graphics import TerminalGraphicsRenderer
+
+        with patch("claude_world.renderer.terminal_graphics.is_inside_tmux", return_value=True), \
+             patch("subprocess.run", side_effect=self._fake_tmux(content)):
+            assert TerminalGraphicsRenderer._get_claude_code_verb() == expected
+
+    def test_pane_list_reused_between_polls(self, mock_terminal_renderer, game_state):
+        """Test tmux panes are listed once and only the captures repeat per poll."""
+        game_state.main_agent.activity = AgentActivity.THINKING
+        game_state.main_agent.current_tool = None
+        game_state.main_agent.last_tool = None
+        run = MagicMock(side_effect=self._fake_tmux("⠋ Pondering… (esc to interrupt)\n"))
+
+        with patch("claude_world.renderer.terminal_graphics.is_inside_tmux", return_value=True), \
+             patch("subprocess.run", run):
+            for _ in range(100):
+                mock_terminal_renderer.render_frame(game_state)
+
+        commands = [c.args[0][1] for c in run.call_args_list]
+        assert commands.count("list-panes") == 1
+        assert commands.count("capture-pane") == 10
+        assert mock_terminal_renderer._cached_verb == "Pondering"
+
+    def test_verb_polling_backs_off_while_missing(self, mock_terminal_renderer, game_state):
+        """Test the pane is polled less often while no verb is found, and resets on a hit."""
+        game_state.main_agent.activity = AgentActivity.THINKING
+        game_state.main_agent.current_tool = None
+        game_state.main_agent.last_tool = None
+
+        with patch.object(mock_terminal_renderer, "_get_claude_code_verb", return_value=None) as poll:
+            for _ in range(300):
+                mock_terminal_renderer.render_frame(game_state)
+        # Polled at frames 10, 30, 70, 130, 190 and 250 instead of every 10 frames
+        assert poll.call_count == 6
+
+        with patch.object(mock_terminal_renderer, "_get_claude_code_verb", return_value="Pondering"):
+            for _ in range(60):
+                mock_terminal_renderer.render_frame(game_state)
+        assert mock_terminal_renderer._verb_poll_interval == 10
+
+
 class TestStatePersistence:
     """Tests for state copy and persistence."""
 